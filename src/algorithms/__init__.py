@@ -12,14 +12,52 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-# Importación de módulos o clases
-from .algorithm import Algorithm
-from .epsilon_greedy import EpsilonGreedy
-from .gradiente_preferencias import GradientePreferencias
-from .softmax import Softmax
-from .ucb1 import UCB1
-from .ucb2 import UCB2
+import importlib
+from typing import TYPE_CHECKING
+
+# Importación de módulos o clases. Se difiere hasta el primer uso de cada nombre (PEP 562) para que
+# importar el paquete no cargue los módulos que no se van a usar
+_LAZY_IMPORTS = {
+    'Algorithm': '.algorithm',
+    'EpsilonGreedy': '.epsilon_greedy',
+    'GradientePreferencias': '.gradiente_preferencias',
+    'Softmax': '.softmax',
+    'UCB1': '.ucb1',
+    'UCB2': '.ucb2',
+    'DiscountedUCB': '.discounted_ucb',
+    'SlidingWindowUCB': '.sliding_window_ucb',
+    'ThompsonSampling': '.thompson_sampling',
+    'BatchedAlgorithm': '.batched',
+    'make_batched': '.batched',
+    'expand_sweep': '.batched',
+    'sweep_size': '.batched',
+    'ShardedLearner': '.sharded',
+}
+
+if TYPE_CHECKING:
+    from .algorithm import Algorithm
+    from .epsilon_greedy import EpsilonGreedy
+    from .gradiente_preferencias import GradientePreferencias
+    from .softmax import Softmax
+    from .ucb1 import UCB1
+    from .ucb2 import UCB2
+    from .discounted_ucb import DiscountedUCB
+    from .sliding_window_ucb import SlidingWindowUCB
+    from .thompson_sampling import ThompsonSampling
+    from .batched import BatchedAlgorithm, make_batched, expand_sweep, sweep_size
+    from .sharded import ShardedLearner
 
 # Lista de módulos o clases públicas
-__all__ = ['Algorithm', 'EpsilonGreedy', 'GradientePreferencias', 'Softmax', 'UCB1', 'UCB2']
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -13,14 +13,33 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
 
+import os
+import tempfile
 from abc import ABC, abstractmethod
 import numpy as np
 
+from algorithms.random_buffer import RandomBuffer
+
+# Mensaje de los assert de las llamadas escalares sobre un algoritmo con hiperparámetros vectoriales
+SWEEP_ERROR = "Un algoritmo con hiperparámetros vectoriales (barrido) sólo se puede simular con run_experiment."
+
 class Algorithm(ABC):
-    def __init__(self, k: int):
+
+    # Versión del formato de las instantáneas de save_state
+    STATE_VERSION: int = 1
+    # Atributos que se guardan en las instantáneas; las subclases añaden los suyos
+    STATE_FIELDS = ('counts', 'values')
+    # Estadísticos que combina update_aggregated y que ShardedLearner copia del algoritmo compartido a
+    # cada hilo tras un volcado; el resto del estado (épocas, pesos de descuento...) es local de cada copia
+    MERGE_FIELDS = ('counts', 'values')
+    # Hiperparámetros que admiten un vector de valores (barrido) en run_experiment
+    SWEEP_PARAMS = ()
+
+    def __init__(self, k: int, rng=None):
         """
         Inicializa el algoritmo con k brazos.
         :param k: Número de brazos.
+        :param rng: Generador de números aleatorios (np.random.Generator). Si es None se usa el generador global de numpy.
         """
         # Número de brazos
         self.k: int = k
@@ -28,6 +47,8 @@ class Algorithm(ABC):
         self.counts: np.ndarray = np.zeros(k, dtype=int)
         # Recompensa promedio estimada de cada brazo
         self.values: np.ndarray = np.zeros(k, dtype=float)
+        # Extracciones aleatorias servidas por bloques desde el generador
+        self.random_buffer = RandomBuffer(rng)
 
     @abstractmethod
     def select_arm(self) -> int:
@@ -53,9 +74,123 @@ class Algorithm(ABC):
 
         self.values[chosen_arm] = value + (reward - value) / n
 
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con el estado actual, sin recibir recompensas entre medias (un microlote de peticiones).
+        Las subclases lo sobrescriben para calcular la política una sola vez por lote.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        return np.array([self.select_arm() for _ in range(n)], dtype=int)
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Actualiza el algoritmo con un lote de recompensas, agregándolas por brazo.
+        :param chosen_arms: Índices de los brazos tirados.
+        :param rewards: Recompensa obtenida en cada tirada.
+        """
+        chosen_arms = np.asarray(chosen_arms, dtype=int)
+        counts = np.bincount(chosen_arms, minlength=self.k)
+        sums = np.bincount(chosen_arms, weights=np.asarray(rewards, dtype=float), minlength=self.k)
+        self.update_aggregated(counts, sums)
+
+    def update_aggregated(self, counts: np.ndarray, sums: np.ndarray):
+        """
+        Actualiza las recompensas promedio con el número de tiradas y la suma de recompensas de cada brazo.
+        Equivale a llamar a `update` una vez por tirada (salvo redondeo).
+        :param counts: Número de tiradas nuevas de cada brazo, de forma (k,).
+        :param sums: Suma de las recompensas nuevas de cada brazo, de forma (k,).
+        """
+        pulled = counts > 0
+        self.counts[pulled] += counts[pulled]
+
+        n = self.counts[pulled]
+        value = self.values[pulled]
+
+        # value = value + (suma - c * value) / n, que con c = 1 es la actualización incremental de update
+        self.values[pulled] = value + (sums[pulled] - counts[pulled] * value) / n
+
+    def save_state(self, path: str):
+        """
+        Guarda el estado del algoritmo en un fichero .npy con un único registro estructurado.
+
+        El registro contiene la versión del formato, el nombre de la clase, k y los atributos de
+        STATE_FIELDS, por lo que se puede abrir sin copiarlo con np.load(path, mmap_mode='r'). Los campos
+        se escriben uno tras otro sin montar el registro en memoria, en un fichero temporal del mismo
+        directorio que después se renombra sobre path: un lector nunca ve una instantánea a medias y, si
+        la escritura falla, la instantánea anterior queda intacta.
+        :param path: Ruta del fichero.
+        """
+        header = [np.array(self.STATE_VERSION, dtype='<u2'), np.array(type(self).__name__, dtype='S32'),
+                  np.array(self.k, dtype='<i8')]
+        # None (por ejemplo, UCB2.current_arm antes de la primera época) se guarda como -1
+        fields = [np.asarray(-1 if value is None else value, order='C')
+                  for value in (getattr(self, name) for name in self.STATE_FIELDS)]
+
+        names = ('version', 'algorithm', 'k') + self.STATE_FIELDS
+        dtype = np.dtype([(name, value.dtype, value.shape) for name, value in zip(names, header + fields)])
+
+        fd, staging = tempfile.mkstemp(prefix='.tmp-', suffix='.npy', dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.lib.format.write_array_header_1_0(file, {'descr': np.lib.format.dtype_to_descr(dtype),
+                                                             'fortran_order': False, 'shape': (1,)})
+                for value in header + fields:
+                    file.write(value.data)
+            os.replace(staging, path)
+        except BaseException:
+            os.unlink(staging)
+            raise
+
+    def load_state(self, path: str):
+        """
+        Restaura el estado guardado con save_state.
+        :param path: Ruta del fichero.
+        :raises ValueError: Si la instantánea es de otra versión, de otro algoritmo o de otro número de brazos.
+        """
+        snapshot = np.load(path, mmap_mode='r')[0]
+
+        if snapshot['version'] != self.STATE_VERSION:
+            raise ValueError(f"Versión de instantánea {snapshot['version']} no soportada (se esperaba {self.STATE_VERSION}).")
+        if snapshot['algorithm'].decode() != type(self).__name__:
+            raise ValueError(f"La instantánea es de {snapshot['algorithm'].decode()}, no de {type(self).__name__}.")
+        if snapshot['k'] != self.k:
+            raise ValueError(f"La instantánea tiene {snapshot['k']} brazos y el algoritmo {self.k}.")
+
+        for name in self.STATE_FIELDS:
+            value = snapshot[name]
+            # Los escalares se restauran como escalares de Python y los vectores como copias escribibles
+            setattr(self, name, value.item() if value.ndim == 0 else np.array(value))
+
+        self._state_loaded()
+
+    def _scalar(self) -> bool:
+        """
+        Indica si todos los hiperparámetros de SWEEP_PARAMS son escalares. Los métodos que los usan lo
+        comprueban con un assert, porque un barrido sólo tiene sentido en las versiones vectorizadas.
+        """
+        return all(np.ndim(getattr(self, name)) == 0 for name in self.SWEEP_PARAMS)
+
+    def _rebuild_index(self, changed: int, capacity: int) -> bool:
+        """
+        Indica si, tras cambiar `changed` brazos, conviene reconstruir la estructura indexada (árbol
+        de `capacity` hojas) en lugar de actualizar cada brazo. Si cambian muchos brazos es más
+        barato reconstruirla en O(k) que recorrer cada camino de O(log k).
+        """
+        return changed * capacity.bit_length() > self.k
+
+    def _state_loaded(self):
+        """
+        Se llama tras load_state para reconstruir el estado derivado (por ejemplo, los árboles de los modos indexados).
+        """
+        pass
+
     def reset(self):
         """
         Reinicia el estado del algoritmo (opcional).
         """
         self.counts = np.zeros(self.k, dtype=int)
         self.values = np.zeros(self.k, dtype=float)
+        # Los uniformes pendientes no sobreviven al reinicio, para que tras np.random.seed y reset se
+        # repita la misma secuencia
+        self.random_buffer.clear()
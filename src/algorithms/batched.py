@@ -0,0 +1,504 @@
+"""
+Module: algorithms/batched.py
+Description: Versiones vectorizadas de los algoritmos que avanzan todas las ejecuciones de un experimento a la vez.
+
+Cada clase mantiene el estado de `runs` ejecuciones independientes en matrices de forma (runs, k),
+de modo que un paso de tiempo de todas las ejecuciones se resuelve con operaciones de NumPy.
+
+Si un hiperparámetro del algoritmo es un vector (por ejemplo, EpsilonGreedy(k, epsilon=np.linspace(0, 0.3, 64)))
+cada uno de sus valores es una configuración de un barrido: las C configuraciones se apilan como
+C bloques consecutivos de `runs` filas y avanzan juntas, con el hiperparámetro expandido por fila.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import copy
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from algorithms.algorithm import Algorithm
+from algorithms.discounted_ucb import RESCALE_WEIGHT, DiscountedUCB
+from algorithms.epsilon_greedy import EpsilonGreedy
+from algorithms.gradiente_preferencias import GradientePreferencias
+from algorithms.sliding_window_ucb import SlidingWindowUCB
+from algorithms.softmax import Softmax
+from algorithms.thompson_sampling import ThompsonSampling, posterior_mean, sample_posterior, update_posterior
+from algorithms.ucb1 import UCB1
+from algorithms.ucb2 import UCB2
+
+
+class BatchedAlgorithm(ABC):
+
+    # Número de uniformes por ejecución que consume cada llamada a select_arms
+    n_uniforms: int = 0
+    # Hiperparámetros que admiten un vector de valores (barrido)
+    sweep_params: Tuple[str, ...] = ()
+
+    def __init__(self, algo: Algorithm, runs: int, rng: np.random.Generator):
+        """
+        Inicializa la versión vectorizada de un algoritmo.
+
+        :param algo: Algoritmo del que se toman k y los hiperparámetros.
+        :param runs: Número de ejecuciones independientes de cada configuración que se avanzan a la vez.
+        :param rng: Generador de números aleatorios de la política.
+        """
+        assert runs > 0, "El número de ejecuciones debe ser mayor que 0."
+
+        self.algo = algo
+        self.k: int = algo.k
+        # Cada configuración del barrido ocupa `runs_per_configuration` filas consecutivas
+        self.configurations: int = sweep_size(algo)
+        self.runs_per_configuration: int = runs
+        self.runs: int = runs * self.configurations
+        self.rng = rng
+        for name in self.sweep_params:
+            setattr(self, name, _expand_param(getattr(algo, name), runs))
+        # Índices de fila para indexar (ejecución, brazo) de una sola vez
+        self.rows = np.arange(self.runs)
+        self.reset()
+
+    def reset(self):
+        """
+        Reinicia el estado de todas las ejecuciones.
+        """
+        self.counts = np.zeros((self.runs, self.k), dtype=int)
+        self.values = np.zeros((self.runs, self.k), dtype=float)
+
+    def select_arms(self) -> np.ndarray:
+        """
+        Selecciona un brazo en cada ejecución.
+        :return: Vector de forma (runs,) con el brazo elegido en cada ejecución.
+        """
+        u = self.rng.random((self.n_uniforms, self.runs)) if self.n_uniforms else None
+        return self._select(u)
+
+    @abstractmethod
+    def _select(self, u: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Aplica la política a todas las ejecuciones.
+        :param u: Uniformes de forma (n_uniforms, runs) o None si la política es determinista.
+        :return: Vector de forma (runs,) con el brazo elegido en cada ejecución.
+        """
+        raise NotImplementedError("Este método debe ser implementado por la subclase.")
+
+    def update(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Actualiza las recompensas promedio estimadas del brazo elegido en cada ejecución.
+        :param chosen_arms: Brazo elegido en cada ejecución.
+        :param rewards: Recompensa obtenida en cada ejecución.
+        """
+        # Índices planos (fila * k + brazo): más rápidos que el indexado por pares de filas y columnas
+        cells = self.rows * self.k + chosen_arms
+        counts = self.counts.reshape(-1)
+        values = self.values.reshape(-1)
+
+        counts[cells] += 1
+        value = values[cells]
+        values[cells] = value + (rewards - value) / counts[cells]
+
+
+def _expand_param(value, runs: int):
+    """
+    Devuelve un hiperparámetro escalar tal cual o, si es un vector, con cada valor repetido en las `runs` filas de su configuración.
+    """
+    if np.ndim(value) == 0:
+        return value
+    return np.repeat(np.asarray(value, dtype=float), runs)
+
+
+def _sample_categorical(weights: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """
+    Muestrea un índice por fila proporcional a `weights` usando un uniforme por fila.
+
+    Se compara contra la suma acumulada sin normalizar, de modo que no hace falta dividir todos los pesos.
+    """
+    cdf = np.cumsum(weights, axis=1)
+    target = u * cdf[:, -1]
+    chosen = np.sum(cdf <= target[:, None], axis=1)
+    return np.minimum(chosen, weights.shape[1] - 1)
+
+
+class BatchedEpsilonGreedy(BatchedAlgorithm):
+
+    n_uniforms = 2
+    sweep_params = EpsilonGreedy.SWEEP_PARAMS
+
+    def _select(self, u: np.ndarray) -> np.ndarray:
+        # Exploración: brazo uniforme a partir del segundo uniforme
+        explore = u[0] < self.epsilon
+        random_arms = (u[1] * self.k).astype(int)
+        greedy_arms = np.argmax(self.values, axis=1)
+        return np.where(explore, random_arms, greedy_arms)
+
+
+class BatchedSoftmax(BatchedAlgorithm):
+
+    n_uniforms = 1
+    sweep_params = Softmax.SWEEP_PARAMS
+
+    def _select(self, u: np.ndarray) -> np.ndarray:
+        # Se resta el máximo de cada fila para evitar overflow; la distribución no cambia
+        z = self.values / (self.tau[:, None] if np.ndim(self.tau) else self.tau)
+        weights = np.exp(z - np.max(z, axis=1, keepdims=True))
+        return _sample_categorical(weights, u[0])
+
+
+class BatchedUCB1(BatchedAlgorithm):
+
+    def reset(self):
+        super().reset()
+        # Todas las ejecuciones avanzan a la vez, por lo que t es común
+        self.total_counts = 0
+
+    def _select(self, u: Optional[np.ndarray]) -> np.ndarray:
+        self.total_counts += 1
+
+        # Si en una ejecución queda algún brazo sin probar, se elige el primero de ellos
+        unpulled = self.counts == 0
+        has_unpulled = unpulled.any(axis=1)
+        if has_unpulled.all():
+            return np.argmax(unpulled, axis=1)
+
+        with np.errstate(divide='ignore'):
+            ucb_values = self.values + np.sqrt((2 * np.log(self.total_counts)) / self.counts)
+
+        chosen = np.argmax(ucb_values, axis=1)
+        return np.where(has_unpulled, np.argmax(unpulled, axis=1), chosen)
+
+
+class BatchedDiscountedUCB(BatchedUCB1):
+
+    sweep_params = DiscountedUCB.SWEEP_PARAMS
+
+    def reset(self):
+        super().reset()
+        self.discounted_counts = np.zeros((self.runs, self.k), dtype=float)
+        self.discounted_total = np.zeros(self.runs)
+        # Con un barrido de gamma cada fila tiene su propio peso
+        self.weight = np.ones(self.runs)
+
+    def _select(self, u: Optional[np.ndarray]) -> np.ndarray:
+        self.total_counts += 1
+        self.weight /= self.gamma
+        rescale = np.flatnonzero(self.weight > RESCALE_WEIGHT)
+        if rescale.size:
+            self.discounted_counts[rescale] /= self.weight[rescale, None]
+            self.discounted_total[rescale] /= self.weight[rescale]
+            self.weight[rescale] = 1.0
+
+        unpulled = self.counts == 0
+        has_unpulled = unpulled.any(axis=1)
+        if has_unpulled.all():
+            return np.argmax(unpulled, axis=1)
+
+        total = np.maximum(self.discounted_total / self.weight, 1.0)
+        counts = self.discounted_counts / self.weight[:, None]
+        # Un brazo cuyo contador descontado se ha anulado tiene bonus infinito
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ucb_values = np.where(counts > 0, self.values + np.sqrt((2 * np.log(total))[:, None] / counts), np.inf)
+
+        chosen = np.argmax(ucb_values, axis=1)
+        return np.where(has_unpulled, np.argmax(unpulled, axis=1), chosen)
+
+    def update(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        cells = self.rows * self.k + chosen_arms
+        counts = self.counts.reshape(-1)
+        discounted_counts = self.discounted_counts.reshape(-1)
+        values = self.values.reshape(-1)
+
+        counts[cells] += 1
+        discounted_counts[cells] += self.weight
+        self.discounted_total += self.weight
+        value = values[cells]
+        values[cells] = value + self.weight * (rewards - value) / discounted_counts[cells]
+
+
+class BatchedSlidingWindowUCB(BatchedUCB1):
+
+    sweep_params = SlidingWindowUCB.SWEEP_PARAMS
+
+    def reset(self):
+        super().reset()
+        # Con un barrido de la ventana cada fila usa las primeras `window` posiciones de su buffer
+        self.window = np.asarray(self.window).astype(int)
+        size = int(np.max(self.window))
+        self.window_arms = np.zeros((self.runs, size), dtype=int)
+        self.window_rewards = np.zeros((self.runs, size))
+        self.window_sums = np.zeros((self.runs, self.k))
+        # Tiradas de cada ejecución (todas avanzan a la vez) y desde el último recálculo exacto
+        self.pushes = 0
+        self.pushes_since_recompute = 0
+
+    def _select(self, u: Optional[np.ndarray]) -> np.ndarray:
+        self.total_counts += 1
+
+        unpulled = self.counts == 0
+        has_unpulled = unpulled.any(axis=1)
+        if has_unpulled.all():
+            return np.argmax(unpulled, axis=1)
+
+        horizon = np.minimum(self.total_counts, self.window)
+        with np.errstate(divide='ignore'):
+            ucb_values = self.values + np.sqrt((2 * np.log(horizon)) / self.counts.T).T
+
+        chosen = np.argmax(ucb_values, axis=1)
+        return np.where(has_unpulled, np.argmax(unpulled, axis=1), chosen)
+
+    def _refresh(self, cells: np.ndarray):
+        counts = self.counts.reshape(-1)[cells]
+        self.values.reshape(-1)[cells] = np.where(counts > 0, self.window_sums.reshape(-1)[cells] / np.maximum(counts, 1), 0.0)
+
+    def update(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        counts = self.counts.reshape(-1)
+        sums = self.window_sums.reshape(-1)
+        positions = self.pushes % self.window
+
+        # Las ejecuciones con la ventana llena descartan la tirada más antigua, que ocupa la posición de la nueva
+        full = np.flatnonzero(np.broadcast_to(self.pushes >= self.window, (self.runs,)))
+        if full.size:
+            old_positions = positions[full] if np.ndim(positions) else positions
+            old_cells = full * self.k + self.window_arms[full, old_positions]
+            counts[old_cells] -= 1
+            sums[old_cells] -= self.window_rewards[full, old_positions]
+            self._refresh(old_cells)
+
+        self.window_arms[self.rows, positions] = chosen_arms
+        self.window_rewards[self.rows, positions] = rewards
+        cells = self.rows * self.k + chosen_arms
+        counts[cells] += 1
+        sums[cells] += rewards
+        self._refresh(cells)
+
+        self.pushes += 1
+        self.pushes_since_recompute += 1
+        if self.pushes_since_recompute >= np.max(self.window):
+            self._recompute()
+
+    def _recompute(self):
+        """
+        Recalcula los contadores, las sumas y las medias de todas las ejecuciones desde sus buffers.
+        """
+        filled = np.arange(self.window_arms.shape[1]) < np.asarray(np.minimum(self.pushes, self.window))[..., None]
+        filled = np.broadcast_to(filled, self.window_arms.shape)
+        cells = (self.rows[:, None] * self.k + self.window_arms)[filled]
+        n_cells = self.runs * self.k
+        self.counts = np.bincount(cells, minlength=n_cells).reshape(self.runs, self.k)
+        self.window_sums = np.bincount(cells, weights=self.window_rewards[filled], minlength=n_cells).reshape(self.runs, self.k)
+        self._refresh(np.arange(n_cells))
+        self.pushes_since_recompute = 0
+
+
+class BatchedUCB2(BatchedAlgorithm):
+
+    sweep_params = UCB2.SWEEP_PARAMS
+
+    def reset(self):
+        super().reset()
+        self.total_counts = 0
+        self.epoch_counts = np.zeros((self.runs, self.k), dtype=int)
+        self.remaining_pulls = np.zeros(self.runs, dtype=int)
+        self.current_arm = np.zeros(self.runs, dtype=int)
+
+    def _select(self, u: Optional[np.ndarray]) -> np.ndarray:
+        self.total_counts += 1
+
+        unpulled = self.counts == 0
+        has_unpulled = unpulled.any(axis=1)
+        chosen = np.argmax(unpulled, axis=1)
+
+        # Ejecuciones que siguen repitiendo el brazo de su época actual
+        repeat = ~has_unpulled & (self.remaining_pulls > 0)
+        chosen[repeat] = self.current_arm[repeat]
+        self.remaining_pulls[repeat] -= 1
+
+        # Ejecuciones que empiezan una nueva época
+        decide = np.flatnonzero(~has_unpulled & (self.remaining_pulls == 0) & ~repeat)
+        if decide.size:
+            counts = self.counts[decide]
+            alpha = self.alpha[decide, None] if np.ndim(self.alpha) else self.alpha
+            ucb_values = self.values[decide] + np.sqrt(
+                ((1 + alpha) * np.log(self.total_counts / counts)) / (2 * counts))
+            new_arms = np.argmax(ucb_values, axis=1)
+
+            tau = self.epoch_counts[decide, new_arms]
+            tau = np.where(tau == 0, 1, tau)
+
+            self.epoch_counts[decide] = counts
+            self.current_arm[decide] = new_arms
+            self.remaining_pulls[decide] = tau - 1
+            chosen[decide] = new_arms
+
+        return chosen
+
+
+class BatchedGradientePreferencias(BatchedAlgorithm):
+
+    n_uniforms = 1
+    sweep_params = GradientePreferencias.SWEEP_PARAMS
+
+    def __init__(self, algo: GradientePreferencias, runs: int, rng: np.random.Generator):
+        self.initial_preference = algo.initial_preference
+        super().__init__(algo, runs, rng)
+
+    def reset(self):
+        super().reset()
+        self.values = np.full((self.runs, self.k), self.initial_preference, dtype=float)
+        self.probabilities = np.full((self.runs, self.k), 1 / self.k)
+        self.average_reward = np.zeros(self.runs)
+        self.total_reward = np.zeros(self.runs)
+        self.total_counts = 0
+
+    def _select(self, u: np.ndarray) -> np.ndarray:
+        exp_preferences = np.exp(self.values - np.max(self.values, axis=1, keepdims=True))
+        # La suma acumulada sirve a la vez para normalizar y para muestrear
+        cdf = np.cumsum(exp_preferences, axis=1)
+        self.probabilities = exp_preferences / cdf[:, -1:]
+        chosen = np.sum(cdf <= (u[0] * cdf[:, -1])[:, None], axis=1)
+        return np.minimum(chosen, self.k - 1)
+
+    def update(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        self.total_counts += 1
+        self.counts[self.rows, chosen_arms] += 1
+
+        self.total_reward += rewards
+        self.average_reward = self.total_reward / self.total_counts
+        reward_error = rewards - self.average_reward
+
+        # H(a) -= α(R - R̄)π(a) para todos los brazos y se compensa el elegido con +α(R - R̄)
+        step = self.alpha * reward_error
+        self.values -= step[:, None] * self.probabilities
+        self.values[self.rows, chosen_arms] += step
+
+
+class BatchedThompsonSampling(BatchedAlgorithm):
+
+    sweep_params = ThompsonSampling.SWEEP_PARAMS
+
+    def __init__(self, algo: ThompsonSampling, runs: int, rng: np.random.Generator):
+        self.family = algo.family
+        self.trials = algo.trials
+        super().__init__(algo, runs, rng)
+
+    def _prior(self, value) -> np.ndarray:
+        """
+        Devuelve la matriz (runs, k) de un parámetro a priori escalar o con un valor por fila (barrido).
+        """
+        column = value if np.ndim(value) == 0 else np.asarray(value)[:, None]
+        return np.array(np.broadcast_to(column, (self.runs, self.k)), dtype=float)
+
+    def reset(self):
+        super().reset()
+        self.alpha = self._prior(self.prior_alpha)
+        self.beta = self._prior(self.prior_beta)
+        self.mean = self._prior(self.prior_mean)
+        self.kappa = self._prior(self.prior_kappa)
+        self.values = posterior_mean(self.family, self.trials, self.alpha, self.beta, self.mean)
+
+    def _select(self, u: Optional[np.ndarray]) -> np.ndarray:
+        samples = sample_posterior(self.family, self.trials, self.alpha, self.beta, self.mean, self.kappa, self.rng)
+        return np.argmax(samples, axis=1)
+
+    def update(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        cells = self.rows * self.k + chosen_arms
+        alpha, beta, mean, kappa = (matrix.reshape(-1) for matrix in (self.alpha, self.beta, self.mean, self.kappa))
+
+        alpha[cells], beta[cells], mean[cells], kappa[cells] = update_posterior(
+            self.family, self.trials, alpha[cells], beta[cells], mean[cells], kappa[cells], 1, rewards, rewards * rewards)
+        self.counts.reshape(-1)[cells] += 1
+        self.values.reshape(-1)[cells] = posterior_mean(self.family, self.trials, alpha[cells], beta[cells], mean[cells])
+
+
+# Correspondencia entre cada algoritmo y su versión vectorizada
+BATCHED_ALGORITHMS = {
+    EpsilonGreedy: BatchedEpsilonGreedy,
+    Softmax: BatchedSoftmax,
+    UCB1: BatchedUCB1,
+    DiscountedUCB: BatchedDiscountedUCB,
+    SlidingWindowUCB: BatchedSlidingWindowUCB,
+    UCB2: BatchedUCB2,
+    GradientePreferencias: BatchedGradientePreferencias,
+    ThompsonSampling: BatchedThompsonSampling,
+}
+
+
+def _batched_class(algo: Algorithm) -> type:
+    for cls in type(algo).__mro__:
+        if cls in BATCHED_ALGORITHMS:
+            return BATCHED_ALGORITHMS[cls]
+    raise ValueError(f"El algoritmo {type(algo).__name__} no tiene versión vectorizada.")
+
+
+def make_batched(algo: Algorithm, runs: int, rng: np.random.Generator) -> BatchedAlgorithm:
+    """
+    Construye la versión vectorizada de un algoritmo.
+
+    :param algo: Instancia del algoritmo.
+    :param runs: Número de ejecuciones que se avanzan a la vez (por configuración, si es un barrido).
+    :param rng: Generador de números aleatorios de la política.
+    :return: Instancia de BatchedAlgorithm equivalente.
+    :raises ValueError: Si el algoritmo no tiene versión vectorizada.
+    """
+    return _batched_class(algo)(algo, runs, rng)
+
+
+def sweep_size(algo: Algorithm) -> int:
+    """
+    Devuelve el número de configuraciones de un algoritmo: la longitud de sus hiperparámetros vectoriales o 1.
+
+    :raises ValueError: Si dos hiperparámetros vectoriales tienen longitudes distintas.
+    """
+    sizes = {np.size(getattr(algo, name)) for name in _batched_class(algo).sweep_params
+             if np.ndim(getattr(algo, name)) > 0}
+    if len(sizes) > 1:
+        raise ValueError(f"Los hiperparámetros vectoriales de {type(algo).__name__} deben tener la misma longitud.")
+    return sizes.pop() if sizes else 1
+
+
+def expand_sweep(algorithms: List[Algorithm]) -> List[Algorithm]:
+    """
+    Devuelve un algoritmo por cada fila de los resultados de run_experiment: los que tienen
+    hiperparámetros vectoriales se sustituyen por una copia con cada valor escalar, en orden.
+    Sirve, por ejemplo, para las etiquetas de las gráficas.
+
+    :param algorithms: Lista de algoritmos, con o sin barridos.
+    :return: Lista de algoritmos con hiperparámetros escalares.
+    """
+    expanded = []
+    for algo in algorithms:
+        names = [name for name in _batched_class(algo).sweep_params if np.ndim(getattr(algo, name)) > 0]
+        if not names:
+            expanded.append(algo)
+            continue
+        for c in range(sweep_size(algo)):
+            configuration = copy.copy(algo)
+            for name in names:
+                setattr(configuration, name, np.asarray(getattr(algo, name))[c].item())
+            expanded.append(configuration)
+    return expanded
+
+
+def select_configurations(algo: Algorithm, configurations: np.ndarray) -> Algorithm:
+    """
+    Devuelve una copia del algoritmo que sólo barre las configuraciones indicadas (en ese orden).
+    Un algoritmo sin barrido se devuelve tal cual.
+
+    :param algo: Algoritmo, con o sin barrido.
+    :param configurations: Índices de las configuraciones que se conservan.
+    :return: Algoritmo con los hiperparámetros vectoriales restringidos a esas configuraciones.
+    """
+    names = [name for name in _batched_class(algo).sweep_params if np.ndim(getattr(algo, name)) > 0]
+    if not names:
+        return algo
+    selected = copy.copy(algo)
+    for name in names:
+        setattr(selected, name, np.asarray(getattr(algo, name))[configurations])
+    return selected
@@ -0,0 +1,148 @@
+"""
+Module: algorithms/discounted_ucb.py
+Description: Implementación del algoritmo Discounted UCB (Garivier y Moulines, 2011) para problemas de k-brazos no estacionarios.
+
+Cada recompensa pesa gamma^(t - s), siendo s el paso en que se obtuvo, de modo que las antiguas se
+olvidan poco a poco. En lugar de multiplicar todos los contadores por gamma en cada paso (O(k)),
+las recompensas nuevas se suman con peso gamma^-t y los contadores se leen divididos por ese peso.
+Cuando el peso se hace muy grande se reescalan todos los contadores, lo que ocurre una vez cada
+muchos pasos: la actualización cuesta O(1) amortizado y la memoria es O(k) para cualquier horizonte.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+from algorithms.algorithm import SWEEP_ERROR
+from algorithms.ucb1 import UCB1
+
+# Peso a partir del cual se reescalan los contadores descontados para que no desborden
+RESCALE_WEIGHT = 1e100
+
+
+class DiscountedUCB(UCB1):
+
+    STATE_FIELDS = UCB1.STATE_FIELDS + ('discounted_counts', 'discounted_total', 'weight')
+    # El algoritmo compartido no avanza t al combinar y su peso no cambia: las medias descontadas, sus
+    # contadores y el peso son locales de cada copia
+    MERGE_FIELDS = ('counts', 'total_counts')
+    SWEEP_PARAMS = ('gamma',)
+
+    def __init__(self, k: int, gamma: float = 0.99, rng=None):
+        """
+        Inicializa el algoritmo Discounted UCB.
+
+        :param k: Número de brazos.
+        :param gamma: Factor de descuento en (0, 1]: cuanto menor, antes se olvidan las recompensas
+                      (con 1 equivale a UCB1). Puede ser un vector de valores para evaluarlos todos a
+                      la vez en run_experiment (barrido).
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        """
+        assert np.all((np.asarray(gamma) > 0) & (np.asarray(gamma) <= 1)), "El factor de descuento gamma debe estar en (0, 1]."
+
+        super().__init__(k, rng)
+        self.gamma = gamma
+        self._reset_discount()
+
+    def _reset_discount(self):
+        # Número descontado de selecciones de cada brazo y su suma, multiplicados por `weight`
+        self.discounted_counts = np.zeros(self.k, dtype=float)
+        self.discounted_total = 0.0
+        # Peso de una recompensa del paso actual (gamma^-t desde el último reescalado)
+        self.weight = 1.0
+
+    def _advance(self, n: int):
+        """
+        Avanza t en n pasos y reescala los contadores si el peso de las recompensas nuevas es muy grande.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        self.total_counts += n
+        if self.gamma == 1:
+            return
+
+        # Se avanza en tramos con gamma^-m <= RESCALE_WEIGHT, para que gamma^n no se anule con n grande
+        chunk = max(1, int(np.log(RESCALE_WEIGHT) / -np.log(self.gamma)))
+        while n > 0:
+            m = min(n, chunk)
+            n -= m
+            self.weight /= self.gamma ** m
+            if self.weight > RESCALE_WEIGHT:
+                self.discounted_counts /= self.weight
+                self.discounted_total /= self.weight
+                self.weight = 1.0
+
+    def _ucb_values(self) -> np.ndarray:
+        """
+        Calcula la media descontada más el bonus de exploración de cada brazo. Un brazo cuyo contador
+        descontado se ha anulado tiene bonus infinito.
+        """
+        counts = self.discounted_counts / self.weight
+        total = max(self.discounted_total / self.weight, 1.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(counts > 0, self.values + np.sqrt((2 * np.log(total)) / counts), np.inf)
+
+    def select_arm(self) -> int:
+        """
+        Selecciona un brazo basado en la política Discounted UCB.
+        :return: índice del brazo seleccionado.
+        """
+        self._advance(1)
+
+        # Si no se ha seleccionado un brazo, seleccionamos cada brazo una vez
+        if 0 in self.counts:
+            return np.argmin(self.counts)
+
+        return np.argmax(self._ucb_values())
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con la política Discounted UCB avanzando t en n pasos.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        self._advance(n)
+
+        unpulled = np.flatnonzero(self.counts == 0)
+        if unpulled.size:
+            return np.resize(unpulled, n)
+
+        return np.full(n, np.argmax(self._ucb_values()), dtype=int)
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Actualiza la media descontada del brazo elegido en O(1).
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        self.counts[chosen_arm] += 1
+        self.discounted_counts[chosen_arm] += self.weight
+        self.discounted_total += self.weight
+
+        value = self.values[chosen_arm]
+        self.values[chosen_arm] = value + self.weight * (reward - value) / self.discounted_counts[chosen_arm]
+
+    def update_aggregated(self, counts: np.ndarray, sums: np.ndarray):
+        """
+        Actualiza las medias descontadas con las tiradas de un lote, todas con el peso del paso actual.
+        :param counts: Número de tiradas nuevas de cada brazo, de forma (k,).
+        :param sums: Suma de las recompensas nuevas de cada brazo, de forma (k,).
+        """
+        pulled = np.flatnonzero(counts)
+        c = counts[pulled]
+        self.counts[pulled] += c
+        self.discounted_counts[pulled] += self.weight * c
+        self.discounted_total += self.weight * c.sum()
+
+        value = self.values[pulled]
+        self.values[pulled] = value + self.weight * (sums[pulled] - c * value) / self.discounted_counts[pulled]
+
+    def reset(self):
+        super().reset()
+        self._reset_discount()
@@ -14,38 +14,95 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 import numpy as np
 
-from algorithms.algorithm import Algorithm
+from algorithms.algorithm import SWEEP_ERROR, Algorithm
+from algorithms.tournament_tree import TournamentTree
 
 class EpsilonGreedy(Algorithm):
 
-    def __init__(self, k: int, epsilon: float = 0.1):
+    SWEEP_PARAMS = ('epsilon',)
+
+    def __init__(self, k: int, epsilon: float = 0.1, rng=None, indexed: bool = False):
         """
         Inicializa el algoritmo epsilon-greedy.
 
         :param k: Número de brazos.
-        :param epsilon: Probabilidad de exploración (seleccionar un brazo al azar).
+        :param epsilon: Probabilidad de exploración (seleccionar un brazo al azar). Puede ser un vector
+                        de valores para evaluarlos todos a la vez en run_experiment (barrido).
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        :param indexed: Si es True el brazo con mayor recompensa estimada se mantiene en un árbol de
+                        torneo, de modo que la decisión voraz cuesta O(1) y la actualización O(log k).
         :raises ValueError: Si epsilon no está en [0, 1].
         """
-        assert 0 <= epsilon <= 1, "El parámetro epsilon debe estar entre 0 y 1."
+        assert np.all((np.asarray(epsilon) >= 0) & (np.asarray(epsilon) <= 1)), "El parámetro epsilon debe estar entre 0 y 1."
 
-        super().__init__(k)
+        super().__init__(k, rng)
         self.epsilon = epsilon
+        self.indexed = indexed
+
+        if self.indexed:
+            self.tree = TournamentTree(k)
 
     def select_arm(self) -> int:
         """
         Selecciona un brazo basado en la política epsilon-greedy.
         :return: índice del brazo seleccionado.
         """
+        assert self._scalar(), SWEEP_ERROR
 
-        if np.random.random() < self.epsilon:
+        if self.random_buffer.random() < self.epsilon:
             # Selecciona un brazo al azar
-            chosen_arm = np.random.choice(self.k)
+            chosen_arm = self.random_buffer.integers(self.k)
         else:
             # Selecciona el brazo con la recompensa promedio estimada más alta
-            chosen_arm = np.argmax(self.values)
+            chosen_arm = self.tree.argmax() if self.indexed else np.argmax(self.values)
 
         return chosen_arm
 
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con la política epsilon-greedy; el brazo voraz se calcula una sola vez.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        greedy_arm = self.tree.argmax() if self.indexed else np.argmax(self.values)
+        chosen_arms = np.full(n, greedy_arm, dtype=int)
 
+        explore = self.random_buffer.random(n) < self.epsilon
+        chosen_arms[explore] = self.random_buffer.integers(self.k, int(explore.sum()))
 
+        return chosen_arms
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Actualiza la recompensa promedio del brazo elegido y, en modo indexado, su hoja en el árbol.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        super().update(chosen_arm, reward)
 
+        if self.indexed:
+            self.tree.update(chosen_arm, self.values[chosen_arm])
+
+    def update_aggregated(self, counts: np.ndarray, sums: np.ndarray):
+        super().update_aggregated(counts, sums)
+
+        if self.indexed:
+            pulled = np.flatnonzero(counts)
+            if self._rebuild_index(pulled.size, self.tree.capacity):
+                self.tree.build(self.values)
+                return
+            for arm in pulled:
+                self.tree.update(arm, self.values[arm])
+
+    def _state_loaded(self):
+        if self.indexed:
+            self.tree.build(self.values)
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo.
+        """
+        super().reset()
+        if self.indexed:
+            self.tree.build(self.values)
@@ -14,19 +14,25 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 import numpy as np
 
-from algorithms.algorithm import Algorithm
+from algorithms.algorithm import SWEEP_ERROR, Algorithm
 
 class GradientePreferencias(Algorithm):
 
-    def __init__(self, k: int, alpha: float, initial_preference: float = 1):
+    STATE_FIELDS = Algorithm.STATE_FIELDS + ('probabilities', 'average_reward', 'total_reward', 'total_counts')
+    MERGE_FIELDS = STATE_FIELDS
+    SWEEP_PARAMS = ('alpha',)
+
+    def __init__(self, k: int, alpha: float, initial_preference: float = 1, rng=None):
         """
         Inicializa el algoritmo Gradiente de Preferencias.
 
         :param k: Número de brazos.
-        :param alpha: Tasa de aprendizaje
+        :param alpha: Tasa de aprendizaje. Puede ser un vector de valores para evaluarlos todos a la vez
+                      en run_experiment (barrido).
         :param initial_preference: Valor inicial de preferencia para todos los brazos.
+        :param rng: Generador de números aleatorios (np.random.Generator).
         """
-        super().__init__(k)
+        super().__init__(k, rng)
 
         self.alpha = alpha
         self.initial_preference = initial_preference
@@ -61,7 +67,7 @@ class GradientePreferencias(Algorithm):
         self._compute_probabilities()
         
         # Seleccionar un brazo basado en las probabilidades
-        chosen_arm = np.random.choice(self.k, p=self.probabilities)
+        chosen_arm = self.random_buffer.choice(self.probabilities)
 
         return chosen_arm
     
@@ -71,6 +77,7 @@ class GradientePreferencias(Algorithm):
         :param chosen_arm: Índice del brazo seleccionado.
         :param reward: Recompensa obtenida.
         """
+        assert self._scalar(), SWEEP_ERROR
         # Incrementamos el contador general y el del brazo elegido
         self.total_counts += 1
         self.counts[chosen_arm] += 1
@@ -90,6 +97,42 @@ class GradientePreferencias(Algorithm):
             if arm != chosen_arm:
                 self.values[arm] -= self.alpha * reward_error * self.probabilities[arm]
 
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con las probabilidades actuales, que se calculan una sola vez.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        self._compute_probabilities()
+        return self.random_buffer.choice(self.probabilities, n)
+
+    def update_aggregated(self, counts: np.ndarray, sums: np.ndarray):
+        """
+        Actualiza las preferencias con un lote de recompensas agregadas por brazo.
+
+        Sumando la actualización de cada tirada con la recompensa media del final del lote se obtiene
+        H(a) += α[(s_a - n_a R̄) - π(a)(S - N R̄)], con n_a y s_a las tiradas y la suma de recompensas
+        del brazo a y N y S sus totales. Con una sola tirada coincide con update.
+        :param counts: Número de tiradas nuevas de cada brazo, de forma (k,).
+        :param sums: Suma de las recompensas nuevas de cada brazo, de forma (k,).
+        """
+        assert self._scalar(), SWEEP_ERROR
+        batch_counts = counts.sum()
+        batch_reward = sums.sum()
+        if batch_counts == 0:
+            return
+
+        # Política con la que se eligieron los brazos (la misma que calculó select_arm si no ha cambiado H)
+        self._compute_probabilities()
+
+        self.total_counts += batch_counts
+        self.counts += counts
+        self.total_reward += batch_reward
+        self.average_reward = self.total_reward / self.total_counts
+
+        self.values += self.alpha * ((sums - counts * self.average_reward)
+                                     - self.probabilities * (batch_reward - batch_counts * self.average_reward))
+
     def reset(self):
         """
         Reinicia el estado del algoritmo.
@@ -0,0 +1,141 @@
+"""
+Module: algorithms/kinetic_tree.py
+Description: Torneo cinético para mantener el argmax de offset_i + c * slope_i cuando c sólo crece.
+
+El índice de UCB1 es values_i + sqrt(2 ln t) * (1 / sqrt(counts_i)): una recta en c = sqrt(2 ln t)
+por brazo. Cada nodo del torneo guarda el ganador de su subárbol y el menor c a partir del cual
+algún ganador de su subárbol deja de serlo (cuando una recta de mayor pendiente lo adelanta). Al
+crecer c sólo se recalculan los nodos cuyo certificado ha caducado y al cambiar un brazo sólo se
+recalcula su camino hasta la raíz.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import math
+
+import numpy as np
+
+
+class KineticTournament:
+
+    def __init__(self, k: int):
+        """
+        Inicializa el torneo con k rectas inactivas (offset -inf).
+
+        :param k: Número de rectas (brazos).
+        """
+        assert k > 0, "El número de brazos k debe ser mayor que 0."
+
+        self.k = k
+        self.capacity = 1 << (k - 1).bit_length()
+        self.c = 0.0
+
+        # Rectas de cada hoja; las inactivas y las de relleno nunca ganan
+        self.offsets = np.full(self.capacity, -np.inf)
+        self.slopes = np.zeros(self.capacity)
+
+        # Ganador de cada nodo y valor de c a partir del cual hay que recalcular su subárbol
+        self.winners = np.zeros(2 * self.capacity, dtype=int)
+        self.winners[self.capacity:] = np.arange(self.capacity)
+        self.failures = np.full(2 * self.capacity, np.inf)
+        level = self.capacity
+        while level > 1:
+            self.winners[level // 2:level] = self.winners[level:2 * level:2]
+            level //= 2
+
+    def build(self, offsets: np.ndarray, slopes: np.ndarray, c: float):
+        """
+        Reconstruye el torneo completo para un valor de c, nivel a nivel en O(k).
+
+        :param offsets: Término independiente de cada recta (-inf para las inactivas).
+        :param slopes: Pendiente de cada recta.
+        :param c: Valor actual de c.
+        """
+        self.c = c
+        self.offsets[:] = -np.inf
+        self.offsets[:self.k] = offsets
+        self.slopes[:] = 0.0
+        self.slopes[:self.k] = slopes
+        self.winners[self.capacity:] = np.arange(self.capacity)
+        self.failures[:] = np.inf
+
+        level = self.capacity
+        while level > 1:
+            a = self.winners[level:2 * level:2]
+            b = self.winners[level + 1:2 * level:2]
+            left_wins = self.offsets[a] + c * self.slopes[a] >= self.offsets[b] + c * self.slopes[b]
+            winner = np.where(left_wins, a, b)
+            loser = np.where(left_wins, b, a)
+
+            overtakes = (self.slopes[loser] > self.slopes[winner]) & (self.offsets[loser] > -np.inf)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                crossing = (self.offsets[winner] - self.offsets[loser]) / (self.slopes[loser] - self.slopes[winner])
+            failure = np.where(overtakes, crossing, np.inf)
+
+            self.winners[level // 2:level] = winner
+            self.failures[level // 2:level] = np.minimum(
+                failure, np.minimum(self.failures[level:2 * level:2], self.failures[level + 1:2 * level:2]))
+            level //= 2
+
+    def _compute(self, node: int):
+        """
+        Recalcula el ganador y el certificado de un nodo a partir de sus hijos, para el c actual.
+        """
+        a = self.winners[2 * node]
+        b = self.winners[2 * node + 1]
+        offsets, slopes = self.offsets, self.slopes
+
+        # En caso de empate gana el hijo izquierdo, que tiene el índice menor (como np.argmax)
+        if offsets[a] + self.c * slopes[a] >= offsets[b] + self.c * slopes[b]:
+            winner, loser = a, b
+        else:
+            winner, loser = b, a
+
+        failure = math.inf
+        if slopes[loser] > slopes[winner] and offsets[loser] > -math.inf:
+            # Valor de c en el que la recta perdedora alcanza a la ganadora
+            failure = (offsets[winner] - offsets[loser]) / (slopes[loser] - slopes[winner])
+
+        self.winners[node] = winner
+        self.failures[node] = min(failure, self.failures[2 * node], self.failures[2 * node + 1])
+
+    def _refresh(self, node: int):
+        if node >= self.capacity or not self.c > self.failures[node]:
+            return
+        self._refresh(2 * node)
+        self._refresh(2 * node + 1)
+        self._compute(node)
+
+    def advance(self, c: float):
+        """
+        Avanza el torneo hasta `c` (que no puede decrecer), recalculando sólo los certificados caducados.
+        """
+        assert c >= self.c, "El parámetro c no puede decrecer."
+
+        self.c = c
+        self._refresh(1)
+
+    def set(self, index: int, offset: float, slope: float):
+        """
+        Cambia la recta de una hoja y recalcula su camino hasta la raíz en O(log k).
+        """
+        self.offsets[index] = offset
+        self.slopes[index] = slope
+
+        node = (self.capacity + index) // 2
+        while node >= 1:
+            self._compute(node)
+            node //= 2
+
+    def winner(self) -> int:
+        """
+        Devuelve el índice con mayor offset + c * slope.
+        """
+        return int(self.winners[1])
@@ -0,0 +1,107 @@
+"""
+Module: algorithms/random_buffer.py
+Description: Buffer de números aleatorios que rellena por bloques las extracciones de los algoritmos.
+
+Pedir un único número a numpy en cada paso cuesta mucho más que el propio número. El buffer pide
+bloques de uniformes al generador y a partir de ellos sirve uniformes, enteros y categóricas.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+class RandomBuffer:
+
+    def __init__(self, rng=None, size: int = 4096):
+        """
+        Inicializa el buffer.
+
+        :param rng: Generador de números aleatorios (np.random.Generator). Si es None se usa el generador global de numpy.
+        :param size: Número de uniformes que se piden al generador cada vez que se vacía el buffer.
+        """
+        assert size > 0, "El tamaño del buffer debe ser mayor que 0."
+
+        self.rng = np.random if rng is None else rng
+        self.size = size
+        self._block = np.empty(0)
+        self._position = 0
+
+    def random(self, size: Optional[int] = None):
+        """
+        Devuelve un uniforme en [0, 1) o, si se indica `size`, un vector con los siguientes `size` uniformes del buffer.
+        """
+        if size is not None:
+            return self._random_array(size)
+
+        if self._position >= self._block.size:
+            self._block = self.rng.random(self.size)
+            self._position = 0
+
+        u = self._block[self._position]
+        self._position += 1
+        return u
+
+    def _random_array(self, size: int) -> np.ndarray:
+        out = np.empty(size)
+        filled = 0
+        while filled < size:
+            if self._position >= self._block.size:
+                self._block = self.rng.random(self.size)
+                self._position = 0
+            take = min(size - filled, self._block.size - self._position)
+            out[filled:filled + take] = self._block[self._position:self._position + take]
+            self._position += take
+            filled += take
+        return out
+
+    def clear(self):
+        """
+        Descarta los uniformes pendientes del bloque actual: la siguiente extracción pide un bloque nuevo al generador.
+        """
+        self._block = np.empty(0)
+        self._position = 0
+
+    def integers(self, high: int, size: Optional[int] = None):
+        """
+        Devuelve un entero uniforme en [0, high) o un vector de `size` enteros.
+        """
+        if size is not None:
+            return np.minimum((self.random(size) * high).astype(int), high - 1)
+        return min(int(self.random() * high), high - 1)
+
+    def choice(self, p: np.ndarray, size: Optional[int] = None):
+        """
+        Devuelve un índice con probabilidad proporcional a `p` o un vector de `size` índices independientes.
+
+        :param p: Pesos no negativos de cada índice (no es necesario que estén normalizados).
+        :param size: Número de índices a extraer con la misma distribución.
+        """
+        cdf = np.cumsum(p)
+        if size is not None:
+            indices = np.searchsorted(cdf, self.random(size) * cdf[-1], side='right')
+            return np.minimum(indices, len(p) - 1)
+
+        index = int(np.searchsorted(cdf, self.random() * cdf[-1], side='right'))
+        return min(index, len(p) - 1)
+
+    def __getstate__(self):
+        # El generador global de NumPy es un módulo y no se puede serializar: se guarda como None
+        state = self.__dict__.copy()
+        if state['rng'] is np.random:
+            state['rng'] = None
+        return state
+
+    def __setstate__(self, state):
+        if state['rng'] is None:
+            state['rng'] = np.random
+        self.__dict__.update(state)
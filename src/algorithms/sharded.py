@@ -0,0 +1,157 @@
+"""
+Module: algorithms/sharded.py
+Description: Envoltorio para compartir un algoritmo entre varios hilos sin un cerrojo global en cada tirada.
+
+Cada hilo decide con su propia copia del algoritmo y acumula sus recompensas en un fragmento local
+(número de tiradas y suma de recompensas por brazo). Cada `merge_every` actualizaciones el fragmento
+se vuelca en el algoritmo compartido con `update_aggregated`, bajo un cerrojo, y el hilo renueva su
+copia a partir del estado combinado. Así no se pierde ninguna actualización y el cerrojo sólo se toma
+una vez cada `merge_every` tiradas.
+
+Un hilo sólo renueva su copia al volcar su propio fragmento, nunca porque otro hilo haya volcado el
+suyo: las estimaciones de los demás hilos le llegan con un retraso de, como mucho, `merge_every` de sus
+propias tiradas, y justo después del volcado no tiene actualizaciones pendientes que se puedan perder.
+El algoritmo se copia entero una única vez por hilo; las renovaciones copian sólo los estadísticos
+combinados (MERGE_FIELDS: tiradas, medias, sumas...). El estado de la planificación de cada copia,
+como la época en curso de UCB2 o el peso de descuento de Discounted UCB, se mantiene local.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import copy
+import threading
+
+import numpy as np
+
+from algorithms.algorithm import Algorithm
+from algorithms.random_buffer import RandomBuffer
+
+
+class _Shard:
+
+    def __init__(self, k: int, rng):
+        # Copia local con la que decide el hilo
+        self.policy = None
+        # Generador propio del hilo, para que las copias no repitan los mismos números aleatorios
+        self.random_buffer = RandomBuffer(rng)
+        # Tiradas y recompensas pendientes de volcar en el algoritmo compartido
+        self.counts = np.zeros(k, dtype=int)
+        self.sums = np.zeros(k, dtype=float)
+        self.pending = 0
+
+
+class ShardedLearner:
+
+    def __init__(self, algorithm: Algorithm, merge_every: int = 256):
+        """
+        Inicializa el envoltorio.
+
+        :param algorithm: Algoritmo compartido, que contiene las estimaciones combinadas.
+        :param merge_every: Número de actualizaciones de un hilo tras las que se vuelcan en el algoritmo compartido.
+        """
+        assert merge_every > 0, "El número de actualizaciones entre volcados debe ser mayor que 0."
+
+        self.algorithm = algorithm
+        self.k: int = algorithm.k
+        self.merge_every = merge_every
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            with self._lock:
+                rng = self.algorithm.random_buffer.rng
+                shard = _Shard(self.k, rng.spawn(1)[0] if isinstance(rng, np.random.Generator) else rng)
+                # El generador se comparte en la copia (no se duplica) y después se sustituye por el del hilo
+                shard.policy = copy.deepcopy(self.algorithm, {id(rng): rng})
+                shard.policy.random_buffer = shard.random_buffer
+            self._local.shard = shard
+        return shard
+
+    def _refresh(self, shard: _Shard):
+        """
+        Renueva la copia local del hilo a partir del algoritmo compartido. Se llama con el cerrojo tomado.
+        """
+        policy = shard.policy
+        for name in self.algorithm.MERGE_FIELDS:
+            value = getattr(self.algorithm, name)
+            setattr(policy, name, value.copy() if isinstance(value, np.ndarray) else value)
+        # Reconstruye el estado derivado de la copia (los árboles de los modos indexados)
+        policy._state_loaded()
+
+    def select_arm(self) -> int:
+        """
+        Selecciona un brazo con la copia local del hilo.
+        :return: índice del brazo seleccionado.
+        """
+        return self._shard().policy.select_arm()
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con la copia local del hilo.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        return self._shard().policy.select_arms(n)
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Registra una recompensa en el fragmento del hilo y en su copia local.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        shard = self._shard()
+        shard.policy.update(chosen_arm, reward)
+        shard.counts[chosen_arm] += 1
+        shard.sums[chosen_arm] += reward
+        shard.pending += 1
+
+        if shard.pending >= self.merge_every:
+            self._merge(shard)
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de recompensas en el fragmento del hilo y en su copia local.
+        :param chosen_arms: Índices de los brazos tirados.
+        :param rewards: Recompensa obtenida en cada tirada.
+        """
+        shard = self._shard()
+        chosen_arms = np.asarray(chosen_arms, dtype=int)
+        rewards = np.asarray(rewards, dtype=float)
+
+        shard.policy.update_batch(chosen_arms, rewards)
+        shard.counts += np.bincount(chosen_arms, minlength=self.k)
+        shard.sums += np.bincount(chosen_arms, weights=rewards, minlength=self.k)
+        shard.pending += chosen_arms.size
+
+        if shard.pending >= self.merge_every:
+            self._merge(shard)
+
+    def flush(self):
+        """
+        Vuelca en el algoritmo compartido las actualizaciones pendientes del hilo que llama.
+        Cada hilo debe llamarlo antes de terminar para no dejar tiradas sin combinar.
+        """
+        shard = self._shard()
+        if shard.pending:
+            self._merge(shard)
+
+    def _merge(self, shard: _Shard):
+        with self._lock:
+            self.algorithm.update_aggregated(shard.counts, shard.sums)
+            # UCB1/UCB2 avanzan t al seleccionar; en el algoritmo compartido t es el total de tiradas combinadas
+            if hasattr(self.algorithm, 'total_counts'):
+                self.algorithm.total_counts = max(self.algorithm.total_counts, int(self.algorithm.counts.sum()))
+            self._refresh(shard)
+
+        shard.counts[:] = 0
+        shard.sums[:] = 0.0
+        shard.pending = 0
@@ -0,0 +1,188 @@
+"""
+Module: algorithms/sliding_window_ucb.py
+Description: Implementación del algoritmo Sliding-Window UCB (Garivier y Moulines, 2011) para problemas de k-brazos no estacionarios.
+
+Las medias y los contadores sólo tienen en cuenta las últimas `window` tiradas, que se guardan en un
+buffer circular. Cada tirada nueva sustituye a la más antigua y ambas se suman o restan de los
+contadores y sumas por brazo en O(1). Para que los errores de redondeo de las restas no se
+acumulen, las sumas se recalculan desde el buffer una vez cada `window` tiradas (O(1) amortizado).
+La memoria es O(window + k) para cualquier horizonte.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+from algorithms.algorithm import SWEEP_ERROR
+from algorithms.ucb1 import UCB1
+
+
+class SlidingWindowUCB(UCB1):
+
+    STATE_FIELDS = UCB1.STATE_FIELDS + ('window_arms', 'window_rewards', 'window_sums', 'position', 'pushes')
+    MERGE_FIELDS = STATE_FIELDS
+    SWEEP_PARAMS = ('window',)
+
+    def __init__(self, k: int, window: int = 1000, rng=None):
+        """
+        Inicializa el algoritmo Sliding-Window UCB.
+
+        `counts` y `values` son el número de selecciones y la recompensa promedio de cada brazo dentro
+        de la ventana.
+
+        :param k: Número de brazos.
+        :param window: Número de tiradas recientes que se tienen en cuenta. Puede ser un vector de
+                       valores para evaluarlos todos a la vez en run_experiment (barrido).
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        """
+        assert np.all(np.asarray(window) > 0), "El tamaño de la ventana debe ser mayor que 0."
+
+        super().__init__(k, rng)
+        self.window = window
+        self._reset_window()
+
+    def _reset_window(self):
+        size = int(np.max(self.window))
+        # Brazo (-1 si la posición está vacía) y recompensa de las últimas tiradas
+        self.window_arms = np.full(size, -1, dtype=int)
+        self.window_rewards = np.zeros(size, dtype=float)
+        # Suma de las recompensas de cada brazo dentro de la ventana
+        self.window_sums = np.zeros(self.k, dtype=float)
+        # Siguiente posición del buffer y tiradas desde el último recálculo exacto de las sumas
+        self.position = 0
+        self.pushes = 0
+
+    def _ucb_values(self) -> np.ndarray:
+        """
+        Calcula la media en la ventana más el bonus de exploración de cada brazo.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        horizon = min(self.total_counts, self.window)
+        return self.values + np.sqrt((2 * np.log(horizon)) / self.counts)
+
+    def select_arm(self) -> int:
+        """
+        Selecciona un brazo basado en la política Sliding-Window UCB.
+        :return: índice del brazo seleccionado.
+        """
+        self.total_counts += 1
+
+        # Un brazo sin selecciones dentro de la ventana se vuelve a probar
+        if 0 in self.counts:
+            return np.argmin(self.counts)
+
+        return np.argmax(self._ucb_values())
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con la política Sliding-Window UCB avanzando t en n pasos.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        self.total_counts += n
+
+        unpulled = np.flatnonzero(self.counts == 0)
+        if unpulled.size:
+            return np.resize(unpulled, n)
+
+        return np.full(n, np.argmax(self._ucb_values()), dtype=int)
+
+    def _refresh(self, arms):
+        """
+        Recalcula la media en la ventana de los brazos indicados a partir de sus sumas y contadores.
+        """
+        counts = self.counts[arms]
+        self.values[arms] = np.where(counts > 0, self.window_sums[arms] / np.maximum(counts, 1), 0.0)
+
+    def _recompute(self):
+        """
+        Recalcula los contadores, las sumas y las medias desde el buffer.
+        """
+        filled = self.window_arms >= 0
+        self.counts = np.bincount(self.window_arms[filled], minlength=self.k)
+        self.window_sums = np.bincount(self.window_arms[filled], weights=self.window_rewards[filled], minlength=self.k)
+        self._refresh(slice(None))
+        self.pushes = 0
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Añade una tirada a la ventana, descartando la más antigua si está llena.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        counts, sums, values = self.counts, self.window_sums, self.values
+        position = self.position
+        old_arm = self.window_arms[position]
+        if old_arm >= 0:
+            counts[old_arm] -= 1
+            sums[old_arm] -= self.window_rewards[position]
+            values[old_arm] = sums[old_arm] / counts[old_arm] if counts[old_arm] else 0.0
+
+        self.window_arms[position] = chosen_arm
+        self.window_rewards[position] = reward
+        counts[chosen_arm] += 1
+        sums[chosen_arm] += reward
+        values[chosen_arm] = sums[chosen_arm] / counts[chosen_arm]
+
+        self.position = (position + 1) % self.window
+        self.pushes += 1
+        if self.pushes >= self.window:
+            self._recompute()
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Añade un lote de tiradas a la ventana, en orden.
+        :param chosen_arms: Índices de los brazos tirados.
+        :param rewards: Recompensa obtenida en cada tirada.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        chosen_arms = np.asarray(chosen_arms, dtype=int)
+        rewards = np.asarray(rewards, dtype=float)
+
+        n = chosen_arms.size
+        if n >= self.window:
+            # El lote llena la ventana: sólo quedan sus últimas tiradas
+            self.window_arms[:self.window] = chosen_arms[-self.window:]
+            self.window_rewards[:self.window] = rewards[-self.window:]
+            self.position = 0
+            self._recompute()
+            return
+
+        positions = (self.position + np.arange(n)) % self.window
+        old_arms = self.window_arms[positions]
+        filled = old_arms >= 0
+        np.subtract.at(self.counts, old_arms[filled], 1)
+        np.subtract.at(self.window_sums, old_arms[filled], self.window_rewards[positions][filled])
+
+        self.window_arms[positions] = chosen_arms
+        self.window_rewards[positions] = rewards
+        np.add.at(self.counts, chosen_arms, 1)
+        np.add.at(self.window_sums, chosen_arms, rewards)
+        self._refresh(np.unique(np.concatenate((old_arms[filled], chosen_arms))))
+
+        self.position = (self.position + n) % self.window
+        self.pushes += n
+        if self.pushes >= self.window:
+            self._recompute()
+
+    def update_aggregated(self, counts: np.ndarray, sums: np.ndarray):
+        """
+        Añade a la ventana las tiradas de un lote agregado por brazo: `counts[i]` tiradas del brazo i,
+        cada una con la recompensa media `sums[i] / counts[i]`.
+        :param counts: Número de tiradas nuevas de cada brazo, de forma (k,).
+        :param sums: Suma de las recompensas nuevas de cada brazo, de forma (k,).
+        """
+        pulled = np.flatnonzero(counts)
+        self.update_batch(np.repeat(pulled, counts[pulled]), np.repeat(sums[pulled] / counts[pulled], counts[pulled]))
+
+    def reset(self):
+        super().reset()
+        self._reset_window()
@@ -14,37 +14,123 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 import numpy as np
 
-from algorithms.algorithm import Algorithm
+from algorithms.algorithm import SWEEP_ERROR, Algorithm
+from algorithms.sum_tree import SumTree
 
 class Softmax(Algorithm):
 
-    def __init__(self, k: int, tau: float):
+    SWEEP_PARAMS = ('tau',)
+
+    # Margen (en unidades de values / tau) a partir del cual se rebasa el árbol de sumas
+    MAX_EXPONENT = 50.0
+
+    def __init__(self, k: int, tau: float, rng=None, indexed: bool = False):
         """
         Inicializa el algoritmo Softmax.
 
         :param k: Número de brazos.
-        :param tau: Parámetro que controla el grado de exploración.
+        :param tau: Parámetro que controla el grado de exploración. Puede ser un vector de valores para
+                    evaluarlos todos a la vez en run_experiment (barrido).
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        :param indexed: Si es True se mantiene un árbol de sumas de exp(values / tau), de modo que
+                        seleccionar y actualizar cuestan O(log k) en lugar de O(k).
         :raises ValueError: Si el valor de tau es menor o igual a 0.
         """
-        assert tau > 0, "El valor de tau debe ser mayor que 0."
+        assert np.all(np.asarray(tau) > 0), "El valor de tau debe ser mayor que 0."
 
-        super().__init__(k)
+        super().__init__(k, rng)
         self.tau = tau
+        self.indexed = indexed
+
+        if self.indexed:
+            self.tree = SumTree(k)
+            self._rebase()
+
+    def _rebase(self):
+        """
+        Reconstruye el árbol con los pesos exp((values - shift) / tau), tomando como shift el valor máximo.
+        Así el peso mayor es 1 y ningún exponente desborda.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        self.shift = np.max(self.values)
+        self.tree.build(np.exp((self.values - self.shift) / self.tau))
 
     def select_arm(self) -> int:
         """
         Selecciona un brazo basado en la política Softmax.
         :return: índice del brazo seleccionado.
         """
+        assert self._scalar(), SWEEP_ERROR
+        if self.indexed:
+            return self.tree.find(self.random_buffer.random() * self.tree.total())
         
         # Calcular las probabilidades de selección de cada brazo
         probabilities = np.exp(self.values / self.tau) / np.sum(np.exp(self.values / self.tau))
         
         # Seleccionar un brazo basado en las probabilidades
-        chosen_arm = np.random.choice(self.k, p=probabilities)
+        chosen_arm = self.random_buffer.choice(probabilities)
 
         return chosen_arm
 
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Actualiza la recompensa promedio del brazo elegido y, en modo indexado, su peso en el árbol.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        super().update(chosen_arm, reward)
 
+        if self.indexed:
+            self._update_weight(chosen_arm)
 
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con la política Softmax; las probabilidades se calculan una sola vez.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        if self.indexed:
+            total = self.tree.total()
+            return np.array([self.tree.find(u * total) for u in self.random_buffer.random(n)], dtype=int)
 
+        probabilities = np.exp(self.values / self.tau) / np.sum(np.exp(self.values / self.tau))
+        return self.random_buffer.choice(probabilities, n)
+
+    def update_aggregated(self, counts: np.ndarray, sums: np.ndarray):
+        super().update_aggregated(counts, sums)
+
+        if self.indexed:
+            pulled = np.flatnonzero(counts)
+            if self._rebuild_index(pulled.size, self.tree.capacity):
+                self._rebase()
+                return
+            for arm in pulled:
+                self._update_weight(arm)
+
+    def _update_weight(self, arm: int):
+        """
+        Recalcula el peso de un brazo en el árbol tras cambiar su valor.
+        """
+        exponent = (self.values[arm] - self.shift) / self.tau
+        if exponent > self.MAX_EXPONENT:
+            # El nuevo valor se aleja demasiado del shift: se rebasa en O(k)
+            self._rebase()
+            return
+
+        self.tree.update(arm, np.exp(exponent))
+        if self.tree.total() < np.exp(-self.MAX_EXPONENT):
+            # Todos los pesos se han hecho muy pequeños: se rebasa para no perder precisión
+            self._rebase()
+
+    def _state_loaded(self):
+        if self.indexed:
+            self._rebase()
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo.
+        """
+        super().reset()
+        if self.indexed:
+            self._rebase()
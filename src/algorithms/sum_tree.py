@@ -0,0 +1,89 @@
+"""
+Module: algorithms/sum_tree.py
+Description: Árbol de sumas para muestrear índices proporcionalmente a sus pesos en O(log k).
+
+Cada nodo interno guarda la suma de sus dos hijos y las hojas guardan los pesos. Cambiar un peso
+recalcula sólo el camino hasta la raíz (sin acumular error de redondeo) y muestrear es descender
+desde la raíz comparando con la suma del hijo izquierdo.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+
+class SumTree:
+
+    def __init__(self, k: int):
+        """
+        Inicializa un árbol de sumas con k hojas de peso 0.
+
+        :param k: Número de hojas (brazos).
+        """
+        assert k > 0, "El número de hojas k debe ser mayor que 0."
+
+        self.k = k
+        # Número de hojas redondeado a potencia de 2; las hojas sobrantes tienen peso 0
+        self.capacity = 1 << (k - 1).bit_length()
+        self.nodes = np.zeros(2 * self.capacity)
+
+    def build(self, weights: np.ndarray):
+        """
+        Reconstruye el árbol completo a partir de los pesos de todas las hojas en O(k).
+        """
+        self.nodes[:] = 0.0
+        self.nodes[self.capacity:self.capacity + self.k] = weights
+        level = self.capacity
+        while level > 1:
+            parents = self.nodes[level // 2:level]
+            np.add(self.nodes[level:2 * level:2], self.nodes[level + 1:2 * level:2], out=parents)
+            level //= 2
+
+    def update(self, index: int, weight: float):
+        """
+        Cambia el peso de una hoja en O(log k).
+        """
+        nodes = self.nodes
+        node = self.capacity + index
+        nodes[node] = weight
+        node //= 2
+        while node >= 1:
+            nodes[node] = nodes[2 * node] + nodes[2 * node + 1]
+            node //= 2
+
+    def total(self) -> float:
+        """
+        Devuelve la suma de todos los pesos.
+        """
+        return self.nodes[1]
+
+    def weight(self, index: int) -> float:
+        """
+        Devuelve el peso de una hoja.
+        """
+        return self.nodes[self.capacity + index]
+
+    def find(self, target: float) -> int:
+        """
+        Devuelve la hoja en la que cae `target` dentro de la suma acumulada de los pesos, en O(log k).
+
+        :param target: Valor en [0, total()).
+        """
+        nodes = self.nodes
+        node = 1
+        while node < self.capacity:
+            left = 2 * node
+            # Si el hijo derecho no tiene peso se baja por el izquierdo aunque el redondeo diga otra cosa
+            if target < nodes[left] or nodes[left + 1] <= 0.0:
+                node = left
+            else:
+                target -= nodes[left]
+                node = left + 1
+        return min(node - self.capacity, self.k - 1)
@@ -0,0 +1,216 @@
+"""
+Module: algorithms/thompson_sampling.py
+Description: Implementación del algoritmo Thompson Sampling con posteriores conjugadas para el problema de los k-brazos.
+
+Cada brazo tiene una distribución posterior sobre su recompensa esperada y en cada paso se elige
+el brazo con mayor muestra de su posterior. La posterior depende de la familia de los brazos:
+
+- 'bernoulli' y 'binomial': Beta(alpha, beta) sobre la probabilidad de éxito de cada ensayo. Una
+  recompensa r de `trials` ensayos suma r a alpha y trials - r a beta.
+- 'normal': Normal-Gamma(mean, kappa, alpha, beta) sobre la media y la precisión, con media y
+  varianza desconocidas.
+
+Los parámetros de las posteriores se guardan como vectores (k,) y las k muestras se generan con
+una sola llamada al generador. Las mismas funciones sirven para las matrices (runs, k) de la
+versión vectorizada (BatchedThompsonSampling).
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from algorithms.algorithm import SWEEP_ERROR, Algorithm
+
+FAMILIES = ('bernoulli', 'binomial', 'normal')
+
+
+def sample_posterior(family: str, trials: int, alpha: np.ndarray, beta: np.ndarray, mean: np.ndarray,
+                     kappa: np.ndarray, rng, size=None) -> np.ndarray:
+    """
+    Genera una muestra de la recompensa esperada de cada brazo a partir de su posterior.
+
+    :param family: Familia de los brazos ('bernoulli', 'binomial' o 'normal').
+    :param trials: Número de ensayos de cada recompensa (familias Beta).
+    :param alpha: Parámetro alpha de la Beta o de la Gamma de la precisión.
+    :param beta: Parámetro beta de la Beta o tasa de la Gamma de la precisión.
+    :param mean: Media de la Normal-Gamma (no se usa con las familias Beta).
+    :param kappa: Número equivalente de observaciones de la media de la Normal-Gamma (no se usa con las familias Beta).
+    :param rng: Generador de números aleatorios (np.random.Generator o el módulo np.random).
+    :param size: Forma de las muestras (por defecto, la de los parámetros).
+    :return: Muestras de la recompensa esperada de cada brazo.
+    """
+    if family != 'normal':
+        return trials * rng.beta(alpha, beta, size)
+    precision = rng.gamma(alpha, 1 / beta, size)
+    return mean + rng.standard_normal(precision.shape) / np.sqrt(kappa * precision)
+
+
+def update_posterior(family: str, trials: int, alpha: np.ndarray, beta: np.ndarray, mean: np.ndarray,
+                     kappa: np.ndarray, counts: np.ndarray, sums: np.ndarray,
+                     squares: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Actualiza las posteriores con `counts` recompensas nuevas de suma `sums` y suma de cuadrados `squares`.
+
+    :return: Nuevos (alpha, beta, mean, kappa).
+    """
+    if family != 'normal':
+        # Fuera de [0, trials] la Beta tendría parámetros negativos (por ejemplo, con brazos normales)
+        assert np.all((sums >= 0) & (sums <= trials * counts)), \
+            f"Con la familia '{family}' cada recompensa debe estar entre 0 y trials={trials}; " \
+            f"para brazos con otras recompensas use family='normal'."
+        return alpha + sums, beta + trials * counts - sums, mean, kappa
+
+    sample_mean = sums / counts
+    # Suma de los cuadrados de las desviaciones respecto a la media muestral
+    deviations = np.maximum(squares - sums * sample_mean, 0.0)
+    new_kappa = kappa + counts
+    new_mean = (kappa * mean + sums) / new_kappa
+    new_beta = beta + 0.5 * deviations + kappa * counts * (sample_mean - mean) ** 2 / (2 * new_kappa)
+    return alpha + 0.5 * counts, new_beta, new_mean, new_kappa
+
+
+def posterior_mean(family: str, trials: int, alpha: np.ndarray, beta: np.ndarray, mean: np.ndarray) -> np.ndarray:
+    """
+    Devuelve la recompensa esperada de cada brazo según su posterior.
+    """
+    if family != 'normal':
+        return trials * alpha / (alpha + beta)
+    return np.array(mean, dtype=float)
+
+
+class ThompsonSampling(Algorithm):
+
+    STATE_FIELDS = Algorithm.STATE_FIELDS + ('alpha', 'beta', 'mean', 'kappa')
+    MERGE_FIELDS = STATE_FIELDS
+    SWEEP_PARAMS = ('prior_alpha', 'prior_beta', 'prior_mean', 'prior_kappa')
+
+    def __init__(self, k: int, family: str = 'bernoulli', trials: int = 1, prior_alpha: float = 1.0,
+                 prior_beta: float = 1.0, prior_mean: float = 0.0, prior_kappa: float = 0.01, rng=None):
+        """
+        Inicializa el algoritmo Thompson Sampling.
+
+        Los parámetros a priori pueden ser vectores de valores para evaluarlos todos a la vez en
+        run_experiment (barrido); en ese caso el estado tiene una fila (k,) por configuración.
+
+        Con la posterior Normal-Gamma, un prior_kappa pequeño deja la media a priori casi sin peso, y
+        prior_alpha y prior_beta grandes con el mismo cociente concentran la precisión en torno a
+        prior_alpha / prior_beta (por ejemplo, 1 para los brazos de ArmNormal.generate_arms).
+
+        :param k: Número de brazos.
+        :param family: Familia de los brazos: 'bernoulli', 'binomial' (posterior Beta) o 'normal' (posterior Normal-Gamma).
+        :param trials: Número de ensayos de cada recompensa de los brazos binomiales (n de ArmBinomial).
+        :param prior_alpha: Alpha a priori de la Beta o de la Gamma de la precisión.
+        :param prior_beta: Beta a priori de la Beta o tasa a priori de la Gamma de la precisión.
+        :param prior_mean: Media a priori de la Normal-Gamma.
+        :param prior_kappa: Número equivalente de observaciones de la media a priori de la Normal-Gamma.
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        """
+        assert family in FAMILIES, f"La familia debe ser una de {FAMILIES}."
+        assert family == 'binomial' or trials == 1, "Sólo los brazos binomiales tienen más de un ensayo."
+        assert trials > 0, "El número de ensayos debe ser mayor que 0."
+        assert np.all(np.asarray(prior_alpha) > 0) and np.all(np.asarray(prior_beta) > 0), \
+            "Los parámetros a priori alpha y beta deben ser positivos."
+        assert np.all(np.asarray(prior_kappa) > 0), "El parámetro a priori kappa debe ser positivo."
+
+        super().__init__(k, rng)
+        self.family = family
+        self.trials = trials
+        self.prior_alpha = prior_alpha
+        self.prior_beta = prior_beta
+        self.prior_mean = prior_mean
+        self.prior_kappa = prior_kappa
+        self._reset_posterior()
+
+    def _prior(self, value) -> np.ndarray:
+        """
+        Devuelve el parámetro a priori repetido para los k brazos (una fila por configuración si es un vector).
+        """
+        value = np.asarray(value, dtype=float)
+        return np.array(np.broadcast_to(value[..., None], value.shape + (self.k,)))
+
+    def _reset_posterior(self):
+        self.alpha = self._prior(self.prior_alpha)
+        self.beta = self._prior(self.prior_beta)
+        self.mean = self._prior(self.prior_mean)
+        self.kappa = self._prior(self.prior_kappa)
+        self.values = posterior_mean(self.family, self.trials, self.alpha, self.beta, self.mean)
+
+    def select_arm(self) -> int:
+        """
+        Selecciona el brazo con mayor muestra de su posterior.
+        :return: índice del brazo seleccionado.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        samples = sample_posterior(self.family, self.trials, self.alpha, self.beta, self.mean, self.kappa,
+                                   self.random_buffer.rng)
+        return np.argmax(samples)
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos, cada uno con una muestra independiente de las posteriores.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        samples = sample_posterior(self.family, self.trials, self.alpha, self.beta, self.mean, self.kappa,
+                                   self.random_buffer.rng, (n, self.k))
+        return np.argmax(samples, axis=1)
+
+    def _update_arms(self, arms, counts, sums, squares):
+        """
+        Actualiza la posterior y la recompensa esperada de los brazos indicados.
+        """
+        assert self._scalar(), SWEEP_ERROR
+        self.alpha[arms], self.beta[arms], self.mean[arms], self.kappa[arms] = update_posterior(
+            self.family, self.trials, self.alpha[arms], self.beta[arms], self.mean[arms], self.kappa[arms],
+            counts, sums, squares)
+        self.counts[arms] += counts
+        self.values[arms] = posterior_mean(self.family, self.trials, self.alpha[arms], self.beta[arms], self.mean[arms])
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Actualiza la posterior del brazo elegido con su recompensa.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        self._update_arms(chosen_arm, 1, reward, reward * reward)
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Actualiza las posteriores con un lote de recompensas, agregadas por brazo (incluida la suma de
+        cuadrados que necesita la posterior Normal-Gamma).
+        :param chosen_arms: Índices de los brazos tirados.
+        :param rewards: Recompensa obtenida en cada tirada.
+        """
+        chosen_arms = np.asarray(chosen_arms, dtype=int)
+        rewards = np.asarray(rewards, dtype=float)
+        counts = np.bincount(chosen_arms, minlength=self.k)
+        pulled = np.flatnonzero(counts)
+        sums = np.bincount(chosen_arms, weights=rewards, minlength=self.k)[pulled]
+        squares = np.bincount(chosen_arms, weights=rewards * rewards, minlength=self.k)[pulled]
+        self._update_arms(pulled, counts[pulled], sums, squares)
+
+    def update_aggregated(self, counts: np.ndarray, sums: np.ndarray):
+        """
+        Actualiza las posteriores con el número de tiradas y la suma de recompensas de cada brazo. Sin
+        la suma de cuadrados, la posterior Normal-Gamma trata las recompensas de cada brazo del lote
+        como iguales a su media (para ella es preferible update_batch).
+        :param counts: Número de tiradas nuevas de cada brazo, de forma (k,).
+        :param sums: Suma de las recompensas nuevas de cada brazo, de forma (k,).
+        """
+        pulled = np.flatnonzero(counts)
+        c, s = counts[pulled], sums[pulled]
+        self._update_arms(pulled, c, s, s * s / c)
+
+    def reset(self):
+        super().reset()
+        self._reset_posterior()
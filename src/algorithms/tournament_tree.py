@@ -0,0 +1,70 @@
+"""
+Module: algorithms/tournament_tree.py
+Description: Árbol de torneo para mantener el índice del valor máximo con actualizaciones puntuales en O(log k).
+
+Cada nodo interno guarda el índice de la hoja ganadora de su subárbol. Cambiar un valor recalcula
+sólo el camino hasta la raíz comparando los ganadores de los dos hijos, por lo que las bajadas del
+máximo se tratan igual que las subidas. La raíz da el argmax en O(1).
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+
+class TournamentTree:
+
+    def __init__(self, k: int):
+        """
+        Inicializa un árbol de torneo con k hojas de valor 0.
+
+        :param k: Número de hojas (brazos).
+        """
+        assert k > 0, "El número de hojas k debe ser mayor que 0."
+
+        self.k = k
+        # Número de hojas redondeado a potencia de 2; las hojas sobrantes valen -inf y nunca ganan
+        self.capacity = 1 << (k - 1).bit_length()
+        self.leaves = np.full(self.capacity, -np.inf)
+        self.winners = np.zeros(2 * self.capacity, dtype=int)
+        self.build(np.zeros(k))
+
+    def build(self, values: np.ndarray):
+        """
+        Reconstruye el árbol completo a partir de los valores de todas las hojas en O(k).
+        """
+        self.leaves[:self.k] = values
+        self.winners[self.capacity:] = np.arange(self.capacity)
+        level = self.capacity
+        while level > 1:
+            left = self.winners[level:2 * level:2]
+            right = self.winners[level + 1:2 * level:2]
+            # En caso de empate gana el hijo izquierdo, que tiene el índice menor (como np.argmax)
+            self.winners[level // 2:level] = np.where(self.leaves[left] >= self.leaves[right], left, right)
+            level //= 2
+
+    def update(self, index: int, value: float):
+        """
+        Cambia el valor de una hoja en O(log k).
+        """
+        leaves, winners = self.leaves, self.winners
+        leaves[index] = value
+        node = (self.capacity + index) // 2
+        while node >= 1:
+            left = winners[2 * node]
+            right = winners[2 * node + 1]
+            winners[node] = left if leaves[left] >= leaves[right] else right
+            node //= 2
+
+    def argmax(self) -> int:
+        """
+        Devuelve el índice de la hoja con mayor valor en O(1).
+        """
+        return int(self.winners[1])
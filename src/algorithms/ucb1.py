@@ -15,18 +15,40 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 import numpy as np
 
 from algorithms.algorithm import Algorithm
+from algorithms.kinetic_tree import KineticTournament
 
 class UCB1(Algorithm):
 
-    def __init__(self, k: int):
+    STATE_FIELDS = Algorithm.STATE_FIELDS + ('total_counts',)
+    MERGE_FIELDS = Algorithm.MERGE_FIELDS + ('total_counts',)
+
+    def __init__(self, k: int, rng=None, indexed: bool = False):
         """
         Inicializa el algoritmo UCB1.
 
         :param k: Número de brazos.
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        :param indexed: Si es True los brazos sin probar se recorren con un cursor y el brazo con mayor
+                        UCB se mantiene en un torneo cinético, de modo que cada paso cuesta del orden
+                        de log k en lugar de k.
         """
 
-        super().__init__(k)
+        super().__init__(k, rng)
         self.total_counts = 0 # Contador de pasos totales (t)
+        self.indexed = indexed
+
+        if self.indexed:
+            self._reset_index()
+
+    def _reset_index(self):
+        self.cursor = 0 # Primer brazo que puede no haberse seleccionado todavía
+        self.tournament = KineticTournament(self.k)
+
+    def _bonus_scale(self) -> float:
+        """
+        Devuelve sqrt(2 ln t): el bonus de cada brazo es esta cantidad por 1 / sqrt(counts).
+        """
+        return np.sqrt(2 * np.log(max(self.total_counts, 1)))
 
     def select_arm(self) -> int:
         """
@@ -36,6 +58,9 @@ class UCB1(Algorithm):
         # Incrementar el número total de pasos
         self.total_counts += 1
 
+        if self.indexed:
+            return self._select_indexed()
+
         # Si no se ha seleccionado un brazo, seleccionamos cada brazo una vez
         if 0 in self.counts:
             return np.argmin(self.counts)
@@ -48,9 +73,81 @@ class UCB1(Algorithm):
 
         return chosen_arm
 
-    def reset(self):
-        self.counts = np.zeros(self.k, dtype=int)
-        self.values = np.zeros(self.k, dtype=float)
-        self.total_counts = 0
+    def _select_indexed(self) -> int:
+        # Los brazos anteriores al cursor ya se han seleccionado alguna vez
+        while self.cursor < self.k and self.counts[self.cursor] > 0:
+            self.cursor += 1
+        if self.cursor < self.k:
+            return self.cursor
+
+        # El bonus sólo crece con t: se actualizan únicamente los certificados caducados
+        self.tournament.advance(self._bonus_scale())
+        return self.tournament.winner()
 
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con la política UCB1 avanzando t en n pasos.
+        Mientras queden brazos sin probar se reparten entre las n peticiones; si no, todas reciben el
+        brazo con mayor UCB, ya que sin recompensas intermedias la política no cambia de brazo.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        self.total_counts += n
+
+        if self.indexed:
+            while self.cursor < self.k and self.counts[self.cursor] > 0:
+                self.cursor += 1
+            unpulled = self.cursor + np.flatnonzero(self.counts[self.cursor:] == 0)
+        else:
+            unpulled = np.flatnonzero(self.counts == 0)
+        if unpulled.size:
+            return np.resize(unpulled, n)
+
+        if self.indexed:
+            self.tournament.advance(self._bonus_scale())
+            chosen_arm = self.tournament.winner()
+        else:
+            chosen_arm = np.argmax(self.values + np.sqrt((2 * np.log(self.total_counts)) / self.counts))
+
+        return np.full(n, chosen_arm, dtype=int)
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Actualiza la recompensa promedio del brazo elegido y, en modo indexado, su recta en el torneo.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        super().update(chosen_arm, reward)
+
+        if self.indexed:
+            self.tournament.advance(max(self.tournament.c, self._bonus_scale()))
+            self.tournament.set(chosen_arm, self.values[chosen_arm], 1 / np.sqrt(self.counts[chosen_arm]))
+
+    def update_aggregated(self, counts: np.ndarray, sums: np.ndarray):
+        super().update_aggregated(counts, sums)
+
+        if self.indexed:
+            pulled = np.flatnonzero(counts)
+            if self._rebuild_index(pulled.size, self.tournament.capacity):
+                self._state_loaded()
+                return
+            self.tournament.advance(max(self.tournament.c, self._bonus_scale()))
+            for arm in pulled:
+                self.tournament.set(arm, self.values[arm], 1 / np.sqrt(self.counts[arm]))
+
+    def _state_loaded(self):
+        if self.indexed:
+            self._reset_index()
+            # El cursor salta directamente al primer brazo sin seleccionar
+            unpulled = np.flatnonzero(self.counts == 0)
+            self.cursor = int(unpulled[0]) if unpulled.size else self.k
+            with np.errstate(divide='ignore'):
+                slopes = np.where(self.counts > 0, 1 / np.sqrt(self.counts), 0.0)
+            offsets = np.where(self.counts > 0, self.values, -np.inf)
+            self.tournament.build(offsets, slopes, self._bonus_scale())
 
+    def reset(self):
+        super().reset()
+        self.total_counts = 0
+        if self.indexed:
+            self._reset_index()
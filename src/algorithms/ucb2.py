@@ -15,18 +15,25 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 import numpy as np
 import math
 
-from algorithms.algorithm import Algorithm
+from algorithms.algorithm import SWEEP_ERROR, Algorithm
 
 class UCB2(Algorithm):
 
-    def __init__(self, k: int, alpha: float):
+    STATE_FIELDS = Algorithm.STATE_FIELDS + ('total_counts', 'epoch_counts', 'remaining_pulls', 'current_arm')
+    # La época en curso (epoch_counts, remaining_pulls, current_arm) es local de cada copia
+    MERGE_FIELDS = Algorithm.MERGE_FIELDS + ('total_counts',)
+    SWEEP_PARAMS = ('alpha',)
+
+    def __init__(self, k: int, alpha: float, rng=None):
         """
         Inicializa el algoritmo UCB2.
 
         :param k: Número de brazos.
-        :param alpha: Parámetro que controla el grado de exploración.
+        :param alpha: Parámetro que controla el grado de exploración. Puede ser un vector de valores para
+                      evaluarlos todos a la vez en run_experiment (barrido).
+        :param rng: Generador de números aleatorios (np.random.Generator).
         """
-        super().__init__(k)
+        super().__init__(k, rng)
         self.alpha = alpha
         self.total_counts = 0 # Contador de pasos totales (t)
 
@@ -52,6 +59,14 @@ class UCB2(Algorithm):
             self.remaining_pulls -= 1
             return self.current_arm
 
+        return self._start_epoch()
+
+    def _start_epoch(self) -> int:
+        """
+        Empieza una época con el brazo de mayor valor UCB2 (todos los brazos se han probado ya).
+        :return: índice del brazo seleccionado.
+        """
+        assert self._scalar(), SWEEP_ERROR
         #Para cada brazo calculamos su valor UCB2
         ucb_values = self.values + np.sqrt(((1 + self.alpha) * np.log(self.total_counts / self.counts)) / (2 * self.counts))
         chosen_arm = np.argmax(ucb_values) # Selecciona el brazo con el valor UCB2 más alto
@@ -65,9 +80,41 @@ class UCB2(Algorithm):
         self.remaining_pulls = tau - 1 # Actualiza el número de veces restantes para devolver el brazo
         return chosen_arm # Devolvemos tau para saber cuantas veces tengo que tirar del brazo
 
+    def select_arms(self, n: int) -> np.ndarray:
+        """
+        Selecciona n brazos con la política UCB2. Mientras queden brazos sin probar se reparten entre
+        las n peticiones, como en UCB1. Si no, las repeticiones pendientes del brazo de la época actual
+        se sirven de una vez y sólo los cambios de época calculan los valores UCB2.
+        :param n: Número de brazos a seleccionar.
+        :return: Vector de forma (n,) con los índices de los brazos seleccionados.
+        """
+        unpulled = np.flatnonzero(self.counts == 0)
+        if unpulled.size:
+            self.total_counts += n
+            return np.resize(unpulled, n)
+
+        chosen_arms = np.empty(n, dtype=int)
+        filled = 0
+        while filled < n:
+            if self.remaining_pulls > 0:
+                repeats = min(self.remaining_pulls, n - filled)
+                chosen_arms[filled:filled + repeats] = self.current_arm
+                self.remaining_pulls -= repeats
+                self.total_counts += repeats
+                filled += repeats
+            else:
+                self.total_counts += 1
+                chosen_arms[filled] = self._start_epoch()
+                filled += 1
+        return chosen_arms
+
+    def _state_loaded(self):
+        # save_state guarda como -1 el brazo de una época que todavía no ha empezado
+        if self.current_arm is not None and self.current_arm < 0:
+            self.current_arm = None
+
     def reset(self):
-        self.counts = np.zeros(self.k, dtype=int)
-        self.values = np.zeros(self.k, dtype=float)
+        super().reset()
         self.epoch_counts = np.zeros(self.k, dtype=int)
         self.total_counts = 0
         self.remaining_pulls = 0
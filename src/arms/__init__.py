@@ -12,15 +12,48 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-
-# Importación de módulos o clases
-from .arm import Arm
-from .armnormal import ArmNormal
-from .armbernoulli import ArmBernoulli
-from .armbinomial import ArmBinomial
-from .bandit import Bandit
+import importlib
+from typing import TYPE_CHECKING
+
+# Importación de módulos o clases. Se difiere hasta el primer uso de cada nombre (PEP 562) para que
+# importar el paquete no cargue los módulos que no se van a usar
+_LAZY_IMPORTS = {
+    'Arm': '.arm',
+    'ArmNormal': '.armnormal',
+    'Bandit': '.bandit',
+    'ArmBernoulli': '.armbernoulli',
+    'ArmBinomial': '.armbinomial',
+    'RewardTape': '.reward_tape',
+    'ArrayBandit': '.array_bandit',
+    'NonStationaryArm': '.nonstationary',
+    'ArmNormalDrifting': '.armdrifting',
+    'ArmBernoulliDrifting': '.armdrifting',
+    'ArmSwitching': '.armswitching',
+}
+
+if TYPE_CHECKING:
+    from .arm import Arm
+    from .armnormal import ArmNormal
+    from .armbernoulli import ArmBernoulli
+    from .armbinomial import ArmBinomial
+    from .reward_tape import RewardTape
+    from .bandit import Bandit
+    from .array_bandit import ArrayBandit
+    from .nonstationary import NonStationaryArm
+    from .armdrifting import ArmNormalDrifting, ArmBernoulliDrifting
+    from .armswitching import ArmSwitching
 
 # Lista de módulos o clases públicas
-__all__ = ['Arm', 'ArmNormal', 'Bandit', 'ArmBernoulli', 'ArmBinomial']
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
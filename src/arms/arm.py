@@ -14,9 +14,26 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class Arm(ABC):
 
+    # Number of rewards drawn at once when the buffer of pull() runs out
+    buffer_size: int = 1024
+    # Whether the reward distribution is the same at every time step (see NonStationaryArm)
+    stationary: bool = True
+
+    def __init__(self, rng=None):
+        """
+        Initializes the random state of the arm.
+
+        :param rng: Random generator (np.random.Generator). If None, the global numpy generator is used.
+        """
+        self.rng = rng
+        self._rewards = np.empty(0)
+        self._position = 0
+
     @classmethod
     def generate_arms(cls, k: int):
         """
@@ -27,13 +44,48 @@ class Arm(ABC):
         """
         raise NotImplementedError("This method must be implemented by the subclass.")
 
-    @abstractmethod
     def pull(self):
         """
         Generates a reward based on the arm's distribution.
 
+        Rewards are drawn in blocks of `buffer_size` with `sample` and served one at a time.
+
+        :return: Reward obtained from the arm.
+        """
+        if self._position >= self._rewards.size:
+            self._rewards = self.sample(self.buffer_size)
+            self._position = 0
+
+        reward = self._rewards[self._position]
+        self._position += 1
+        return reward
+
+    def reset(self):
+        """
+        Discards the rewards buffered by `pull`, so that the next pull draws a fresh block from the
+        generator (e.g. after np.random.seed).
+        """
+        self._rewards = np.empty(0)
+        self._position = 0
+
+    def _generator(self, rng=None):
+        """
+        Returns the random generator to use: the given one, the arm's one or the global numpy generator.
+        """
+        if rng is not None:
+            return rng
+        return np.random if self.rng is None else self.rng
+
+    @abstractmethod
+    def sample(self, size, rng=None) -> np.ndarray:
+        """
+        Generates several rewards at once based on the arm's distribution.
+
         This method must be implemented by derived classes.
 
+        :param size: Number or shape of the rewards to generate.
+        :param rng: Random generator (np.random.Generator). If None, the generator of the arm is used.
+        :return: Array of rewards with the requested shape.
         :raises NotImplementedError: If not implemented in the subclass.
         """
         raise NotImplementedError("This method must be implemented by the subclass.")
@@ -23,24 +23,29 @@ from arms import Arm
 
 
 class ArmBernoulli(Arm):
-    def __init__(self, p: float):
+    def __init__(self, p: float, rng=None):
         """
         Inicializa el brazo con distribución Bernoulli.
 
         :param p: Probabilidad de éxito (0 <= p <= 1).
+        :param rng: Generador de números aleatorios (np.random.Generator).
         """
         assert 0 <= p <= 1, "La probabilidad p debe estar en el rango [0,1]."
 
+        super().__init__(rng)
+
         self.p = p
 
-    def pull(self):
+    def sample(self, size, rng=None) -> np.ndarray:
         """
-        Genera una recompensa siguiendo una distribución de Bernoulli.
+        Genera varias recompensas a la vez siguiendo una distribución de Bernoulli.
 
-        :return: Recompensa obtenida del brazo.
+        :param size: Número o forma de las recompensas a generar.
+        :param rng: Generador de números aleatorios. Si es None se usa el del brazo.
+        :return: Array con las recompensas obtenidas del brazo.
         """
-        reward = np.random.binomial(n=1, p=self.p)
-        return reward
+        rng = self._generator(rng)
+        return rng.binomial(n=1, p=self.p, size=size)
 
     def get_expected_value(self) -> float:
         """
@@ -60,7 +65,7 @@ class ArmBernoulli(Arm):
         return f"ArmBernoulli(p={self.p})"
 
     @classmethod
-    def generate_arms(cls, k: int):
+    def generate_arms(cls, k: int, rng=None):
         """
         Genera k brazos con medias únicas en el rango [0, 1].
 
@@ -68,18 +73,21 @@ class ArmBernoulli(Arm):
         los eventos no son completamente seguros o improbables.
 
         :param k: Número de brazos a generar.
+        :param rng: Generador de números aleatorios para las probabilidades y para los brazos generados.
         :return: Lista de brazos generados.
         """
         assert k > 0, "El número de brazos k debe ser mayor que 0."
 
+        generator = np.random if rng is None else rng
+
         # Generar k- valores únicos de mu con decimales
         p_values = set()
         while len(p_values) < k:
-            p = round(np.random.uniform(0.1, 0.9), 2)  # Evitar extremos 0 y 1
+            p = round(generator.uniform(0.1, 0.9), 2)  # Evitar extremos 0 y 1
             p_values.add(p)
 
         p_values = list(p_values)
-        arms = [ArmBernoulli(p) for p in p_values]
+        arms = [ArmBernoulli(p, rng) for p in p_values]
 
         return arms
 
@@ -19,26 +19,31 @@ from arms import Arm
 
 
 class ArmBinomial(Arm):
-    def __init__(self, n: int, p: float):
+    def __init__(self, n: int, p: float, rng=None):
         """
         Inicializa el brazo con distribución binomial.
 
         :param n: Número de ensayos.
         :param p: Probabilidad de éxito (0 <= p <= 1).
+        :param rng: Generador de números aleatorios (np.random.Generator).
         """
         assert n > 0, "El número de ensayos n debe ser mayor que 0."
         assert 0 <= p <= 1, "La probabilidad p debe estar en el rango [0,1]."
+
+        super().__init__(rng)
         self.n = n
         self.p = p
 
-    def pull(self):
+    def sample(self, size, rng=None) -> np.ndarray:
         """
-        Genera una recompensa siguiendo una distribución de binomial.
+        Genera varias recompensas a la vez siguiendo una distribución binomial.
 
-        :return: Recompensa obtenida del brazo.
+        :param size: Número o forma de las recompensas a generar.
+        :param rng: Generador de números aleatorios. Si es None se usa el del brazo.
+        :return: Array con las recompensas obtenidas del brazo.
         """
-        reward = np.random.binomial(n=self.n, p=self.p)
-        return reward
+        rng = self._generator(rng)
+        return rng.binomial(n=self.n, p=self.p, size=size)
 
     def get_expected_value(self) -> float:
         """
@@ -58,7 +63,7 @@ class ArmBinomial(Arm):
         return f"ArmBinomial(n={self.n}, p={self.p})"
 
     @classmethod
-    def generate_arms(cls, k: int, n: int):
+    def generate_arms(cls, k: int, n: int, rng=None):
         """
         Genera k brazos con medias únicas en el rango [0, 1].
 
@@ -66,19 +71,23 @@ class ArmBinomial(Arm):
         los eventos no son completamente seguros o improbables.
 
         :param k: Número de brazos a generar.
+        :param n: Número de ensayos de cada brazo.
+        :param rng: Generador de números aleatorios para las probabilidades y para los brazos generados.
         :return: Lista de brazos generados.
         """
         assert k > 0, "El número de brazos k debe ser mayor que 0."
         assert n > 0, "El número de ensayos n debe ser mayor que 0."
 
+        generator = np.random if rng is None else rng
+
         # Generar k- valores únicos de mu con decimales
         p_values = set()
         while len(p_values) < k:
-            p = round(np.random.uniform(0.1, 0.9), 2)  # Evitar extremos 0 y 1
+            p = round(generator.uniform(0.1, 0.9), 2)  # Evitar extremos 0 y 1
             p_values.add(p)
 
         p_values = list(p_values)
-        arms = [ArmBinomial(n, p) for p in p_values]
+        arms = [ArmBinomial(n, p, rng) for p in p_values]
 
         return arms
 
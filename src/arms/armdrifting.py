@@ -0,0 +1,163 @@
+"""
+Module: arms/armdrifting.py
+Description: Contains the implementation of the ArmNormalDrifting and ArmBernoulliDrifting classes, arms whose mean drifts over time.
+
+La media oscila de forma continua alrededor de su valor base:
+
+    media(t) = base + amplitude * sin(2 pi t / period + phase)
+
+de modo que el orden de los brazos cambia poco a poco y la media muestral de todas las recompensas
+deja de ser una buena estimación.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+from arms.nonstationary import NonStationaryArm
+
+
+def _oscillation(t: np.ndarray, amplitude: float, period: float, phase: float) -> np.ndarray:
+    return amplitude * np.sin(2 * np.pi * np.asarray(t) / period + phase)
+
+
+class ArmNormalDrifting(NonStationaryArm):
+    def __init__(self, mu: float, sigma: float, amplitude: float, period: float, phase: float = 0.0, rng=None):
+        """
+        Inicializa el brazo con distribución normal de media variable.
+
+        :param mu: Media base de la distribución.
+        :param sigma: Desviación estándar de la distribución.
+        :param amplitude: Amplitud de la oscilación de la media.
+        :param period: Número de pasos de un ciclo completo de la oscilación.
+        :param phase: Fase inicial de la oscilación (radianes).
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        """
+        assert sigma > 0, "La desviación estándar sigma debe ser positiva."
+        assert period > 0, "El periodo debe ser positivo."
+
+        super().__init__(rng)
+
+        self.mu = mu
+        self.sigma = sigma
+        self.amplitude = amplitude
+        self.period = period
+        self.phase = phase
+
+    def expected_value_at(self, t: np.ndarray) -> np.ndarray:
+        """
+        Devuelve la media de la distribución en cada paso de `t`.
+        """
+        return self.mu + _oscillation(t, self.amplitude, self.period, self.phase)
+
+    def sample_at(self, t: np.ndarray, rng=None) -> np.ndarray:
+        """
+        Genera una recompensa normal por cada paso de `t`.
+        """
+        rng = self._generator(rng)
+        return self.expected_value_at(t) + self.sigma * rng.standard_normal(np.shape(t))
+
+    def __str__(self):
+        """
+        Representación en cadena del brazo normal con deriva.
+
+        :return: Descripción detallada del brazo.
+        """
+        return (f"ArmNormalDrifting(mu={self.mu}, sigma={self.sigma}, amplitude={self.amplitude}, "
+                f"period={self.period}, phase={self.phase})")
+
+    @classmethod
+    def generate_arms(cls, k: int, amplitude: float, period: float, mu_min: float = 1, mu_max: float = 10.0,
+                      rng=None):
+        """
+        Genera k brazos con medias base en [mu_min, mu_max], sigma 1 y fases aleatorias.
+
+        :param k: Número de brazos a generar.
+        :param amplitude: Amplitud de la oscilación de la media.
+        :param period: Número de pasos de un ciclo completo de la oscilación.
+        :param mu_min: Valor mínimo de la media base.
+        :param mu_max: Valor máximo de la media base.
+        :param rng: Generador de números aleatorios para los parámetros y para los brazos generados.
+        :return: Lista de brazos generados.
+        """
+        assert k > 0, "El número de brazos k debe ser mayor que 0."
+        assert mu_min < mu_max, "El valor de mu_min debe ser menor que mu_max."
+
+        generator = np.random if rng is None else rng
+        mu_values = np.round(generator.uniform(mu_min, mu_max, k), 2)
+        phases = generator.uniform(0, 2 * np.pi, k)
+
+        return [ArmNormalDrifting(mu, 1.0, amplitude, period, phase, rng)
+                for mu, phase in zip(mu_values.tolist(), phases.tolist())]
+
+
+class ArmBernoulliDrifting(NonStationaryArm):
+    def __init__(self, p: float, amplitude: float, period: float, phase: float = 0.0, rng=None):
+        """
+        Inicializa el brazo con distribución Bernoulli de probabilidad variable. La probabilidad se
+        recorta al rango [0, 1].
+
+        :param p: Probabilidad de éxito base (0 <= p <= 1).
+        :param amplitude: Amplitud de la oscilación de la probabilidad.
+        :param period: Número de pasos de un ciclo completo de la oscilación.
+        :param phase: Fase inicial de la oscilación (radianes).
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        """
+        assert 0 <= p <= 1, "La probabilidad p debe estar en el rango [0,1]."
+        assert period > 0, "El periodo debe ser positivo."
+
+        super().__init__(rng)
+
+        self.p = p
+        self.amplitude = amplitude
+        self.period = period
+        self.phase = phase
+
+    def expected_value_at(self, t: np.ndarray) -> np.ndarray:
+        """
+        Devuelve la probabilidad de éxito en cada paso de `t`.
+        """
+        return np.clip(self.p + _oscillation(t, self.amplitude, self.period, self.phase), 0.0, 1.0)
+
+    def sample_at(self, t: np.ndarray, rng=None) -> np.ndarray:
+        """
+        Genera una recompensa Bernoulli (0 o 1) por cada paso de `t`.
+        """
+        rng = self._generator(rng)
+        return (rng.random(np.shape(t)) < self.expected_value_at(t)).astype(float)
+
+    def __str__(self):
+        """
+        Representación en cadena del brazo Bernoulli con deriva.
+
+        :return: Descripción detallada del brazo.
+        """
+        return (f"ArmBernoulliDrifting(p={self.p}, amplitude={self.amplitude}, period={self.period}, "
+                f"phase={self.phase})")
+
+    @classmethod
+    def generate_arms(cls, k: int, amplitude: float, period: float, rng=None):
+        """
+        Genera k brazos con probabilidades base en [0.1, 0.9] y fases aleatorias.
+
+        :param k: Número de brazos a generar.
+        :param amplitude: Amplitud de la oscilación de la probabilidad.
+        :param period: Número de pasos de un ciclo completo de la oscilación.
+        :param rng: Generador de números aleatorios para los parámetros y para los brazos generados.
+        :return: Lista de brazos generados.
+        """
+        assert k > 0, "El número de brazos k debe ser mayor que 0."
+
+        generator = np.random if rng is None else rng
+        p_values = np.round(generator.uniform(0.1, 0.9, k), 2)
+        phases = generator.uniform(0, 2 * np.pi, k)
+
+        return [ArmBernoulliDrifting(p, amplitude, period, phase, rng)
+                for p, phase in zip(p_values.tolist(), phases.tolist())]
@@ -19,26 +19,31 @@ from arms import Arm
 
 
 class ArmNormal(Arm):
-    def __init__(self, mu: float, sigma: float):
+    def __init__(self, mu: float, sigma: float, rng=None):
         """
         Inicializa el brazo con distribución normal.
 
         :param mu: Media de la distribución.
         :param sigma: Desviación estándar de la distribución.
+        :param rng: Generador de números aleatorios (np.random.Generator).
         """
         assert sigma > 0, "La desviación estándar sigma debe ser positiva."
 
+        super().__init__(rng)
+
         self.mu = mu
         self.sigma = sigma
 
-    def pull(self):
+    def sample(self, size, rng=None) -> np.ndarray:
         """
-        Genera una recompensa siguiendo una distribución normal.
+        Genera varias recompensas a la vez siguiendo una distribución normal.
 
-        :return: Recompensa obtenida del brazo.
+        :param size: Número o forma de las recompensas a generar.
+        :param rng: Generador de números aleatorios. Si es None se usa el del brazo.
+        :return: Array con las recompensas obtenidas del brazo.
         """
-        reward = np.random.normal(self.mu, self.sigma)
-        return reward
+        rng = self._generator(rng)
+        return rng.normal(self.mu, self.sigma, size)
 
     def get_expected_value(self) -> float:
         """
@@ -58,29 +63,32 @@ class ArmNormal(Arm):
         return f"ArmNormal(mu={self.mu}, sigma={self.sigma})"
 
     @classmethod
-    def generate_arms(cls, k: int, mu_min: float = 1, mu_max: float = 10.0):
+    def generate_arms(cls, k: int, mu_min: float = 1, mu_max: float = 10.0, rng=None):
         """
         Genera k brazos con medias únicas en el rango [mu_min, mu_max].
 
         :param k: Número de brazos a generar.
         :param mu_min: Valor mínimo de la media.
         :param mu_max: Valor máximo de la media.
+        :param rng: Generador de números aleatorios para las medias y para los brazos generados.
         :return: Lista de brazos generados.
         """
         assert k > 0, "El número de brazos k debe ser mayor que 0."
         assert mu_min < mu_max, "El valor de mu_min debe ser menor que mu_max."
 
+        generator = np.random if rng is None else rng
+
         # Generar k- valores únicos de mu con decimales
         mu_values = set()
         while len(mu_values) < k:
-            mu = np.random.uniform(mu_min, mu_max)
+            mu = generator.uniform(mu_min, mu_max)
             mu = round(mu, 2)
             mu_values.add(mu)
 
         mu_values = list(mu_values)
         sigma = 1.0
 
-        arms = [ArmNormal(mu, sigma) for mu in mu_values]
+        arms = [ArmNormal(mu, sigma, rng) for mu in mu_values]
 
         return arms
 
@@ -0,0 +1,96 @@
+"""
+Module: arms/armswitching.py
+Description: Contains the implementation of the ArmSwitching class, an arm whose distribution changes abruptly at given time steps.
+
+El brazo se comporta como `arms[0]` hasta el primer punto de cambio, como `arms[1]` hasta el
+segundo, y así sucesivamente. Los tramos pueden ser brazos de cualquier tipo estacionario
+(ArmNormal, ArmBernoulli, ArmBinomial...).
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import List
+
+import numpy as np
+
+from arms.arm import Arm
+from arms.nonstationary import NonStationaryArm
+
+
+class ArmSwitching(NonStationaryArm):
+    def __init__(self, arms: List[Arm], change_points: List[int], rng=None):
+        """
+        Inicializa el brazo a partir de los brazos de cada tramo.
+
+        :param arms: Brazo estacionario de cada tramo.
+        :param change_points: Pasos (crecientes) en los que empieza cada tramo a partir del segundo.
+        :param rng: Generador de números aleatorios (np.random.Generator).
+        """
+        assert len(arms) == len(change_points) + 1, "Debe haber un brazo más que puntos de cambio."
+        assert all(arm.stationary for arm in arms), "Los brazos de cada tramo deben ser estacionarios."
+        assert np.all(np.diff(change_points) > 0), "Los puntos de cambio deben ser crecientes."
+
+        super().__init__(rng)
+
+        self.arms = arms
+        self.change_points = list(change_points)
+        self._boundaries = np.asarray(self.change_points, dtype=np.int64)
+        self._values = np.array([arm.get_expected_value() for arm in arms], dtype=float)
+
+    def segment(self, t: np.ndarray) -> np.ndarray:
+        """
+        Devuelve el índice del tramo de cada paso de `t`.
+        """
+        return np.searchsorted(self._boundaries, t, side='right')
+
+    def expected_value_at(self, t: np.ndarray) -> np.ndarray:
+        """
+        Devuelve el valor esperado del brazo del tramo de cada paso de `t`.
+        """
+        return self._values[self.segment(t)]
+
+    def sample_at(self, t: np.ndarray, rng=None) -> np.ndarray:
+        """
+        Genera una recompensa por cada paso de `t` con el brazo de su tramo. Cada tramo presente
+        genera todas sus recompensas con una sola llamada a `sample`.
+        """
+        rng = self._generator(rng)
+        segments = self.segment(t)
+        rewards = np.empty(np.shape(t), dtype=float)
+        for index in np.unique(segments):
+            mask = segments == index
+            rewards[mask] = self.arms[index].sample(np.count_nonzero(mask), rng)
+        return rewards
+
+    def __str__(self):
+        """
+        Representación en cadena del brazo con cambios bruscos.
+
+        :return: Descripción detallada del brazo.
+        """
+        return f"ArmSwitching(arms=[{', '.join(str(arm) for arm in self.arms)}], change_points={self.change_points})"
+
+    @classmethod
+    def generate_arms(cls, k: int, change_points: List[int], arm_class, rng=None, **kwargs):
+        """
+        Genera k brazos que cambian todos a la vez en los puntos de cambio: en cada tramo los brazos
+        son los de una llamada nueva a `arm_class.generate_arms`, por lo que el brazo óptimo suele cambiar.
+
+        :param k: Número de brazos a generar.
+        :param change_points: Pasos (crecientes) en los que empieza cada tramo a partir del segundo.
+        :param arm_class: Clase de los brazos de cada tramo (por ejemplo, ArmNormal o ArmBernoulli).
+        :param rng: Generador de números aleatorios para los parámetros y para los brazos generados.
+        :param kwargs: Otros argumentos de `arm_class.generate_arms` (por ejemplo, n para ArmBinomial).
+        :return: Lista de brazos generados.
+        """
+        assert k > 0, "El número de brazos k debe ser mayor que 0."
+
+        segments = [arm_class.generate_arms(k, rng=rng, **kwargs) for _ in range(len(change_points) + 1)]
+        return [ArmSwitching(list(arms), change_points, rng) for arms in zip(*segments)]
@@ -0,0 +1,298 @@
+"""
+Module: arms/array_bandit.py
+Description: Contains the ArrayBandit class, a bandit whose arms all follow the same distribution family.
+
+The parameters of the arms are stored as NumPy arrays (mu/sigma, p or n/p) instead of a list of Arm
+objects, so generating the arms and pulling many of them at once are single vectorized operations.
+ArrayBandit is a drop-in replacement for Bandit: the Arm objects are only built if `arms` is read.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from arms.arm import Arm
+from arms.armbernoulli import ArmBernoulli
+from arms.armbinomial import ArmBinomial
+from arms.armnormal import ArmNormal
+from arms.bandit import Bandit
+from arms.reward_tape import RewardTape
+
+# Distribution families and the arm class each one stands for
+FAMILIES = {'normal': ArmNormal, 'bernoulli': ArmBernoulli, 'binomial': ArmBinomial}
+
+
+def unique_values(k: int, low: float, high: float, rng=None, decimals: int = 2) -> np.ndarray:
+    """
+    Draws k distinct values in [low, high] rounded to `decimals` decimals, in random order.
+
+    The values are drawn from the grid of rounded values with vectorized sampling instead of one at
+    a time in a rejection loop. If the grid has fewer than k values, decimals are added until it is large enough.
+
+    :param k: Number of values.
+    :param low: Minimum value.
+    :param high: Maximum value.
+    :param rng: Random generator (np.random.Generator). If None, the global numpy generator is used.
+    :param decimals: Minimum number of decimals of the values.
+    :return: Array of k distinct values.
+    """
+    assert k > 0, "The number of values k must be greater than 0."
+    assert low < high, "The minimum value must be lower than the maximum value."
+
+    while round((high - low) * 10 ** decimals) + 1 < k:
+        decimals += 1
+    size = round((high - low) * 10 ** decimals) + 1
+
+    generator = np.random if rng is None else rng
+    if size <= 4 * k:
+        steps = generator.choice(size, k, replace=False)
+    else:
+        # Sparse grid: draw with replacement and redraw the repeated values. A repeated value keeps
+        # only its last draw (the one `owner` points to), which avoids sorting
+        integers = generator.integers if hasattr(generator, 'integers') else generator.randint
+        taken = np.zeros(size, dtype=bool)
+        owner = np.empty(size, dtype=np.int64)
+        chunks, missing = [], k
+        while missing:
+            draw = integers(0, size, missing)
+            draw = draw[~taken[draw]]
+            positions = np.arange(draw.size)
+            owner[draw] = positions
+            draw = draw[owner[draw] == positions]
+            taken[draw] = True
+            chunks.append(draw)
+            missing -= draw.size
+        steps = np.concatenate(chunks)
+    return np.round(low + steps / 10 ** decimals, decimals)
+
+
+class ArrayBandit(Bandit):
+    def __init__(self, family: str, mu=None, sigma=None, n=None, p=None, rng=None):
+        """
+        Initializes the bandit from the parameters of its arms.
+
+        :param family: Distribution of the arms: 'normal' (mu, sigma), 'bernoulli' (p) or 'binomial' (n, p).
+        :param mu: Means of the normal arms.
+        :param sigma: Standard deviations of the normal arms (an array or a single value for all arms).
+        :param n: Number of trials of the binomial arms (an array or a single value for all arms).
+        :param p: Success probabilities of the bernoulli and binomial arms.
+        :param rng: Random generator (np.random.Generator) of pull_arm and of pull_arms without `rng`.
+                    If None, the global numpy generator is used.
+        """
+        assert family in FAMILIES, f"The family must be one of {tuple(FAMILIES)}."
+
+        if family == 'normal':
+            assert mu is not None and sigma is not None, "Normal arms need mu and sigma."
+            mu = np.asarray(mu, dtype=float)
+            sigma = np.broadcast_to(np.asarray(sigma, dtype=float), mu.shape)
+            assert np.all(sigma > 0), "The standard deviations sigma must be positive."
+            expected_rewards = mu
+        else:
+            assert p is not None, "Bernoulli and binomial arms need p."
+            p = np.asarray(p, dtype=float)
+            assert np.all((p >= 0) & (p <= 1)), "The probabilities p must be in the range [0, 1]."
+            if family == 'binomial':
+                assert n is not None, "Binomial arms need n."
+                n = np.broadcast_to(np.asarray(n, dtype=np.int64), p.shape)
+                assert np.all(n > 0), "The number of trials n must be greater than 0."
+                expected_rewards = n * p
+            else:
+                expected_rewards = p
+
+        self.family = family
+        self.mu = mu
+        self.sigma = sigma
+        self.n = n
+        self.p = p
+        self.rng = rng
+        self._arms: Optional[List[Arm]] = None
+        # The arms are only built if they are needed, so Bandit.__init__ is not called
+        self._init_state(expected_rewards, [])
+
+    @classmethod
+    def generate(cls, family: str, k: int, rng=None, **kwargs) -> 'ArrayBandit':
+        """
+        Generates a bandit of k arms with distinct parameters, like `generate_arms` of each arm class.
+
+        Normal arms have means in [mu_min, mu_max] (1 and 10 by default) and sigma 1; bernoulli and
+        binomial arms have probabilities in [0.1, 0.9]. The parameters have two decimals, or more if
+        k does not fit in the range with two.
+
+        :param family: Distribution of the arms: 'normal', 'bernoulli' or 'binomial'.
+        :param k: Number of arms.
+        :param rng: Random generator for the parameters and for the pulls of the bandit.
+        :param kwargs: mu_min and mu_max for normal arms, n (required) for binomial arms.
+        :return: The generated bandit.
+        """
+        if family == 'normal':
+            mu = unique_values(k, kwargs.get('mu_min', 1), kwargs.get('mu_max', 10.0), rng)
+            return cls(family, mu=mu, sigma=1.0, rng=rng)
+        if family == 'binomial':
+            assert 'n' in kwargs, "Binomial arms need n."
+            return cls(family, n=kwargs['n'], p=unique_values(k, 0.1, 0.9, rng), rng=rng)
+        return cls(family, p=unique_values(k, 0.1, 0.9, rng), rng=rng)
+
+    @classmethod
+    def from_arms(cls, arms: List[Arm], rng=None) -> 'ArrayBandit':
+        """
+        Builds an array-backed bandit from a list of arms of the same class.
+
+        :param arms: List of ArmNormal, ArmBernoulli or ArmBinomial, all of the same class.
+        :param rng: Random generator of the pulls of the bandit.
+        :return: The equivalent bandit.
+        """
+        family = next((name for name, arm_class in FAMILIES.items() if type(arms[0]) is arm_class), None)
+        if family is None or any(type(arm) is not type(arms[0]) for arm in arms):
+            raise ValueError("All the arms must be ArmNormal, ArmBernoulli or ArmBinomial, and of the same class.")
+
+        params = {name: np.array([getattr(arm, name) for arm in arms])
+                  for name in ('mu', 'sigma', 'n', 'p') if hasattr(arms[0], name)}
+        return cls(family, rng=rng, **params)
+
+    def use_tape(self, runs: int, steps: int, rng=None, **kwargs) -> RewardTape:
+        """
+        Pre-draws a (runs, steps, k) reward tape, drawing all the arms at once. As in Bandit.use_tape,
+        pull_arm moves on to the next step after each pull and pull_arms reads the current step.
+
+        :param runs: Number of independent runs.
+        :param steps: Number of time steps per run.
+        :param rng: Random generator (np.random.Generator). If None, the global numpy generator is used.
+        :param kwargs: Extra arguments for RewardTape (chunk_steps, max_memory, path, dtype, first_step).
+        :return: The reward tape attached to the bandit.
+        """
+        self.tape = RewardTape(self, runs, steps, rng, **kwargs)
+        self.seek(0, self.tape.first_step)
+        return self.tape
+
+    @property
+    def arms(self) -> List[Arm]:
+        """
+        Arm objects equivalent to the parameters of the bandit, built on first access.
+        """
+        if self._arms is None:
+            arm_class = FAMILIES[self.family]
+            if self.family == 'normal':
+                self._arms = [arm_class(mu, sigma, self.rng) for mu, sigma in zip(self.mu.tolist(), self.sigma.tolist())]
+            elif self.family == 'binomial':
+                self._arms = [arm_class(n, p, self.rng) for n, p in zip(self.n.tolist(), self.p.tolist())]
+            else:
+                self._arms = [arm_class(p, self.rng) for p in self.p.tolist()]
+        return self._arms
+
+    def _generator(self, rng=None):
+        """
+        Returns the random generator to use: the given one, the bandit's one or the global numpy generator.
+        """
+        if rng is not None:
+            return rng
+        return np.random if self.rng is None else self.rng
+
+    def draw(self, indices: np.ndarray, rng=None) -> np.ndarray:
+        """
+        Draws one reward of the arm given by each entry of `indices`, ignoring the reward tape.
+
+        :param indices: Array with the index of the arm of each reward.
+        :param rng: Random generator (np.random.Generator). If None, the generator of the bandit is used.
+        :return: Array of rewards with the same shape as `indices`.
+        """
+        generator = self._generator(rng)
+        indices = np.asarray(indices)
+
+        if self.family == 'normal':
+            return self.mu[indices] + self.sigma[indices] * generator.standard_normal(indices.shape)
+        if self.family == 'bernoulli':
+            return (generator.random(indices.shape) < self.p[indices]).astype(float)
+        return np.asarray(generator.binomial(self.n[indices], self.p[indices]), dtype=float)
+
+    def sample(self, size, rng=None) -> np.ndarray:
+        """
+        Draws rewards of every arm at once, e.g. to fill a RewardTape.
+
+        :param size: Number or shape of the rewards of each arm.
+        :param rng: Random generator (np.random.Generator). If None, the generator of the bandit is used.
+        :return: Array of shape `size + (k,)`.
+        """
+        shape = tuple(np.atleast_1d(size))
+        return self.draw(np.broadcast_to(np.arange(self.k), shape + (self.k,)), rng)
+
+    def reset(self):
+        """
+        Discards the rewards buffered by the arm objects, if they have been built (pulls of the
+        bandit itself are not buffered).
+        """
+        if self._arms is not None:
+            for arm in self._arms:
+                arm.reset()
+
+    def pull_arm(self, index: int) -> float:
+        """
+        Pulls a specific arm and returns the reward.
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :return: Reward obtained from the arm.
+        :raises IndexError: If the index is out of the valid range.
+        """
+        if index < 0 or index >= self.k:
+            raise IndexError("Arm index out of range.")
+
+        if self.tape is not None:
+            reward = self.tape.data[self.tape_run, self.tape_step, index]
+            # Each single pull is one time step: the next one reads the following step of the tape
+            self.seek(self.tape_run, self.tape.first_step + self.tape_step + 1)
+            return reward
+
+        return self.draw(index)[()]
+
+    def pull_arms(self, indices: np.ndarray, rng=None) -> np.ndarray:
+        """
+        Pulls one arm per entry of `indices` and returns the rewards.
+
+        With a reward tape the rewards are read as in Bandit.pull_arms. Otherwise all of them are
+        drawn with a single vectorized call, indexing the parameters of the arms.
+
+        :param indices: Array with the index of the arm to pull in each position.
+        :param rng: Random generator (np.random.Generator). If None, the generator of the bandit is used.
+        :return: Array of rewards with the same shape as `indices`.
+        """
+        if self.tape is not None:
+            return super().pull_arms(indices, rng)
+        return self.draw(indices, rng)
+
+    def get_expected_rewards(self) -> np.ndarray:
+        """
+        Returns the expected reward of each arm.
+
+        :return: Array of expected rewards.
+        """
+        return self.expected_rewards
+
+    def expected_rewards_at(self, steps: np.ndarray) -> np.ndarray:
+        """
+        Returns the expected reward of every arm at the given time steps (the same at every step).
+
+        :param steps: Array of time steps.
+        :return: Array of shape (len(steps), k).
+        """
+        return np.broadcast_to(self.expected_rewards, (np.size(steps), self.k))
+
+    def get_expected_value(self, numer_arm):
+        return self.expected_rewards[numer_arm].item()
+
+    def __str__(self):
+        """
+        String representation of the bandit showing the family and the range of its parameters.
+
+        :return: Description of the bandit.
+        :rtype: str
+        """
+        low, high = self.expected_rewards.min(), self.expected_rewards.max()
+        return f"ArrayBandit with {self.k} {self.family} arms: expected rewards in [{low:g}, {high:g}]"
@@ -14,11 +14,12 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 
 # bandit.py
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 
 from arms import Arm
+from arms.reward_tape import RewardTape
 
 
 class Bandit:
@@ -30,10 +31,76 @@ class Bandit:
         :type arms: list of Arm
         """
         self.arms = arms
-        self.k = len(arms)
-        self.expected_rewards = self.get_expected_rewards()
+        self._init_state(self.get_expected_rewards(), [arm for arm in arms if not arm.stationary])
+
+    def _init_state(self, expected_rewards, nonstationary: List[Arm]):
+        """
+        Sets the state shared by every bandit: the expected rewards and the optimal arm, the
+        non-stationary arms and an empty reward tape. Subclasses that do not build their arms
+        up front (ArrayBandit) call it instead of Bandit.__init__.
+
+        :param expected_rewards: Expected reward of each arm.
+        :param nonstationary: Arms whose distribution changes over time.
+        """
+        self.k = len(expected_rewards)
+        self.expected_rewards = expected_rewards
         self.optimal_arm = self.get_optimal_arm()
 
+        # Arms whose distribution changes over time; their time step follows the pulls (see seek)
+        self._nonstationary = nonstationary
+        self.stationary = not self._nonstationary
+
+        # Optional pre-drawn rewards and the (run, step) position read by the pulls
+        self.tape: Optional[RewardTape] = None
+        self.tape_run = 0
+        self.tape_step = 0
+
+    def use_tape(self, runs: int, steps: int, rng=None, **kwargs) -> RewardTape:
+        """
+        Pre-draws a (runs, steps, k) reward tape so that pulls become array lookups.
+
+        pull_arm reads run `tape_run` at the current step and moves on to the next step, so a loop
+        of single pulls walks through one run of the tape. pull_arms reads the current step without
+        moving; callers pulling in batches move along the tape with seek.
+
+        :param runs: Number of independent runs.
+        :param steps: Number of time steps per run.
+        :param rng: Random generator (np.random.Generator). If None, the global numpy generator is used.
+        :param kwargs: Extra arguments for RewardTape (chunk_steps, max_memory, path, dtype, first_step).
+        :return: The reward tape attached to the bandit.
+        """
+        self.tape = RewardTape(self.arms, runs, steps, rng, **kwargs)
+        self.seek(0, self.tape.first_step)
+        return self.tape
+
+    def detach_tape(self):
+        """
+        Removes the reward tape. Pulls go back to sampling the arms.
+        """
+        self.tape = None
+        self.seek(0, 0)
+
+    def reset(self):
+        """
+        Discards the rewards buffered by the arms and moves non-stationary arms back to time step 0,
+        so that reseeding the generator repeats the same pulls. The reward tape, if any, is kept.
+        """
+        for arm in self.arms:
+            arm.reset()
+
+    def seek(self, run: int = 0, step: int = 0):
+        """
+        Moves the reward tape to the given run and time step.
+
+        :param run: Run of the first pull. Batched pulls read consecutive runs from this one.
+        :param step: Time step of the next pulls. Non-stationary arms also move to this step.
+        """
+        self.tape_run = run
+        # A tape may cover a window of steps starting after step 0
+        self.tape_step = step if self.tape is None else step - self.tape.first_step
+        for arm in self._nonstationary:
+            arm.t = step
+
     def pull_arm(self, index: int) -> float:
         """
         Pulls a specific arm and returns the reward.
@@ -45,9 +112,48 @@ class Bandit:
         if index < 0 or index >= self.k:
             raise IndexError("Arm index out of range.")
 
+        if self.tape is not None:
+            reward = self.tape.data[self.tape_run, self.tape_step, index]
+            # Each single pull is one time step: the next one reads the following step of the tape
+            self.seek(self.tape_run, self.tape.first_step + self.tape_step + 1)
+            return reward
+
         reward = self.arms[index].pull()
         return reward
 
+    def pull_arms(self, indices: np.ndarray, rng=None) -> np.ndarray:
+        """
+        Pulls one arm per entry of `indices` and returns the rewards.
+
+        With a reward tape, entry i along the last axis reads the reward of run `tape_run + i` at
+        `tape_step`; leading axes (e.g. the configurations of a hyperparameter sweep) share those runs.
+        Otherwise each distinct arm draws all its rewards with a single call to `Arm.sample`.
+
+        :param indices: Array with the index of the arm to pull in each position.
+        :param rng: Random generator (np.random.Generator). If None, each arm uses its own generator.
+        :return: Array of rewards with the same shape as `indices`.
+        """
+        indices = np.asarray(indices)
+
+        if self.tape is not None:
+            rows = np.arange(self.tape_run, self.tape_run + indices.shape[-1])
+            return self.tape.data[rows, self.tape_step, indices]
+
+        flat = indices.ravel()
+        rewards = np.empty(flat.size, dtype=float)
+
+        # Group the pulls by arm so that every arm is sampled once. A stable sort on a narrow
+        # integer type is a linear-time radix sort in NumPy
+        keys = flat.astype(np.uint16) if len(self.arms) <= np.iinfo(np.uint16).max else flat
+        order = np.argsort(keys, kind='stable')
+        counts = np.bincount(flat, minlength=len(self.arms))
+        ends = np.cumsum(counts)
+        for arm_index in np.flatnonzero(counts):
+            end = ends[arm_index]
+            rewards[order[end - counts[arm_index]:end]] = self.arms[arm_index].sample(counts[arm_index], rng)
+
+        return rewards.reshape(indices.shape)
+
     def get_optimal_arm(self) -> int:
         """
         Identifies the arm with the highest expected reward.
@@ -68,6 +174,35 @@ class Bandit:
         rewards = [arm.get_expected_value() for arm in self.arms]
         return rewards
 
+    def expected_rewards_at(self, steps: np.ndarray) -> np.ndarray:
+        """
+        Returns the expected reward of every arm at the given time steps.
+
+        :param steps: Array of time steps.
+        :return: Array of shape (len(steps), k).
+        """
+        steps = np.asarray(steps)
+        return np.column_stack([np.broadcast_to(arm.get_expected_value(), steps.shape) if arm.stationary
+                                else arm.expected_value_at(steps) for arm in self.arms])
+
+    def optimal_path(self, steps: int, chunk_steps: int = 65536) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the optimal arm and its expected reward at each time step. For a stationary bandit
+        both are constant.
+
+        :param steps: Number of time steps.
+        :param chunk_steps: Number of time steps evaluated at once, which bounds the (chunk_steps, k) temporary array.
+        :return: Optimal arm and optimal expected reward per time step, both of shape (steps,).
+        """
+        optimal_arms = np.empty(steps, dtype=int)
+        optimal_rewards = np.empty(steps, dtype=float)
+        for start in range(0, steps, chunk_steps):
+            stop = min(start + chunk_steps, steps)
+            expected = self.expected_rewards_at(np.arange(start, stop))
+            optimal_arms[start:stop] = np.argmax(expected, axis=1)
+            optimal_rewards[start:stop] = expected[np.arange(stop - start), optimal_arms[start:stop]]
+        return optimal_arms, optimal_rewards
+
     def get_expected_value(self, numer_arm):
         return self.arms[numer_arm].get_expected_value()
 
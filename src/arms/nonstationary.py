@@ -0,0 +1,91 @@
+"""
+Module: arms/nonstationary.py
+Description: Contains the abstract class NonStationaryArm, an arm whose reward distribution changes over time.
+
+The current time step `t` is set by the bandit (Bandit.seek), so `pull`, `sample` and
+`get_expected_value` refer to that step. `sample_at` and `expected_value_at` take the time steps
+explicitly, e.g. to fill a reward tape or to compute the regret against the best arm at each step.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from abc import abstractmethod
+
+import numpy as np
+
+from arms.arm import Arm
+
+
+class NonStationaryArm(Arm):
+
+    stationary = False
+
+    def __init__(self, rng=None):
+        """
+        Initializes the random state of the arm at time step 0.
+
+        :param rng: Random generator (np.random.Generator). If None, the global numpy generator is used.
+        """
+        super().__init__(rng)
+        # Current time step, set by Bandit.seek
+        self.t = 0
+
+    @abstractmethod
+    def sample_at(self, t: np.ndarray, rng=None) -> np.ndarray:
+        """
+        Generates one reward for each time step in `t`.
+
+        :param t: Array of time steps.
+        :param rng: Random generator (np.random.Generator). If None, the generator of the arm is used.
+        :return: Array of rewards with the same shape as `t`.
+        """
+        raise NotImplementedError("This method must be implemented by the subclass.")
+
+    @abstractmethod
+    def expected_value_at(self, t: np.ndarray) -> np.ndarray:
+        """
+        Returns the expected reward of the arm at each time step in `t`.
+
+        :param t: Array of time steps.
+        :return: Array of expected rewards with the same shape as `t`.
+        """
+        raise NotImplementedError("This method must be implemented by the subclass.")
+
+    def sample(self, size, rng=None) -> np.ndarray:
+        """
+        Generates several rewards at once at the current time step.
+
+        :param size: Number or shape of the rewards to generate.
+        :param rng: Random generator (np.random.Generator). If None, the generator of the arm is used.
+        :return: Array of rewards with the requested shape.
+        """
+        return self.sample_at(np.full(size, self.t), rng)
+
+    def pull(self):
+        """
+        Generates a reward at the current time step. Rewards are not buffered because the
+        distribution may change from one step to the next.
+
+        :return: Reward obtained from the arm.
+        """
+        return self.sample_at(np.asarray(self.t))[()]
+
+    def reset(self):
+        """
+        Discards the buffered rewards and moves the arm back to time step 0.
+        """
+        super().reset()
+        self.t = 0
+
+    def get_expected_value(self) -> float:
+        """
+        Returns the expected reward of the arm at the current time step.
+        """
+        return float(self.expected_value_at(np.asarray(self.t)))
@@ -0,0 +1,120 @@
+"""
+Module: arms/reward_tape.py
+Description: Contains the RewardTape class, a pre-drawn (runs, steps, k) array of rewards for a bandit.
+
+Drawing rewards in bulk turns every pull into an array lookup. Tapes that do not fit in memory are
+backed by a np.memmap file.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import os
+import tempfile
+import weakref
+from typing import List, Optional
+
+import numpy as np
+
+from arms.arm import Arm
+
+
+class RewardTape:
+
+    # Tapes above this size (in bytes) are stored in a memory-mapped file
+    DEFAULT_MAX_MEMORY = 1 << 30
+
+    def __init__(self, arms: List[Arm], runs: int, steps: int, rng=None, chunk_steps: int = 256,
+                 max_memory: int = DEFAULT_MAX_MEMORY, path: Optional[str] = None, dtype=np.float64,
+                 first_step: int = 0):
+        """
+        Pre-draws the reward of every arm for every run and time step.
+
+        A tape may cover only a window of the experiment, from `first_step` to `first_step + steps`:
+        drawing consecutive windows with the same generator and chunk size gives the same rewards as
+        a single tape of the whole experiment, without holding all of it in memory.
+
+        :param arms: List of arms of the bandit, or an ArrayBandit, which draws the rewards of all its arms at once.
+        :param runs: Number of independent runs.
+        :param steps: Number of time steps per run.
+        :param rng: Random generator (np.random.Generator). If None, the global numpy generator is used.
+        :param chunk_steps: Number of time steps drawn at once.
+        :param max_memory: Maximum size in bytes of an in-memory tape. Larger tapes use np.memmap.
+        :param path: File used to store the tape. If given, the tape is always memory-mapped.
+        :param dtype: Data type of the stored rewards.
+        :param first_step: Time step of the first column of the tape (used by non-stationary arms).
+        """
+        assert runs > 0, "The number of runs must be greater than 0."
+        assert steps > 0, "The number of steps must be greater than 0."
+        assert chunk_steps > 0, "The chunk size must be greater than 0."
+        assert first_step >= 0, "The first step must be non-negative."
+
+        self.runs = runs
+        self.steps = steps
+        self.first_step = first_step
+        self.k = len(arms)
+        self.path = path
+
+        shape = (runs, steps, self.k)
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+        if path is None and nbytes <= max_memory:
+            self.data = np.empty(shape, dtype=dtype)
+        else:
+            if path is None:
+                fd, path = tempfile.mkstemp(suffix='.tape')
+                os.close(fd)
+                self.path = path
+                # The temporary file is removed once the tape is garbage collected
+                self._finalizer = weakref.finalize(self, _remove_file, path)
+            self.data = np.memmap(path, dtype=dtype, mode='w+', shape=shape)
+
+        rng = np.random if rng is None else rng
+        for start in range(0, steps, chunk_steps):
+            stop = min(start + chunk_steps, steps)
+            if isinstance(arms, list):
+                chunk = np.empty((runs, stop - start, self.k), dtype=dtype)
+                for index, arm in enumerate(arms):
+                    if arm.stationary:
+                        chunk[:, :, index] = arm.sample((runs, stop - start), rng)
+                    else:
+                        steps_grid = np.broadcast_to(np.arange(first_step + start, first_step + stop),
+                                                     (runs, stop - start))
+                        chunk[:, :, index] = arm.sample_at(steps_grid, rng)
+            else:
+                chunk = arms.sample((runs, stop - start), rng)
+            self.data[:, start:stop, :] = chunk
+
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+
+    def __getitem__(self, item):
+        """
+        Indexes the underlying (runs, steps, k) array.
+        """
+        return self.data[item]
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    def __str__(self):
+        """
+        String representation of the tape.
+        """
+        storage = f"memmap at {self.path}" if isinstance(self.data, np.memmap) else "in memory"
+        window = f", first_step={self.first_step}" if self.first_step else ""
+        return f"RewardTape(runs={self.runs}, steps={self.steps}{window}, k={self.k}, {storage})"
+
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
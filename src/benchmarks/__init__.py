@@ -0,0 +1,22 @@
+"""
+Module: benchmarks/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete benchmarks.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+# Importación de módulos o clases
+from .suite import run_suite, measure, find_regressions, load_history, append_history, missing_benchmarks
+from .scaling import scaling_report, format_report
+from .import_time import import_time, import_report, check_simulation_path
+
+# Lista de módulos o clases públicas
+__all__ = ['run_suite', 'measure', 'find_regressions', 'load_history', 'append_history', 'missing_benchmarks',
+           'scaling_report', 'format_report', 'import_time', 'import_report', 'check_simulation_path']
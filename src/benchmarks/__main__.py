@@ -0,0 +1,94 @@
+"""
+Module: benchmarks/__main__.py
+Description: Punto de entrada de `python -m benchmarks` (desde src/): ejecuta la suite, actualiza el
+historial (por defecto, benchmark_history.json en el directorio de trabajo) y termina con código 1
+si hay regresiones.
+
+    python -m benchmarks --quick
+    python -m benchmarks --filter UCB1 --threshold 0.1
+    python -m benchmarks --scaling
+    python -m benchmarks --imports
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks.import_time import IMPORT_BUDGET, check_simulation_path, import_report
+from benchmarks.scaling import format_report, scaling_report
+from benchmarks.suite import (EXPERIMENT_SHAPES, K_VALUES, QUICK_EXPERIMENT_SHAPES, QUICK_K_VALUES,
+                              append_history, find_regressions, load_history, missing_benchmarks, run_suite)
+
+# El historial depende de la máquina, por lo que se guarda en el directorio de trabajo y no en el paquete
+DEFAULT_HISTORY = 'benchmark_history.json'
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ejecuta los benchmarks y devuelve el código de salida (1 si alguno empeora más que el umbral).
+    """
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de algoritmos, brazos y run_experiment.")
+    parser.add_argument('--quick', action='store_true', help="Matriz reducida de k y formas de experimento.")
+    parser.add_argument('--k', type=int, nargs='+', help="Números de brazos (sustituye a los de la matriz).")
+    parser.add_argument('--filter', help="Ejecutar sólo los benchmarks cuyo nombre contiene este texto.")
+    parser.add_argument('--backend', default='numpy', choices=('numpy', 'numba'), help="Backend de run_experiment.")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Tiempo mínimo (s) de cada intento.")
+    parser.add_argument('--repeat', type=int, default=3, help="Intentos por benchmark (se toma el mejor).")
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help="Fichero JSON con el historial de resultados.")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Pérdida relativa tolerada antes de fallar.")
+    parser.add_argument('--label', default='', help="Etiqueta de la entrada del historial (por ejemplo, el commit).")
+    parser.add_argument('--no-save', action='store_true', help="No añadir los resultados al historial.")
+    parser.add_argument('--scaling', action='store_true', help="Mostrar sólo el informe de throughput frente a k.")
+    parser.add_argument('--imports', action='store_true',
+                        help="Medir sólo el arranque en frío y comprobar el presupuesto de la ruta de simulación.")
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET,
+                        help="Presupuesto (s) del arranque en frío de la ruta de simulación.")
+    args = parser.parse_args(argv)
+
+    ks = args.k or (QUICK_K_VALUES if args.quick else K_VALUES)
+
+    if args.scaling:
+        print(format_report(scaling_report(ks, backend=args.backend)))
+        return 0
+
+    if args.imports:
+        for name, elapsed in import_report().items():
+            print(f"{name:40s} {elapsed * 1e3:8.1f} ms")
+        failures = check_simulation_path(args.import_budget)
+        for failure in failures:
+            print(failure)
+        return 1 if failures else 0
+
+    missing = missing_benchmarks()
+    if missing:
+        print(f"Sin benchmark registrado: {', '.join(missing)}")
+
+    def report(name, result):
+        print(f"{name:60s} {result['ops_per_sec']:12.4g} ops/s {result['peak_bytes'] / 2**20:10.2f} MiB", flush=True)
+
+    shapes = QUICK_EXPERIMENT_SHAPES if args.quick else EXPERIMENT_SHAPES
+    results = run_suite(ks, shapes, args.backend, args.filter, args.min_time, args.repeat, report)
+
+    regressions = find_regressions(results, load_history(args.history), args.threshold)
+    if not args.no_save:
+        append_history(args.history, results, args.label)
+
+    if regressions:
+        print(f"\n{len(regressions)} regresiones por encima del {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
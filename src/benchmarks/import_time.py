@@ -0,0 +1,95 @@
+"""
+Module: benchmarks/import_time.py
+Description: Tiempo de arranque en frío de los paquetes y presupuesto de la ruta de simulación.
+
+Cada medida lanza un intérprete nuevo que ejecuta las importaciones, toma el mejor de varios
+intentos y le resta el arranque de un intérprete vacío. Además se comprueba que la ruta de
+simulación no carga módulos pesados (matplotlib, seaborn, numba) que sólo se usan al dibujar o con
+el backend compilado.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Directorio src/, desde el que se importan los paquetes del proyecto
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Importaciones de un proceso que sólo simula (por ejemplo, un trabajador de run_experiment_parallel)
+SIMULATION_PATH = ("from simulation import run_experiment\n"
+                   "from algorithms import EpsilonGreedy, UCB1\n"
+                   "from arms import ArmNormal, Bandit")
+
+STATEMENTS = {
+    'simulation path': SIMULATION_PATH,
+    'import algorithms': 'import algorithms',
+    'import arms': 'import arms',
+    'import simulation': 'import simulation',
+    'import plotting': 'import plotting',
+    'from plotting import plot_regret': 'from plotting import plot_regret',
+}
+
+# Presupuesto (s) del arranque en frío de la ruta de simulación, sin contar el del intérprete
+IMPORT_BUDGET = 0.5
+# Módulos que la ruta de simulación no debe cargar
+HEAVY_MODULES = ('matplotlib', 'seaborn', 'numba')
+
+
+def _run(statement: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', statement], cwd=SOURCE_DIR, check=True)
+    return time.perf_counter() - start
+
+
+def import_time(statement: str, repeat: int = 5) -> float:
+    """
+    Devuelve el tiempo (s) que tarda un intérprete nuevo en ejecutar `statement`, descontando el
+    arranque del intérprete vacío (el mejor de `repeat` intentos de cada uno).
+    """
+    baseline = min(_run('pass') for _ in range(repeat))
+    return max(0.0, min(_run(statement) for _ in range(repeat)) - baseline)
+
+
+def loaded_modules(statement: str, modules=HEAVY_MODULES) -> List[str]:
+    """
+    Devuelve cuáles de `modules` quedan cargados tras ejecutar `statement` en un intérprete nuevo.
+    """
+    check = f"{statement}\nimport sys\nprint(' '.join(m for m in {tuple(modules)!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, '-c', check], cwd=SOURCE_DIR, check=True,
+                            capture_output=True, text=True).stdout
+    return output.split()
+
+
+def import_report(repeat: int = 5) -> Dict[str, float]:
+    """
+    Mide el arranque en frío de cada importación de STATEMENTS.
+    """
+    return {name: import_time(statement, repeat) for name, statement in STATEMENTS.items()}
+
+
+def check_simulation_path(budget: float = IMPORT_BUDGET, repeat: int = 5) -> List[str]:
+    """
+    Comprueba que la ruta de simulación arranca dentro del presupuesto y sin módulos pesados.
+
+    :return: Descripción de cada incumplimiento (vacía si todo está bien).
+    """
+    failures = []
+    elapsed = import_time(SIMULATION_PATH, repeat)
+    if elapsed > budget:
+        failures.append(f"La ruta de simulación tarda {elapsed * 1e3:.0f} ms en importarse "
+                        f"(presupuesto {budget * 1e3:.0f} ms).")
+    heavy = loaded_modules(SIMULATION_PATH)
+    if heavy:
+        failures.append(f"La ruta de simulación carga módulos pesados: {', '.join(heavy)}.")
+    return failures
@@ -0,0 +1,69 @@
+"""
+Module: benchmarks/scaling.py
+Description: Informe de escalabilidad: throughput de run_experiment en función del número de brazos.
+
+Para cada k se simula cada algoritmo por separado con el mismo número de pasos y se mide el número
+de decisiones (pasos x ejecuciones) por segundo. Las ejecuciones se reducen para k grandes de modo
+que las matrices de estado (runs, k) no superen un número fijo de celdas.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import time
+from typing import Dict, Sequence
+
+import numpy as np
+
+from benchmarks.suite import ALGORITHMS, K_VALUES, MAX_EXPERIMENT_CELLS, bandit_family, make_bandit
+from simulation import run_experiment
+
+
+def scaling_report(ks: Sequence[int] = K_VALUES, steps: int = 200, runs: int = 100,
+                   backend: str = 'numpy') -> Dict[str, Dict[int, float]]:
+    """
+    Mide las decisiones por segundo de run_experiment para cada algoritmo y número de brazos.
+
+    Las variantes indexadas usan la misma versión vectorizada que las normales en run_experiment,
+    por lo que sólo se mide una de cada.
+
+    :param ks: Números de brazos.
+    :param steps: Pasos de tiempo por ejecución.
+    :param runs: Ejecuciones por experimento (se reducen si runs * k supera MAX_EXPERIMENT_CELLS).
+    :param backend: Backend de run_experiment.
+    :return: Decisiones por segundo indexadas por algoritmo y k.
+    """
+    names = [name for name in ALGORITHMS if not name.endswith('[indexed]')]
+    report = {name: {} for name in names}
+    for k in ks:
+        bandits = {}
+        k_runs = max(1, min(runs, MAX_EXPERIMENT_CELLS // k))
+        for name in names:
+            family = bandit_family(name)
+            if family not in bandits:
+                bandits[family] = make_bandit(k, np.random.default_rng(0), family)
+            bandit = bandits[family]
+            algorithm = ALGORITHMS[name](k, None)
+            start = time.perf_counter()
+            run_experiment(bandit, [algorithm], steps, k_runs, seed=0, backend=backend)
+            report[name][k] = steps * k_runs / (time.perf_counter() - start)
+    return report
+
+
+def format_report(report: Dict[str, Dict[int, float]]) -> str:
+    """
+    Da formato de tabla al informe de escalabilidad: una fila por k y una columna por algoritmo.
+    """
+    names = list(report)
+    ks = sorted({k for values in report.values() for k in values})
+    width = max(len(name) for name in names) + 2
+    lines = ['k'.rjust(9) + ''.join(name.rjust(width) for name in names)]
+    for k in ks:
+        lines.append(f'{k:9d}' + ''.join(f'{report[name][k]:{width}.3g}' for name in names))
+    return '\n'.join(lines)
@@ -0,0 +1,352 @@
+"""
+Module: benchmarks/suite.py
+Description: Micro-benchmarks de los algoritmos, los brazos y run_experiment con historial de resultados.
+
+Cada benchmark mide las operaciones por segundo (el mejor de varios intentos de al menos `min_time`
+segundos) y el pico de memoria reservada al crear su estado y ejecutarlo una vez (tracemalloc, que
+también registra las reservas de NumPy). Los resultados se añaden a un historial JSON y se comparan
+con la mediana de las últimas entradas para detectar regresiones.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import inspect
+import json
+import os
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from algorithms import (Algorithm, DiscountedUCB, EpsilonGreedy, GradientePreferencias, SlidingWindowUCB, Softmax,
+                        ThompsonSampling, UCB1, UCB2)
+from arms import (Arm, ArmBernoulli, ArmBernoulliDrifting, ArmBinomial, ArmNormal, ArmNormalDrifting, ArmSwitching,
+                  Bandit)
+from simulation import run_experiment
+
+# Un benchmark prepara su estado y devuelve una función y el número de operaciones que hace cada llamada
+Setup = Callable[[], Tuple[Callable[[], None], int]]
+
+K_VALUES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+QUICK_K_VALUES = (10, 1_000)
+# Formas (steps, runs) de los experimentos completos
+EXPERIMENT_SHAPES = ((1_000, 100), (100, 1_000))
+QUICK_EXPERIMENT_SHAPES = ((200, 50),)
+# Límite de runs * k de los experimentos completos, para que las matrices (runs, k) quepan en memoria
+MAX_EXPERIMENT_CELLS = 10_000_000
+# Operaciones de cada llamada en los benchmarks de una sola decisión (menos para k grandes, donde
+# las operaciones O(k) tardan milisegundos)
+OPS_PER_CALL = 100
+
+
+def _ops_per_call(k: int) -> int:
+    return max(1, min(OPS_PER_CALL, 100_000 // k))
+
+
+ALGORITHMS: Dict[str, Callable[[int, np.random.Generator], Algorithm]] = {
+    'EpsilonGreedy': lambda k, rng: EpsilonGreedy(k, epsilon=0.1, rng=rng),
+    'EpsilonGreedy[indexed]': lambda k, rng: EpsilonGreedy(k, epsilon=0.1, rng=rng, indexed=True),
+    'Softmax': lambda k, rng: Softmax(k, tau=0.5, rng=rng),
+    'Softmax[indexed]': lambda k, rng: Softmax(k, tau=0.5, rng=rng, indexed=True),
+    'UCB1': lambda k, rng: UCB1(k, rng=rng),
+    'UCB1[indexed]': lambda k, rng: UCB1(k, rng=rng, indexed=True),
+    'UCB2': lambda k, rng: UCB2(k, alpha=0.5, rng=rng),
+    'GradientePreferencias': lambda k, rng: GradientePreferencias(k, alpha=0.1, rng=rng),
+    'DiscountedUCB': lambda k, rng: DiscountedUCB(k, gamma=0.99, rng=rng),
+    'SlidingWindowUCB': lambda k, rng: SlidingWindowUCB(k, window=1000, rng=rng),
+    'ThompsonSampling': lambda k, rng: ThompsonSampling(k, family='normal', rng=rng),
+    'ThompsonSampling[bernoulli]': lambda k, rng: ThompsonSampling(k, family='bernoulli', rng=rng),
+}
+
+ARMS: Dict[str, Callable[[np.random.Generator], Arm]] = {
+    'ArmNormal': lambda rng: ArmNormal(5.0, 1.0, rng=rng),
+    'ArmBernoulli': lambda rng: ArmBernoulli(0.5, rng=rng),
+    'ArmBinomial': lambda rng: ArmBinomial(10, 0.5, rng=rng),
+    'ArmNormalDrifting': lambda rng: ArmNormalDrifting(5.0, 1.0, amplitude=1.0, period=1000, rng=rng),
+    'ArmBernoulliDrifting': lambda rng: ArmBernoulliDrifting(0.5, amplitude=0.2, period=1000, rng=rng),
+    'ArmSwitching': lambda rng: ArmSwitching([ArmNormal(5.0, 1.0, rng=rng), ArmNormal(4.0, 1.0, rng=rng)], [500], rng=rng),
+}
+
+# Familia de brazos del bandit de los experimentos de cada algoritmo (por defecto 'normal'): los
+# posteriores Beta sólo admiten recompensas en [0, 1]
+BANDIT_FAMILIES: Dict[str, str] = {
+    'ThompsonSampling[bernoulli]': 'bernoulli',
+}
+
+
+def _subclasses(cls: type) -> List[type]:
+    found = []
+    for subclass in cls.__subclasses__():
+        found.append(subclass)
+        found.extend(_subclasses(subclass))
+    return found
+
+
+def missing_benchmarks() -> List[str]:
+    """
+    Devuelve los nombres de las subclases (no abstractas) de Algorithm y Arm que no tienen benchmark registrado.
+    """
+    rng = np.random.default_rng(0)
+    covered = {type(factory(10, rng)) for factory in ALGORITHMS.values()}
+    covered |= {type(factory(rng)) for factory in ARMS.values()}
+    return sorted(cls.__name__ for cls in _subclasses(Algorithm) + _subclasses(Arm)
+                  if cls not in covered and not inspect.isabstract(cls))
+
+
+def make_bandit(k: int, rng: np.random.Generator, family: str = 'normal') -> Bandit:
+    """
+    Construye un bandit de k brazos normales con medias uniformes en [1, 10], o de k brazos de
+    Bernoulli con probabilidades uniformes en [0.05, 0.95] si family es 'bernoulli'.
+
+    No se usa ArmNormal.generate_arms porque exige medias distintas con dos decimales y no admite
+    más de 900 brazos.
+    """
+    assert family in ('normal', 'bernoulli'), "La familia de brazos debe ser 'normal' o 'bernoulli'."
+    if family == 'bernoulli':
+        return Bandit(arms=[ArmBernoulli(p, rng=rng) for p in rng.uniform(0.05, 0.95, k)])
+    return Bandit(arms=[ArmNormal(mu, 1.0, rng=rng) for mu in rng.uniform(1, 10, k)])
+
+
+def bandit_family(name: str) -> str:
+    """
+    Devuelve la familia de brazos del bandit con el que se ejecutan los experimentos del algoritmo.
+    """
+    return BANDIT_FAMILIES.get(name, 'normal')
+
+
+def _warm_algorithm(name: str, k: int) -> Algorithm:
+    """
+    Crea el algoritmo y le da una recompensa por brazo, para medir el régimen estacionario y no la
+    fase inicial en la que se recorren los brazos sin elegir.
+    """
+    rng = np.random.default_rng(0)
+    algo = ALGORITHMS[name](k, rng)
+    algo.update_batch(np.arange(k), rng.random(k))
+    return algo
+
+
+def _select_setup(name: str, k: int) -> Setup:
+    def setup():
+        algo = _warm_algorithm(name, k)
+        n = _ops_per_call(k)
+
+        def op():
+            for _ in range(n):
+                algo.select_arm()
+        return op, n
+    return setup
+
+
+def _update_setup(name: str, k: int) -> Setup:
+    def setup():
+        algo = _warm_algorithm(name, k)
+        rng = np.random.default_rng(1)
+        n = _ops_per_call(k)
+        arms = rng.integers(0, k, n).tolist()
+        rewards = rng.random(n).tolist()
+
+        def op():
+            for arm, reward in zip(arms, rewards):
+                algo.update(arm, reward)
+        return op, n
+    return setup
+
+
+def _pull_setup(name: str) -> Setup:
+    def setup():
+        arm = ARMS[name](np.random.default_rng(0))
+
+        def op():
+            for _ in range(OPS_PER_CALL):
+                arm.pull()
+        return op, OPS_PER_CALL
+    return setup
+
+
+def _sample_setup(name: str, size: int = 100_000) -> Setup:
+    def setup():
+        arm = ARMS[name](np.random.default_rng(0))
+        return lambda: arm.sample(size), size
+    return setup
+
+
+def _pull_arms_setup(k: int, runs: int = 1_000) -> Setup:
+    def setup():
+        rng = np.random.default_rng(0)
+        bandit = make_bandit(k, rng)
+        indices = rng.integers(0, k, runs)
+        return lambda: bandit.pull_arms(indices, rng), runs
+    return setup
+
+
+def _experiment_setup(k: int, steps: int, runs: int, backend: str) -> Setup:
+    def setup():
+        # Un experimento por familia de brazos, cada uno con los algoritmos que la admiten
+        groups = {}
+        for name, factory in ALGORITHMS.items():
+            groups.setdefault(bandit_family(name), []).append(factory(k, None))
+        experiments = [(make_bandit(k, np.random.default_rng(0), family), algorithms)
+                       for family, algorithms in groups.items()]
+
+        # Con el mismo bandit y algoritmos cada llamada repite la misma simulación
+        def op():
+            for bandit, algorithms in experiments:
+                run_experiment(bandit, algorithms, steps, runs, seed=0, backend=backend)
+        return op, steps * runs * len(ALGORITHMS)
+    return setup
+
+
+def benchmarks(ks: Sequence[int] = K_VALUES, shapes: Sequence[Tuple[int, int]] = EXPERIMENT_SHAPES,
+               backend: str = 'numpy') -> Iterator[Tuple[str, Setup]]:
+    """
+    Genera los benchmarks de la matriz: select_arm y update de cada algoritmo, pull y sample de cada
+    brazo, Bandit.pull_arms y run_experiment para cada k y cada forma (steps, runs).
+
+    :param ks: Números de brazos.
+    :param shapes: Formas (steps, runs) de los experimentos completos.
+    :param backend: Backend de run_experiment.
+    :return: Pares (nombre, preparación) en un orden estable.
+    """
+    for name in ARMS:
+        yield f'{name}.pull', _pull_setup(name)
+        yield f'{name}.sample', _sample_setup(name)
+    for k in ks:
+        for name in ALGORITHMS:
+            yield f'{name}.select_arm[k={k}]', _select_setup(name, k)
+            yield f'{name}.update[k={k}]', _update_setup(name, k)
+        yield f'Bandit.pull_arms[k={k}]', _pull_arms_setup(k)
+        for steps, runs in shapes:
+            if k * runs <= MAX_EXPERIMENT_CELLS:
+                yield f'run_experiment[k={k},steps={steps},runs={runs}]', _experiment_setup(k, steps, runs, backend)
+
+
+def measure(setup: Setup, min_time: float = 0.2, repeat: int = 3) -> Dict[str, float]:
+    """
+    Mide un benchmark.
+
+    :param setup: Preparación del benchmark.
+    :param min_time: Tiempo mínimo (s) de cada intento.
+    :param repeat: Número de intentos; se toma el más rápido.
+    :return: Operaciones por segundo y pico de memoria (bytes) de la preparación y una llamada.
+    """
+    tracemalloc.start()
+    try:
+        op, ops = setup()
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    op, ops = setup()
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            op()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, calls * ops / elapsed)
+    return {'ops_per_sec': best, 'peak_bytes': peak}
+
+
+def run_suite(ks: Sequence[int] = K_VALUES, shapes: Sequence[Tuple[int, int]] = EXPERIMENT_SHAPES,
+              backend: str = 'numpy', pattern: Optional[str] = None, min_time: float = 0.2,
+              repeat: int = 3, report: Optional[Callable[[str, Dict[str, float]], None]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Ejecuta los benchmarks de la matriz.
+
+    :param ks: Números de brazos.
+    :param shapes: Formas (steps, runs) de los experimentos completos.
+    :param backend: Backend de run_experiment.
+    :param pattern: Si se indica, sólo se ejecutan los benchmarks cuyo nombre lo contiene.
+    :param min_time: Tiempo mínimo (s) de cada intento.
+    :param repeat: Número de intentos por benchmark.
+    :param report: Función opcional a la que se pasa cada resultado según se obtiene.
+    :return: Resultados por nombre de benchmark.
+    """
+    results = {}
+    for name, setup in benchmarks(ks, shapes, backend):
+        if pattern is not None and pattern not in name:
+            continue
+        results[name] = measure(setup, min_time, repeat)
+        if report is not None:
+            report(name, results[name])
+    return results
+
+
+def load_history(path: str) -> List[Dict]:
+    """
+    Carga el historial de resultados (lista de entradas) o una lista vacía si no existe.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path) as file:
+        return json.load(file)
+
+
+def append_history(path: str, results: Dict[str, Dict[str, float]], label: str = '') -> Dict:
+    """
+    Añade una entrada con los resultados, la fecha y la versión de Python y NumPy al historial.
+
+    :return: Entrada añadida.
+    """
+    history = load_history(path)
+    entry = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'label': label,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    }
+    history.append(entry)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Se escribe en un temporal y se renombra para no dejar el historial a medias
+    with open(path + '.tmp', 'w') as file:
+        json.dump(history, file, indent=1)
+    os.replace(path + '.tmp', path)
+    return entry
+
+
+def find_regressions(results: Dict[str, Dict[str, float]], history: List[Dict], threshold: float = 0.2,
+                     window: int = 5) -> List[str]:
+    """
+    Compara los resultados con la mediana de las últimas `window` entradas del historial que tienen
+    el mismo benchmark. Usar la mediana evita que una medida ruidosa, o una regresión ya registrada,
+    se convierta en la referencia.
+
+    :param results: Resultados actuales.
+    :param history: Historial previo.
+    :param threshold: Pérdida relativa tolerada (0.2 = 20% menos operaciones por segundo o 20% más memoria).
+    :param window: Número de entradas previas que forman la referencia.
+    :return: Descripción de cada regresión.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = [entry['results'][name] for entry in history if name in entry['results']][-window:]
+        if not previous:
+            continue
+        ops = float(np.median([p['ops_per_sec'] for p in previous]))
+        peak = float(np.median([p['peak_bytes'] for p in previous]))
+        if current['ops_per_sec'] < ops * (1 - threshold):
+            regressions.append(f"{name}: {current['ops_per_sec']:.4g} ops/s frente a {ops:.4g} "
+                               f"({current['ops_per_sec'] / ops - 1:+.0%})")
+        if current['peak_bytes'] > peak * (1 + threshold) and current['peak_bytes'] - peak > 64 * 1024:
+            regressions.append(f"{name}: pico de {current['peak_bytes'] / 2**20:.2f} MiB frente a "
+                               f"{peak / 2**20:.2f} MiB ({current['peak_bytes'] / peak - 1:+.0%})")
+    return regressions
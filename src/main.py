@@ -14,70 +14,12 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-from typing import List
-
 import numpy as np
 
-from algorithms import Algorithm, EpsilonGreedy
+from algorithms import EpsilonGreedy
 from arms import ArmNormal, Bandit
 from plotting import plot_average_rewards, plot_optimal_selections
-
-
-def run_experiment(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int):
-    """
-    Ejecuta experimentos comparativos entre diferentes algoritmos.
-
-    :param bandit: Instancia de Bandit configurada para el experimento.
-    :param algorithms: Lista de instancias de algoritmos a comparar.
-    :param steps: Número de pasos de tiempo por ejecución.
-    :param runs: Número de ejecuciones independientes.
-    :return: Tuple de tres elementos: recompensas promedio, porcentaje de selecciones óptimas, y estadísticas de brazos.
-    :rtype: Tuple of (np.ndarray, np.ndarray, list)
-    """
-
-    k = bandit.k
-    optimal_arm = bandit.optimal_arm
-
-    # Inicializar matrices para recompensas y selecciones óptimas
-    rewards = np.zeros((len(algorithms), steps))
-    optimal_selections = np.zeros((len(algorithms), steps))
-
-
-    for run in range(runs):
-        # Crear una nueva instancia del bandit para cada ejecución
-        current_bandit = Bandit(arms=bandit.arms)
-
-        # Obtener la recompensa esperada óptima
-        q_max = current_bandit.get_expected_value(current_bandit.optimal_arm)
-
-        for algo in algorithms:
-            algo.reset()
-
-        # Inicializar recompensas acumuladas por algoritmo para esta ejecución
-        total_rewards_per_algo = np.zeros(len(algorithms))  # Para análisis por rechazo
-
-        # Inicializar recompensas acumuladas por algoritmo para esta ejecución
-        # cumulative_rewards_per_algo = np.zeros(len(algorithms))
-
-        for step in range(steps):
-            for idx, algo in enumerate(algorithms):
-                chosen_arm = algo.select_arm()
-                reward = current_bandit.pull_arm(chosen_arm)
-                algo.update(chosen_arm, reward)
-
-                rewards[idx, step] += reward
-                total_rewards_per_algo[idx] += reward
-
-                if chosen_arm == optimal_arm:
-                    optimal_selections[idx, step] += 1
-
-    # Promediar las recompensas y el regret sobre todas las ejecuciones
-    rewards /= runs
-    optimal_selections = (optimal_selections / runs) * 100
-
-    return rewards, optimal_selections
-
-
+from simulation import run_experiment
 
 
 def main():
@@ -102,7 +44,7 @@ def main():
     algorithms = [EpsilonGreedy(k=k, epsilon=0), EpsilonGreedy(k=k, epsilon=0.01), EpsilonGreedy(k=k, epsilon=0.1)]
 
     # Ejecutar el experimento y obtener las recompensas promedio y selecciones óptimas
-    rewards, optimal_selections = run_experiment(bandit, algorithms, steps, runs)
+    rewards, optimal_selections, regrets, arm_counts, arm_avg_rewards = run_experiment(bandit, algorithms, steps, runs, seed)
 
     # Generar las gráficas utilizando las funciones externas
     plot_average_rewards(steps, rewards, algorithms)
@@ -12,9 +12,39 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-# Importación de módulos o clases
-from .plotting import plot_average_rewards, plot_optimal_selections, plot_regret, plot_arm_statistics
+import importlib
+from typing import TYPE_CHECKING
+
+# Importación de módulos o clases. Se difiere hasta el primer uso de cada nombre (PEP 562) para que
+# importar el paquete no cargue los módulos que no se van a usar
+_LAZY_IMPORTS = {
+    'plot_average_rewards': '.plotting',
+    'plot_optimal_selections': '.plotting',
+    'plot_regret': '.plotting',
+    'plot_arm_statistics': '.plotting',
+    'decimate': '.decimation',
+    'lttb': '.decimation',
+    'minmax': '.decimation',
+    'render_figures': '.render',
+    'use_headless': '.render',
+}
+
+if TYPE_CHECKING:
+    from .plotting import plot_average_rewards, plot_optimal_selections, plot_regret, plot_arm_statistics
+    from .decimation import decimate, lttb, minmax
+    from .render import render_figures, use_headless
 
 # Lista de módulos o clases públicas
-__all__ = ['plot_average_rewards', 'plot_optimal_selections', 'plot_regret', 'plot_arm_statistics']
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,129 @@
+"""
+Module: plotting/decimation.py
+Description: Reducción del número de puntos de una serie antes de dibujarla.
+
+Con horizontes de millones de pasos dibujar todos los puntos es más lento que la propia simulación
+y no cambia la gráfica: la pantalla o el fichero sólo tienen unos pocos miles de píxeles de ancho.
+Se ofrecen dos métodos:
+
+- LTTB (Largest-Triangle-Three-Buckets, Steinarsson 2013): elige en cada tramo el punto que forma
+  el triángulo de mayor área con el punto elegido en el tramo anterior y la media del siguiente.
+  Conserva la forma visual de la curva.
+- min/max: conserva el mínimo y el máximo de cada tramo, por lo que ningún pico desaparece.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+METHODS = ('lttb', 'minmax')
+
+
+def lttb(y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una serie (x = 0, 1, ..., n - 1) a `n_out` puntos con LTTB.
+
+    :param y: Valores de la serie.
+    :param n_out: Número de puntos de salida (al menos 3).
+    :return: Índices (x) de los puntos elegidos, en orden, y sus valores.
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n), y
+
+    # El primer y el último punto se conservan; los n - 2 intermedios se reparten en n_out - 2 tramos
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    starts, stops = edges[:-1], edges[1:]
+    # Media de cada tramo, y el último punto como "tramo siguiente" del último
+    next_x = np.append((starts[1:] + stops[1:] - 1) / 2, n - 1)
+    next_y = np.append(np.add.reduceat(y[:n - 1], starts)[1:] / (stops[1:] - starts[1:]), y[-1])
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i, (start, stop) in enumerate(zip(starts, stops)):
+        x = np.arange(start, stop)
+        # El doble del área del triángulo (a, punto candidato, media del tramo siguiente)
+        area = np.abs((a - next_x[i]) * (y[start:stop] - y[a]) - (a - x) * (next_y[i] - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected, y[selected]
+
+
+def _bucket_matrix(y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, int]:
+    """
+    Devuelve la serie como matriz (tramos, ancho), rellenando el último tramo con el último valor, y el ancho.
+    """
+    width = -(-y.size // n_buckets)
+    padded = np.pad(y, (0, n_buckets * width - y.size), mode='edge')
+    return padded.reshape(n_buckets, width), width
+
+
+def minmax(y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una serie a unos `n_out` puntos conservando el mínimo y el máximo de cada tramo.
+
+    :param y: Valores de la serie.
+    :param n_out: Número aproximado de puntos de salida (dos por tramo, más los extremos).
+    :return: Índices (x) de los puntos elegidos, en orden, y sus valores.
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    n_buckets = n_out // 2
+    if n_out >= n or n_buckets < 1:
+        return np.arange(n), y
+
+    matrix, width = _bucket_matrix(y, n_buckets)
+    offsets = np.arange(n_buckets) * width
+    indices = np.concatenate(([0], offsets + np.argmin(matrix, axis=1), offsets + np.argmax(matrix, axis=1), [n - 1]))
+    indices = np.unique(np.minimum(indices, n - 1))
+    return indices, y[indices]
+
+
+def decimate(y: np.ndarray, max_points: Optional[int], method: str = 'lttb') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una serie a `max_points` puntos como mucho con el método indicado.
+
+    :param y: Valores de la serie.
+    :param max_points: Número máximo de puntos o None para no reducir.
+    :param method: 'lttb' o 'minmax'.
+    :return: Índices (x) de los puntos elegidos y sus valores.
+    """
+    assert method in METHODS, f"El método de reducción debe ser uno de {METHODS}."
+
+    if max_points is None:
+        return np.arange(np.size(y)), np.asarray(y)
+    return lttb(y, max_points) if method == 'lttb' else minmax(y, max_points)
+
+
+def decimate_band(lower: np.ndarray, upper: np.ndarray,
+                  max_points: Optional[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduce una banda (inferior, superior) tomando en cada tramo el mínimo del límite inferior y el
+    máximo del superior, de modo que la banda reducida contiene a la original.
+
+    :param lower: Límite inferior por paso.
+    :param upper: Límite superior por paso.
+    :param max_points: Número máximo de puntos o None para no reducir.
+    :return: Pasos (x), límite inferior y límite superior, con dos puntos por tramo (inicio y fin).
+    """
+    n = np.size(lower)
+    if max_points is None or max_points >= n or max_points < 2:
+        return np.arange(n), np.asarray(lower), np.asarray(upper)
+
+    n_buckets = max_points // 2
+    lower_matrix, width = _bucket_matrix(np.asarray(lower, dtype=float), n_buckets)
+    upper_matrix, _ = _bucket_matrix(np.asarray(upper, dtype=float), n_buckets)
+    starts = np.arange(n_buckets) * width
+    x = np.minimum(np.column_stack((starts, starts + width - 1)).ravel(), n - 1)
+    return x, np.repeat(lower_matrix.min(axis=1), 2), np.repeat(upper_matrix.max(axis=1), 2)
@@ -2,6 +2,9 @@
 Module: plotting/plotting.py
 Description: Contiene funciones para generar gráficas de comparación de algoritmos.
 
+Matplotlib y seaborn se importan dentro de cada función, la primera vez que se dibuja, para que
+importar el paquete (por ejemplo, en los procesos de simulación) no pague su tiempo de carga.
+
 Author: Luis Daniel Hernández Molinero
 Email: ldaniel@um.es
 Date: 2025/01/29
@@ -12,13 +15,13 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 
-from algorithms import Algorithm, EpsilonGreedy, Softmax, UCB1, UCB2, GradientePreferencias
+from algorithms import (Algorithm, EpsilonGreedy, Softmax, UCB1, UCB2, GradientePreferencias, DiscountedUCB,
+                        SlidingWindowUCB, ThompsonSampling)
+from plotting.decimation import decimate, decimate_band
 
 
 def get_algorithm_label(algo: Algorithm) -> str:
@@ -35,105 +38,206 @@ def get_algorithm_label(algo: Algorithm) -> str:
         label += f" (epsilon={algo.epsilon})"
     elif isinstance(algo, Softmax):
         label += f" (tau={algo.tau})"
+    elif isinstance(algo, DiscountedUCB):
+        label += f" (gamma={algo.gamma})"
+    elif isinstance(algo, SlidingWindowUCB):
+        label += f" (window={algo.window})"
     elif isinstance(algo, UCB1):
         label += ""
     elif isinstance(algo, UCB2):
         label += f" (alpha={algo.alpha})"
     elif isinstance(algo, GradientePreferencias):
         label += f" (alpha={algo.alpha}, initial_preference={algo.initial_preference})"
+    elif isinstance(algo, ThompsonSampling):
+        label += f" ({algo.family})"
     else:
         raise ValueError("El algoritmo debe ser de la clase Algorithm o una subclase.")
     return label
 
 
-def plot_average_rewards(steps: int, rewards: np.ndarray, algorithms: List[Algorithm]):
+def plot_confidence_band(steps: int, confidence: Tuple[np.ndarray, np.ndarray], idx: int, color,
+                         max_points: Optional[int] = None):
+    """
+    Dibuja la banda de confianza de un algoritmo sobre la figura actual.
+
+    :param steps: Número de pasos de tiempo.
+    :param confidence: Tupla (inferior, superior) de matrices con un intervalo por algoritmo y paso.
+    :param idx: Índice del algoritmo.
+    :param color: Color de la línea del algoritmo.
+    :param max_points: Número máximo de puntos de la banda (None para dibujar todos los pasos).
+    """
+    import matplotlib.pyplot as plt
+
+    lower, upper = confidence
+    x, lower, upper = decimate_band(lower[idx][:steps], upper[idx][:steps], max_points)
+    plt.fill_between(x, lower, upper, color=color, alpha=0.2, linewidth=0)
+
+
+def plot_series(steps: int, values: np.ndarray, label: str, max_points: Optional[int] = None, method: str = 'lttb'):
+    """
+    Dibuja la serie de un algoritmo sobre la figura actual, reducida a `max_points` puntos si se indica.
+
+    :param steps: Número de pasos de tiempo.
+    :param values: Valor por paso.
+    :param label: Etiqueta de la serie.
+    :param max_points: Número máximo de puntos (None para dibujar todos los pasos).
+    :param method: Método de reducción: 'lttb' o 'minmax'.
+    :return: Línea dibujada.
+    """
+    import matplotlib.pyplot as plt
+
+    x, y = decimate(values[:steps], max_points, method)
+    line, = plt.plot(x, y, label=label, linewidth=2)
+    return line
+
+
+def finish_figure(path: Optional[str] = None):
+    """
+    Muestra la figura actual o, si se indica `path`, la guarda en ese fichero y la cierra sin mostrarla.
+    """
+    import matplotlib.pyplot as plt
+
+    if path is None:
+        plt.show()
+    else:
+        plt.savefig(path)
+        plt.close()
+
+
+def plot_average_rewards(steps: int, rewards: np.ndarray, algorithms: List[Algorithm],
+                         confidence: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                         max_points: Optional[int] = None, method: str = 'lttb', path: Optional[str] = None):
     """
     Genera la gráfica de Recompensa Promedio vs Pasos de Tiempo.
 
     :param steps: Número de pasos de tiempo.
     :param rewards: Matriz de recompensas promedio.
     :param algorithms: Lista de instancias de algoritmos comparados.
+    :param confidence: Intervalos de confianza (inferior, superior) por algoritmo y paso,
+                       por ejemplo `stats.rewards.confidence_interval()`.
+    :param max_points: Número máximo de puntos por serie (None para dibujar todos los pasos).
+    :param method: Método de reducción de las series: 'lttb' o 'minmax'.
+    :param path: Fichero en el que guardar la figura en lugar de mostrarla.
     """
+    import seaborn as sns
+    import matplotlib.pyplot as plt
+
     sns.set_theme(style="whitegrid", palette="muted", font_scale=1.2)
 
     plt.figure(figsize=(14, 7))
     for idx, algo in enumerate(algorithms):
         label = get_algorithm_label(algo)
-        plt.plot(range(steps), rewards[idx], label=label, linewidth=2)
+        line = plot_series(steps, rewards[idx], label, max_points, method)
+        if confidence is not None:
+            plot_confidence_band(steps, confidence, idx, line.get_color(), max_points)
 
     plt.xlabel('Pasos de Tiempo', fontsize=14)
     plt.ylabel('Recompensa Promedio', fontsize=14)
     plt.title('Recompensa Promedio vs Pasos de Tiempo', fontsize=16)
     plt.legend(title='Algoritmos')
     plt.tight_layout()
-    plt.show()
+    finish_figure(path)
 
-def plot_optimal_selections(steps: int, optimal_selections: np.ndarray, algorithms: List[Algorithm]):
+def plot_optimal_selections(steps: int, optimal_selections: np.ndarray, algorithms: List[Algorithm],
+                            max_points: Optional[int] = None, method: str = 'lttb', path: Optional[str] = None):
     """
     Genera la gráfica de Porcentaje de Selección del Brazo Óptimo vs Pasos de Tiempo.
 
     :param steps: Número de pasos de tiempo.
     :param optimal_selections: Matriz de porcentaje de selecciones óptimas.
     :param algorithms: Lista de instancias de algoritmos comparados.
+    :param max_points: Número máximo de puntos por serie (None para dibujar todos los pasos).
+    :param method: Método de reducción de las series: 'lttb' o 'minmax'.
+    :param path: Fichero en el que guardar la figura en lugar de mostrarla.
     """
+    import matplotlib.pyplot as plt
 
     plt.figure(figsize=(14, 7))
     for idx, algo in enumerate(algorithms):
         label = get_algorithm_label(algo)
-        plt.plot(range(steps), optimal_selections[idx], label=label, linewidth=2)
+        plot_series(steps, optimal_selections[idx], label, max_points, method)
 
     plt.xlabel('Pasos de Tiempo', fontsize=14)
     plt.ylabel('Porcentaje de Selección del Brazo Óptimo', fontsize=14)
     plt.title('Porcentaje de Selección del Brazo Óptimo vs Pasos de Tiempo', fontsize=16)
     plt.legend(title='Algoritmos')
     plt.tight_layout()
-    plt.show()
+    finish_figure(path)
 
-def plot_regret(steps: int, regret_accumulated: np.ndarray, algorithms: List[Algorithm]):
+def plot_regret(steps: int, regret_accumulated: np.ndarray, algorithms: List[Algorithm],
+                confidence: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                max_points: Optional[int] = None, method: str = 'lttb', path: Optional[str] = None):
     """
     Genera la gráfica de Regret Acumulado vs Pasos de Tiempo.
 
     :param steps: Número de pasos de tiempo.
     :param regrets: Matriz de regret acumulado.
     :param algorithms: Lista de instancias de algoritmos comparados.
+    :param confidence: Intervalos de confianza (inferior, superior) por algoritmo y paso,
+                       por ejemplo `stats.regrets.confidence_interval()`.
+    :param max_points: Número máximo de puntos por serie (None para dibujar todos los pasos).
+    :param method: Método de reducción de las series: 'lttb' o 'minmax'.
+    :param path: Fichero en el que guardar la figura en lugar de mostrarla.
     """
+    import matplotlib.pyplot as plt
 
     plt.figure(figsize=(14, 7))
     for idx, algo in enumerate(algorithms):
         label = get_algorithm_label(algo)
-        plt.plot(range(steps), regret_accumulated[idx], label=label, linewidth=2)
+        line = plot_series(steps, regret_accumulated[idx], label, max_points, method)
+        if confidence is not None:
+            plot_confidence_band(steps, confidence, idx, line.get_color(), max_points)
 
     plt.xlabel('Pasos de Tiempo', fontsize=14)
     plt.ylabel('Regret Acumulado', fontsize=14)
     plt.title('Regret Acumulado vs Pasos de Tiempo', fontsize=16)
     plt.legend(title='Algoritmos')
     plt.tight_layout()
-    plt.show()
+    finish_figure(path)
+
+def _draw_arm_statistics(ax, arms: int, counts: np.ndarray, avg_rewards: np.ndarray, optimal_arm: int,
+                         algo: Algorithm):
+    """
+    Dibuja en `ax` el histograma de las estadísticas de cada brazo para un algoritmo.
+    """
+    bars = ax.bar(range(arms), avg_rewards, tick_label=[f'Brazo {i+1}\n({counts[i]})' for i in range(arms)], color=['green' if i == optimal_arm else 'blue' for i in range(arms)])
+
+    for bar in bars:
+        yval = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2.0, yval, round(yval, 2), va='bottom')
+
+    ax.set_xlabel('Brazos', fontsize=14)
+    ax.set_ylabel('Recompensa Promedio', fontsize=14)
+    ax.set_title(f'Estadísticas de los Brazos - {get_algorithm_label(algo)}', fontsize=16)
+
 
-def plot_arm_statistics(arms: int, arm_counts: np.ndarray, arm_avg_rewards: np.ndarray, optimal_arm: int, algorithms: List[Algorithm]):
+def plot_arm_statistics(arms: int, arm_counts: np.ndarray, arm_avg_rewards: np.ndarray, optimal_arm: int,
+                        algorithms: List[Algorithm], path: Optional[str] = None):
     """
-    Genera un histograma que muestra las estadísticas de cada brazo para cada algoritmo.
+    Genera un histograma que muestra las estadísticas de cada brazo para cada algoritmo. Se muestra
+    una figura por algoritmo o, si se indica `path`, se guarda una sola figura con un panel por algoritmo.
 
     :param arms: Número de brazos.
     :param counts: Número de veces que se ha seleccionado cada brazo.
     :param values: Recompensa promedio estimada de cada brazo.
     :param optimal_arm: Índice del brazo óptimo.
     :param algorithms: Lista de instancias de algoritmos comparados.
+    :param path: Fichero en el que guardar la figura en lugar de mostrarla.
     """
-
-    # Creamos un gráfico para cada algoritmo
+    import matplotlib.pyplot as plt
+
+    if path is None:
+        # Creamos una figura para cada algoritmo
+        for idx, algo in enumerate(algorithms):
+            fig, ax = plt.subplots(figsize=(14, 7))
+            _draw_arm_statistics(ax, arms, arm_counts[idx], arm_avg_rewards[idx], optimal_arm, algo)
+            fig.tight_layout()
+            plt.show()
+        return
+
+    fig, axes = plt.subplots(len(algorithms), 1, figsize=(14, 7 * len(algorithms)), squeeze=False)
     for idx, algo in enumerate(algorithms):
-        plt.figure(figsize=(14, 7))
-
-
-        bars = plt.bar(range(arms), arm_avg_rewards[idx], tick_label=[f'Brazo {i+1}\n({arm_counts[idx, i]})' for i in range(arms)], color=['green' if i == optimal_arm else 'blue' for i in range(arms)])
-
-        for bar in bars:
-            yval = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2.0, yval, round(yval, 2), va='bottom')
+        _draw_arm_statistics(axes[idx, 0], arms, arm_counts[idx], arm_avg_rewards[idx], optimal_arm, algo)
 
-        plt.xlabel('Brazos', fontsize=14)
-        plt.ylabel('Recompensa Promedio', fontsize=14)
-        plt.title(f'Estadísticas de los Brazos - {get_algorithm_label(algo)}', fontsize=16)
-        plt.tight_layout()
-        plt.show()
\ No newline at end of file
+    fig.tight_layout()
+    finish_figure(path)
\ No newline at end of file
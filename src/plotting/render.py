@@ -0,0 +1,71 @@
+"""
+Module: plotting/render.py
+Description: Renderizado de figuras a fichero, sin ventana y en paralelo.
+
+Cada figura se describe como un trabajo (función de plotting, argumentos) con un `path` de salida.
+Los trabajos se reparten entre procesos que usan el backend no interactivo Agg, por lo que sirven
+para trabajos por lotes sin pantalla y no bloquean en plt.show(). Salvo que el trabajo indique
+otra cosa, las series se reducen a `max_points` puntos antes de dibujarlas.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Puntos por serie con los que se dibuja por defecto: más que los píxeles de ancho de una figura
+DEFAULT_MAX_POINTS = 4000
+
+Job = Tuple[Callable, Dict[str, Any]]
+
+
+def use_headless():
+    """
+    Selecciona el backend no interactivo Agg en el proceso actual.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _render(job: Job) -> str:
+    function, kwargs = job
+    function(**kwargs)
+    return kwargs['path']
+
+
+def render_figures(jobs: List[Job], processes: Optional[int] = None,
+                   max_points: Optional[int] = DEFAULT_MAX_POINTS) -> List[str]:
+    """
+    Dibuja varias figuras en ficheros, en paralelo.
+
+    Por ejemplo:
+
+        render_figures([(plot_regret, dict(steps=steps, regret_accumulated=regrets, algorithms=algorithms, path='regret.png')),
+                        (plot_average_rewards, dict(steps=steps, rewards=rewards, algorithms=algorithms, path='rewards.png'))])
+
+    :param jobs: Pares (función de plotting, argumentos); los argumentos deben incluir `path`.
+    :param processes: Número de procesos (por defecto, el número de CPUs).
+    :param max_points: Puntos por serie para los trabajos que no indican `max_points` (None para dibujar todos).
+    :return: Rutas de los ficheros generados, en el orden de los trabajos.
+    """
+    assert all('path' in kwargs for _, kwargs in jobs), "Cada trabajo debe indicar el fichero de salida (path)."
+
+    if not jobs:
+        return []
+
+    jobs = [(function, {'max_points': max_points, **kwargs})
+            if 'max_points' in inspect.signature(function).parameters else (function, kwargs)
+            for function, kwargs in jobs]
+    # Incluso con un solo proceso se dibuja en un proceso auxiliar para no cambiar el backend del actual
+    processes = max(1, min(processes or os.cpu_count() or 1, len(jobs)))
+    with ProcessPoolExecutor(max_workers=processes, initializer=use_headless) as executor:
+        return list(executor.map(_render, jobs))
@@ -0,0 +1,18 @@
+"""
+Module: service/__main__.py
+Description: Punto de entrada de `python -m service`: generador de carga contra un servidor local.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from service.loadgen import main
+
+if __name__ == '__main__':
+    main()
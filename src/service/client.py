@@ -0,0 +1,87 @@
+"""
+Module: service/client.py
+Description: Cliente asíncrono del servidor de decisiones sobre una conexión HTTP/1.1 persistente.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import asyncio
+import json
+from typing import Optional, Tuple, Union
+
+
+class DecisionClient:
+
+    def __init__(self, address: Union[str, Tuple[str, int]]):
+        """
+        Inicializa el cliente.
+
+        :param address: (host, puerto) del servidor o ruta de su socket Unix.
+        """
+        self.address = address
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self):
+        """
+        Abre la conexión con el servidor.
+        """
+        if isinstance(self.address, str):
+            self._reader, self._writer = await asyncio.open_unix_connection(self.address)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(*self.address)
+
+    async def close(self):
+        """
+        Cierra la conexión.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def select(self, name: str) -> int:
+        """
+        Pide un brazo al algoritmo `name`.
+        """
+        return (await self._request('POST', f'/select/{name}'))['arm']
+
+    async def reward(self, name: str, arm: int, reward: float):
+        """
+        Envía al algoritmo `name` la recompensa obtenida con un brazo.
+        """
+        await self._request('POST', f'/reward/{name}', {'arm': int(arm), 'reward': float(reward)})
+
+    async def stats(self) -> dict:
+        """
+        Devuelve las estadísticas del servidor.
+        """
+        return await self._request('GET', '/stats')
+
+    async def _request(self, method: str, target: str, payload: Optional[dict] = None) -> dict:
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self._writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+                           f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        await self._writer.drain()
+
+        status = int((await self._reader.readline()).split()[1])
+        length = 0
+        while True:
+            header = await self._reader.readline()
+            if header in (b'\r\n', b''):
+                break
+            name, _, value = header.decode('latin-1').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+        response = json.loads(await self._reader.readexactly(length))
+
+        if status != 200:
+            raise RuntimeError(f"El servidor respondió {status}: {response.get('error')}")
+        return response
@@ -0,0 +1,131 @@
+"""
+Module: service/loadgen.py
+Description: Generador de carga local para el servidor de decisiones.
+
+Cada conexión repite el ciclo seleccionar -> tirar del brazo en un Bandit simulado -> enviar la
+recompensa, y se mide la latencia de ida y vuelta de cada petición desde el cliente. Ejecutado como
+script (`python -m service`) arranca un servidor en el mismo proceso y lanza la carga contra él:
+
+    python -m service --k 100 --requests 20000 --connections 32
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from arms import Bandit
+from service.client import DecisionClient
+
+
+async def run_load(address: Union[str, Tuple[str, int]], name: str, bandit: Bandit, requests: int,
+                   connections: int = 16) -> Dict[str, float]:
+    """
+    Lanza `requests` ciclos selección/recompensa contra el algoritmo `name` repartidos entre `connections` conexiones.
+
+    :param address: (host, puerto) del servidor o ruta de su socket Unix.
+    :param name: Nombre del algoritmo en el servidor.
+    :param bandit: Bandit del que se obtienen las recompensas de los brazos elegidos.
+    :param requests: Número total de ciclos selección/recompensa.
+    :param connections: Número de conexiones concurrentes.
+    :return: Peticiones por segundo, latencias p50/p99 (ms) de selección y recompensa, y recompensa media.
+    """
+    assert requests > 0 and connections > 0, "El número de peticiones y de conexiones debe ser mayor que 0."
+
+    select_latencies: List[float] = []
+    reward_latencies: List[float] = []
+    rewards: List[float] = []
+
+    async def worker(cycles: int):
+        client = DecisionClient(address)
+        await client.connect()
+        try:
+            for _ in range(cycles):
+                start = time.perf_counter()
+                arm = await client.select(name)
+                middle = time.perf_counter()
+                reward = bandit.pull_arm(arm)
+                await client.reward(name, arm, reward)
+                end = time.perf_counter()
+
+                select_latencies.append(middle - start)
+                reward_latencies.append(end - middle)
+                rewards.append(reward)
+        finally:
+            await client.close()
+
+    shares = [requests // connections + (i < requests % connections) for i in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(cycles) for cycles in shares if cycles))
+    elapsed = time.perf_counter() - start
+
+    select_ms = np.array(select_latencies) * 1e3
+    reward_ms = np.array(reward_latencies) * 1e3
+    return {
+        'requests_per_second': 2 * requests / elapsed,
+        'select_p50_ms': float(np.percentile(select_ms, 50)),
+        'select_p99_ms': float(np.percentile(select_ms, 99)),
+        'reward_p50_ms': float(np.percentile(reward_ms, 50)),
+        'reward_p99_ms': float(np.percentile(reward_ms, 99)),
+        'average_reward': float(np.mean(rewards)),
+    }
+
+
+async def _main(args: argparse.Namespace):
+    from algorithms import EpsilonGreedy, UCB1
+    from arms import ArmNormal
+    from service.server import DecisionServer
+
+    rng = np.random.default_rng(args.seed)
+    bandit = Bandit(arms=ArmNormal.generate_arms(args.k, rng=rng))
+    algorithms = {'ucb1': UCB1(args.k, rng=rng), 'epsilon': EpsilonGreedy(args.k, 0.1, rng=rng)}
+    server = DecisionServer(algorithms, max_batch=args.max_batch, max_delay=args.max_delay)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.tcp:
+            address = await server.start(port=args.port)
+        else:
+            address = await server.start(path=os.path.join(directory, 'decisions.sock'))
+
+        try:
+            for name in algorithms:
+                client = await run_load(address, name, bandit, args.requests, args.connections)
+                print(f"{name}: {client['requests_per_second']:.0f} req/s, "
+                      f"select p50={client['select_p50_ms']:.3f} ms p99={client['select_p99_ms']:.3f} ms, "
+                      f"reward p50={client['reward_p50_ms']:.3f} ms p99={client['reward_p99_ms']:.3f} ms, "
+                      f"recompensa media={client['average_reward']:.3f} (óptimo "
+                      f"{bandit.get_expected_value(bandit.optimal_arm):.3f})")
+            for name, summary in server.stats().items():
+                print(f"{name} (servidor): {summary['requests']} peticiones en {summary['batches']} lotes "
+                      f"(media {summary['mean_batch']:.1f}), p50={summary['p50_ms']:.3f} ms p99={summary['p99_ms']:.3f} ms")
+        finally:
+            await server.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Arranca un servidor local con UCB1 y epsilon-greedy, lanza la carga contra cada uno y muestra las latencias.
+    """
+    parser = argparse.ArgumentParser(description="Generador de carga local del servidor de decisiones.")
+    parser.add_argument('--k', type=int, default=100, help="Número de brazos.")
+    parser.add_argument('--requests', type=int, default=20000, help="Ciclos selección/recompensa por algoritmo.")
+    parser.add_argument('--connections', type=int, default=32, help="Conexiones concurrentes.")
+    parser.add_argument('--max-batch', type=int, default=256, help="Tamaño máximo de lote del servidor.")
+    parser.add_argument('--max-delay', type=float, default=0.0, help="Espera (s) para llenar un lote.")
+    parser.add_argument('--tcp', action='store_true', help="Usar TCP en lugar de un socket Unix.")
+    parser.add_argument('--port', type=int, default=0, help="Puerto TCP (0 para uno libre).")
+    parser.add_argument('--seed', type=int, default=42, help="Semilla de los brazos y algoritmos.")
+    asyncio.run(_main(parser.parse_args(argv)))
@@ -0,0 +1,258 @@
+"""
+Module: service/server.py
+Description: Servidor local de decisiones que aloja algoritmos con nombre y agrupa sus peticiones en microlotes.
+
+El servidor habla HTTP/1.1 mínimo (con conexiones persistentes) sobre TCP o un socket Unix:
+
+    POST /select/<nombre>   -> {"arm": <brazo>}
+    POST /reward/<nombre>   {"arm": <brazo>, "reward": <recompensa>} -> {"ok": true}
+    GET  /stats             -> peticiones, lotes y latencias p50/p99 (ms) de cada algoritmo
+
+Las peticiones de cada algoritmo se encolan y una tarea por algoritmo las atiende por lotes: primero
+aplica todas las recompensas con `update_batch` y después responde todas las selecciones con una
+única llamada a `select_arms`. Todo corre en el bucle de eventos, por lo que el algoritmo nunca se
+usa desde dos hilos a la vez.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from algorithms.algorithm import Algorithm
+from simulation.statistics import StreamingStats
+
+# Cuantiles de latencia que se publican en /stats
+LATENCY_QUANTILES = (0.5, 0.99)
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error'}
+
+
+class _Batcher:
+
+    def __init__(self, algorithm: Algorithm, max_batch: int, max_delay: float):
+        """
+        Cola de peticiones de un algoritmo y estadísticas de latencia.
+
+        :param algorithm: Algoritmo que atiende las peticiones.
+        :param max_batch: Número máximo de peticiones por lote.
+        :param max_delay: Tiempo (s) que se espera a que lleguen más peticiones antes de atender un lote.
+        """
+        self.algorithm = algorithm
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.batches = 0
+        # Latencia en segundos desde que llega la petición hasta que se resuelve
+        self.latency = StreamingStats((1,), LATENCY_QUANTILES)
+
+    async def submit(self, kind: str, arm: int = 0, reward: float = 0.0):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((kind, arm, reward, future, time.perf_counter()))
+        return await future
+
+    async def run(self):
+        while True:
+            batch = [await self.queue.get()]
+            # Se cede el bucle (o se espera max_delay) para que el resto de conexiones encolen sus peticiones
+            await asyncio.sleep(self.max_delay)
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                self._process(batch)
+            except Exception as error:
+                # Un lote que falla no debe detener la tarea: sus peticiones reciben el error
+                for item in batch:
+                    if not item[3].done():
+                        item[3].set_exception(error)
+
+    def _process(self, batch: List[Tuple]):
+        rewards = [item for item in batch if item[0] == 'reward']
+        selects = [item for item in batch if item[0] == 'select']
+
+        if rewards:
+            self.algorithm.update_batch(np.array([item[1] for item in rewards], dtype=int),
+                                        np.array([item[2] for item in rewards], dtype=float))
+            for item in rewards:
+                item[3].set_result(None)
+
+        if selects:
+            arms = self.algorithm.select_arms(len(selects))
+            for item, arm in zip(selects, arms):
+                item[3].set_result(int(arm))
+
+        now = time.perf_counter()
+        self.latency.update(0, np.array([now - item[4] for item in batch]))
+        self.batches += 1
+
+    def stats(self) -> Dict[str, float]:
+        requests = int(self.latency.count[0])
+        summary = {'requests': requests, 'batches': self.batches,
+                   'mean_batch': requests / self.batches if self.batches else 0.0,
+                   'mean_ms': float(self.latency.mean[0]) * 1e3}
+        for q in LATENCY_QUANTILES:
+            summary[f'p{round(q * 100)}_ms'] = float(self.latency.quantile(q)[0]) * 1e3 if requests else 0.0
+        return summary
+
+
+class DecisionServer:
+
+    def __init__(self, algorithms: Dict[str, Algorithm], max_batch: int = 256, max_delay: float = 0.0):
+        """
+        Inicializa el servidor de decisiones.
+
+        :param algorithms: Algoritmos alojados, indexados por el nombre que aparece en las rutas.
+        :param max_batch: Número máximo de peticiones que se atienden en un mismo lote.
+        :param max_delay: Tiempo (s) que se espera a que se llene un lote; con 0 sólo se agrupan las
+                          peticiones que ya han llegado, sin añadir latencia.
+        """
+        assert max_batch > 0, "El tamaño máximo de lote debe ser mayor que 0."
+        assert max_delay >= 0, "La espera máxima no puede ser negativa."
+
+        self.algorithms = algorithms
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._batchers: Dict[str, _Batcher] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0, path: Optional[str] = None):
+        """
+        Empieza a escuchar en host:port o, si se indica `path`, en un socket Unix.
+
+        :param host: Dirección TCP.
+        :param port: Puerto TCP (0 para que el sistema elija uno libre).
+        :param path: Ruta del socket Unix.
+        :return: Dirección en la que escucha: (host, puerto) o la ruta del socket.
+        """
+        self._batchers = {name: _Batcher(algorithm, self.max_batch, self.max_delay)
+                          for name, algorithm in self.algorithms.items()}
+        self._tasks = [asyncio.create_task(batcher.run()) for batcher in self._batchers.values()]
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=path)
+            return path
+
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        """
+        Deja de aceptar conexiones y detiene las tareas de los lotes.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Devuelve, para cada algoritmo, el número de peticiones y lotes y la latencia media, p50 y p99 en ms.
+        """
+        return {name: batcher.stats() for name, batcher in self._batchers.items()}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except ValueError as error:
+                    # Tras una petición mal formada no se sabe dónde empieza la siguiente: se responde y se cierra
+                    await _respond(writer, 400, {'error': str(error)})
+                    break
+                if request is None:
+                    break
+                method, target, body = request
+                try:
+                    status, payload = await self._dispatch(method, target, body)
+                except Exception as error:
+                    status, payload = 500, {'error': str(error)}
+                await _respond(writer, status, payload)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        parts = target.strip('/').split('/')
+
+        if parts == ['stats']:
+            return 200, self.stats()
+
+        if len(parts) != 2 or parts[0] not in ('select', 'reward'):
+            return 404, {'error': f"Ruta desconocida: {target}"}
+        if method != 'POST':
+            return 405, {'error': "Sólo se admite POST."}
+        batcher = self._batchers.get(parts[1])
+        if batcher is None:
+            return 404, {'error': f"Algoritmo desconocido: {parts[1]}"}
+
+        if parts[0] == 'select':
+            return 200, {'arm': await batcher.submit('select')}
+
+        try:
+            message = json.loads(body)
+            arm, reward = int(message['arm']), float(message['reward'])
+        except (ValueError, KeyError, TypeError):
+            return 400, {'error': "El cuerpo debe ser {\"arm\": int, \"reward\": float}."}
+        if not 0 <= arm < batcher.algorithm.k:
+            return 400, {'error': f"Brazo fuera de rango: {arm}"}
+
+        await batcher.submit('reward', arm, reward)
+        return 200, {'ok': True}
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int, payload: dict):
+    """
+    Escribe una respuesta JSON.
+    """
+    data = json.dumps(payload).encode()
+    writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+    await writer.drain()
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes]]:
+    """
+    Lee una petición HTTP/1.1. Devuelve None si el cliente ha cerrado la conexión.
+    :raises ValueError: Si la línea de petición o la cabecera Content-Length están mal formadas.
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode('latin-1').split(' ', 2)
+    if len(parts) != 3:
+        raise ValueError(f"Línea de petición mal formada: {line.decode('latin-1').strip()!r}")
+    method, target, _ = parts
+
+    length = 0
+    while True:
+        header = await reader.readline()
+        if header in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = header.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            try:
+                length = int(value)
+            except ValueError:
+                raise ValueError(f"Content-Length no válido: {value.strip()!r}") from None
+            if length < 0:
+                raise ValueError(f"Content-Length negativo: {length}")
+
+    body = await reader.readexactly(length) if length else b''
+    return method, target, body
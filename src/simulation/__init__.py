@@ -0,0 +1,59 @@
+"""
+Module: simulation/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete simulation.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Importación de módulos o clases. Se difiere hasta el primer uso de cada nombre (PEP 562) para que
+# importar el paquete no cargue los módulos que no se van a usar
+_LAZY_IMPORTS = {
+    'run_experiment': '.engine',
+    'cache_options': '.engine',
+    'run_experiment_parallel': '.parallel',
+    'ExperimentStatistics': '.statistics',
+    'StreamingStats': '.statistics',
+    'P2Quantile': '.statistics',
+    'ResultsCache': '.cache',
+    'experiment_key': '.cache',
+    'get_params': '.cache',
+    'race': '.racing',
+    'Profiler': '.profiling',
+    'load_plan': '.scheduler',
+    'expand_plan': '.scheduler',
+    'run_plan': '.scheduler',
+}
+
+if TYPE_CHECKING:
+    from .engine import run_experiment, cache_options
+    from .parallel import run_experiment_parallel
+    from .statistics import ExperimentStatistics, StreamingStats, P2Quantile
+    from .cache import ResultsCache, experiment_key, get_params
+    from .racing import race
+    from .profiling import Profiler
+    from .scheduler import load_plan, expand_plan, run_plan
+
+# Lista de módulos o clases públicas
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,169 @@
+"""
+Module: simulation/cache.py
+Description: Caché en disco de los resultados de run_experiment, direccionada por el contenido del experimento.
+
+La clave de cada experimento es el sha256 de una descripción canónica del bandit (clase y parámetros
+de cada brazo), de los algoritmos (clase y parámetros), de steps, runs y la semilla, y de las opciones
+que cambian el resultado. Los parámetros se obtienen de la firma de `__init__` de cada objeto, por lo
+que cualquier brazo o algoritmo nuevo que guarde sus argumentos con el mismo nombre queda cubierto.
+
+Cada entrada es un directorio con un .npy por métrica, que se devuelven mapeados en memoria. Cuando
+el tamaño total supera el límite se eliminan las entradas usadas hace más tiempo (LRU).
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Versión del formato de las entradas; cambiarla invalida todas las claves anteriores
+CACHE_VERSION = 2
+
+# Nombre del fichero de cada una de las métricas que devuelve run_experiment, en el mismo orden
+RESULT_NAMES = ('rewards', 'optimal_selections', 'regrets', 'arm_counts', 'arm_avg_rewards')
+
+# Argumentos de los constructores que no forman parte de la configuración del experimento
+IGNORED_PARAMS = ('self', 'rng')
+
+
+def get_params(obj) -> Dict[str, Any]:
+    """
+    Devuelve los parámetros de un objeto a partir de la firma de su `__init__`, leyendo el atributo
+    con el mismo nombre que cada argumento (se ignoran el generador y los argumentos sin atributo).
+
+    :param obj: Brazo, bandit o algoritmo.
+    :return: Diccionario nombre -> valor.
+    """
+    params = {}
+    for name, parameter in inspect.signature(type(obj).__init__).parameters.items():
+        if name in IGNORED_PARAMS or parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        if hasattr(obj, name):
+            params[name] = getattr(obj, name)
+    return params
+
+
+def describe(obj) -> Any:
+    """
+    Devuelve una descripción canónica, serializable en JSON, de un objeto y de sus parámetros. Los
+    números reales con valor entero se describen como enteros, para que 1 y 1.0 (o np.float64(1))
+    den la misma clave.
+    """
+    if isinstance(obj, (list, tuple)):
+        return [describe(item) for item in obj]
+    if isinstance(obj, dict):
+        return {str(name): describe(value) for name, value in obj.items()}
+    if isinstance(obj, np.ndarray):
+        return describe(obj.tolist())
+    if isinstance(obj, np.generic):
+        return describe(obj.item())
+    if isinstance(obj, float) and obj.is_integer():
+        return int(obj)
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    return {'class': f"{type(obj).__module__}.{type(obj).__qualname__}",
+            'params': {name: describe(value) for name, value in get_params(obj).items()}}
+
+
+def experiment_key(bandit, algorithms, steps: int, runs: int, seed: int, **options) -> str:
+    """
+    Calcula la clave de un experimento.
+
+    :param bandit: Bandit del experimento.
+    :param algorithms: Lista de algoritmos.
+    :param steps: Número de pasos de tiempo por ejecución.
+    :param runs: Número de ejecuciones.
+    :param seed: Semilla del experimento.
+    :param options: Otras opciones que cambian el resultado (por ejemplo, reward_tape).
+    :return: Clave hexadecimal (sha256).
+    """
+    description = {'version': CACHE_VERSION, 'bandit': describe(bandit), 'algorithms': describe(algorithms),
+                   'steps': steps, 'runs': runs, 'seed': seed, 'options': describe(options)}
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+class ResultsCache:
+
+    def __init__(self, directory: str, max_bytes: int = 1 << 30):
+        """
+        Inicializa la caché.
+
+        :param directory: Directorio donde se guardan las entradas (se crea si no existe).
+        :param max_bytes: Tamaño máximo del total de entradas; al superarlo se eliminan las menos usadas.
+        """
+        assert max_bytes > 0, "El tamaño máximo de la caché debe ser mayor que 0."
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Devuelve los resultados guardados con una clave, mapeados en memoria de solo lectura, o None si no están.
+        """
+        entry = self._entry(key)
+        try:
+            results = tuple(np.load(os.path.join(entry, f"{name}.npy"), mmap_mode='r') for name in RESULT_NAMES)
+        except FileNotFoundError:
+            return None
+        # La fecha de modificación del directorio marca el último uso para la expulsión LRU
+        os.utime(entry)
+        return results
+
+    def put(self, key: str, results: Tuple[np.ndarray, ...]):
+        """
+        Guarda los resultados de un experimento y expulsa las entradas menos usadas si se supera el tamaño máximo.
+        """
+        # Se escribe en un directorio temporal y se renombra, para que nunca se lea una entrada a medias
+        staging = tempfile.mkdtemp(prefix='.tmp-', dir=self.directory)
+        for name, array in zip(RESULT_NAMES, results):
+            np.save(os.path.join(staging, f"{name}.npy"), np.asarray(array))
+        try:
+            os.replace(staging, self._entry(key))
+        except OSError:
+            # Otro proceso ha guardado ya la misma entrada
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict()
+
+    def evict(self):
+        """
+        Elimina las entradas usadas hace más tiempo hasta que el total no supera max_bytes.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            entry = self._entry(name)
+            if name.startswith('.') or not os.path.isdir(entry):
+                continue
+            size = sum(file.stat().st_size for file in os.scandir(entry))
+            entries.append((os.stat(entry).st_mtime, size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """
+        Elimina todas las entradas.
+        """
+        for name in os.listdir(self.directory):
+            shutil.rmtree(self._entry(name), ignore_errors=True)
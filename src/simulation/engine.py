@@ -0,0 +1,453 @@
+"""
+Module: simulation/engine.py
+Description: Motor de simulación vectorizado que avanza todas las ejecuciones de un experimento a la vez.
+
+En lugar de recorrer ejecuciones × pasos × algoritmos en Python, cada algoritmo se sustituye por su
+versión vectorizada (ver algorithms/batched.py) y cada paso de tiempo se resuelve para todas las
+ejecuciones con operaciones de NumPy.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import warnings
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from algorithms import Algorithm, BatchedAlgorithm, make_batched
+from arms import Bandit
+from simulation.profiling import Profiler, algorithm_labels, instrument, section
+from simulation.statistics import ExperimentStatistics, StreamingStats
+
+if TYPE_CHECKING:
+    from simulation.cache import ResultsCache
+
+# Pasos cuyas recompensas esperadas se calculan de una vez para el pseudo-regret de un bandit no estacionario
+EXPECTED_BLOCK_STEPS = 256
+
+
+class _Recorder:
+
+    def __init__(self, n_algos: int, steps: int, runs: int, bandit: Bandit,
+                 stats: Optional[ExperimentStatistics] = None, pseudo_regret: bool = False):
+        """
+        Acumula las métricas de cada paso sumando sobre las ejecuciones.
+
+        :param n_algos: Número de filas de resultados (algoritmos o configuraciones de un barrido).
+        :param steps: Número de pasos de tiempo por ejecución.
+        :param runs: Número de ejecuciones independientes.
+        :param bandit: Bandit del experimento, del que se toma el brazo óptimo. Si no es estacionario,
+                       el regret y las selecciones óptimas se miden frente al brazo óptimo de cada paso.
+        :param stats: Acumulador opcional de media, varianza y cuantiles por paso.
+        :param pseudo_regret: Si es True el regret acumula la recompensa esperada del brazo elegido en
+                              lugar de la obtenida.
+        """
+        self.bandit = bandit
+        self.steps = steps
+        self.optimal_arm = bandit.optimal_arm
+        self.optimal_reward = bandit.get_expected_value(self.optimal_arm)
+        self.stats = stats
+        self.pseudo_regret = pseudo_regret
+
+        # Brazo óptimo por paso y suma acumulada de su recompensa esperada (sólo si cambian con el tiempo)
+        self.optimal_arms = None
+        if not bandit.stationary:
+            self.optimal_arms, optimal_rewards = bandit.optimal_path(steps)
+            self.optimal_totals = np.cumsum(optimal_rewards)
+
+        # Recompensa esperada de cada brazo (estacionario) o del último bloque de pasos calculado
+        if pseudo_regret and self.optimal_arms is None:
+            self.expected_rewards = np.asarray(bandit.get_expected_rewards(), dtype=float)
+        self._expected_block = (0, np.empty((0, bandit.k)))
+
+        self.rewards = np.zeros((n_algos, steps))
+        self.optimal_selections = np.zeros((n_algos, steps))
+        self.regrets = np.zeros((n_algos, steps))
+        self.arm_counts = np.zeros((n_algos, bandit.k))
+        self.arm_rewards = np.zeros((n_algos, bandit.k))
+
+        # Recompensa acumulada (obtenida o esperada) de cada ejecución, necesaria para el regret
+        self.total_rewards = np.zeros((n_algos, runs))
+
+    def _expected_at(self, first_step: int, n_steps: int) -> np.ndarray:
+        """
+        Devuelve la recompensa esperada de cada brazo en los pasos first_step .. first_step + n_steps - 1,
+        de forma (n_steps, k). Se calcula por bloques que comparten todos los algoritmos.
+        """
+        start, expected = self._expected_block
+        if first_step < start or first_step + n_steps > start + expected.shape[0]:
+            start = first_step
+            stop = min(self.steps, first_step + max(n_steps, EXPECTED_BLOCK_STEPS))
+            expected = self.bandit.expected_rewards_at(np.arange(start, stop))
+            self._expected_block = (start, expected)
+        return expected[first_step - start:first_step - start + n_steps]
+
+    def _gains(self, first_step: int, chosen_arms: np.ndarray, step_rewards: np.ndarray) -> np.ndarray:
+        """
+        Devuelve lo que suma cada tirada al total de su ejecución: la recompensa obtenida o, con
+        pseudo-regret, la esperada del brazo elegido en su paso. Así el regret acumulado es
+        sum_i gap_i * selecciones_i (frente al brazo óptimo de cada paso si el bandit no es
+        estacionario), sin el ruido de las recompensas. Ambos argumentos tienen forma
+        (pasos, configuraciones, ejecuciones).
+        """
+        if not self.pseudo_regret:
+            return step_rewards
+        if self.optimal_arms is None:
+            return self.expected_rewards[chosen_arms]
+        n_steps = chosen_arms.shape[0]
+        expected = self._expected_at(first_step, n_steps)
+        return expected[np.arange(n_steps)[:, None, None], chosen_arms]
+
+    def record(self, rows: slice, step: int, chosen_arms: np.ndarray, step_rewards: np.ndarray):
+        """
+        Añade los brazos elegidos y las recompensas de un paso para las filas `rows` de resultados
+        (un algoritmo o las configuraciones de un barrido), ambos de forma (configuraciones, ejecuciones).
+        """
+        self.total_rewards[rows] += self._gains(step, chosen_arms[None], step_rewards[None])[0]
+        if self.optimal_arms is None:
+            run_regrets = self.optimal_reward * (step + 1) - self.total_rewards[rows]
+            optimal = chosen_arms == self.optimal_arm
+        else:
+            run_regrets = self.optimal_totals[step] - self.total_rewards[rows]
+            optimal = chosen_arms == self.optimal_arms[step]
+
+        self.rewards[rows, step] = np.sum(step_rewards, axis=1)
+        self.regrets[rows, step] = np.sum(run_regrets, axis=1)
+        self.optimal_selections[rows, step] = np.count_nonzero(optimal, axis=1)
+
+        self._record_arms(rows, chosen_arms, step_rewards)
+
+        if self.stats is not None:
+            for offset, idx in enumerate(range(rows.start, rows.stop)):
+                self.stats.update(idx, step, step_rewards[offset], run_regrets[offset], optimal[offset])
+
+    def record_chunk(self, rows: slice, first_step: int, chosen_arms: np.ndarray, step_rewards: np.ndarray):
+        """
+        Equivalente a llamar a `record` para cada paso de `chosen_arms` y `step_rewards` (pasos × configuraciones × ejecuciones),
+        con las mismas operaciones en el mismo orden para que el resultado sea idéntico.
+        """
+        if self.stats is not None:
+            for offset in range(chosen_arms.shape[0]):
+                self.record(rows, first_step + offset, chosen_arms[offset], step_rewards[offset])
+            return
+
+        n_steps = chosen_arms.shape[0]
+        last_step = first_step + n_steps
+
+        # La suma acumulada partiendo del total previo reproduce la suma paso a paso
+        gains = self._gains(first_step, chosen_arms, step_rewards)
+        totals = np.cumsum(np.concatenate([self.total_rewards[None, rows], gains]), axis=0)[1:]
+        self.total_rewards[rows] = totals[-1]
+        if self.optimal_arms is None:
+            run_regrets = self.optimal_reward * np.arange(first_step + 1, last_step + 1)[:, None, None] - totals
+            optimal = chosen_arms == self.optimal_arm
+        else:
+            run_regrets = self.optimal_totals[first_step:last_step, None, None] - totals
+            optimal = chosen_arms == self.optimal_arms[first_step:last_step, None, None]
+
+        self.rewards[rows, first_step:last_step] = np.sum(step_rewards, axis=2).T
+        self.regrets[rows, first_step:last_step] = np.sum(run_regrets, axis=2).T
+        self.optimal_selections[rows, first_step:last_step] = np.count_nonzero(optimal, axis=2).T
+
+        for offset in range(n_steps):
+            self._record_arms(rows, chosen_arms[offset], step_rewards[offset])
+
+    def _record_arms(self, rows: slice, chosen_arms: np.ndarray, step_rewards: np.ndarray):
+        """
+        Suma las selecciones y recompensas de un paso a las estadísticas por brazo de las filas `rows`.
+        """
+        k = self.arm_counts.shape[1]
+        n_rows = rows.stop - rows.start
+        # Índice plano (configuración, brazo) para agregar todas las filas con un solo bincount
+        flat = (np.arange(n_rows)[:, None] * k + chosen_arms).ravel()
+        self.arm_counts[rows] += np.bincount(flat, minlength=n_rows * k).reshape(n_rows, k)
+        self.arm_rewards[rows] += np.bincount(flat, weights=step_rewards.ravel(), minlength=n_rows * k).reshape(n_rows, k)
+
+    def final_regrets(self) -> np.ndarray:
+        """
+        Devuelve el regret acumulado del último paso de cada ejecución, de forma (filas, ejecuciones).
+        """
+        optimal_total = self.optimal_reward * self.steps if self.optimal_arms is None else self.optimal_totals[-1]
+        return optimal_total - self.total_rewards
+
+    def sums(self) -> Tuple[np.ndarray, ...]:
+        return self.rewards, self.optimal_selections, self.regrets, self.arm_counts, self.arm_rewards
+
+
+def simulate(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+             seed_seq: np.random.SeedSequence, reward_tape: bool = False,
+             stats: Optional[ExperimentStatistics] = None, backend: str = 'numpy',
+             chunk_steps: int = 256, profiler: Optional[Profiler] = None, common_random_numbers: bool = False,
+             pseudo_regret: bool = False, final_regret: Optional[StreamingStats] = None) -> Tuple[np.ndarray, ...]:
+    """
+    Simula `runs` ejecuciones y devuelve las sumas (sin promediar) de cada métrica.
+
+    Si el bandit tiene una cinta de recompensas (Bandit.use_tape) las recompensas se leen de ella
+    a partir de la posición `bandit.tape_run`.
+
+    :param bandit: Instancia de Bandit configurada para el experimento.
+    :param algorithms: Lista de instancias de algoritmos a comparar. Los que tienen hiperparámetros
+                       vectoriales aportan una fila de resultados por configuración.
+    :param steps: Número de pasos de tiempo por ejecución.
+    :param runs: Número de ejecuciones independientes.
+    :param seed_seq: Semilla de la que se derivan los generadores de las recompensas y de cada algoritmo.
+    :param reward_tape: Si es True y el bandit no tiene cinta, se pre-generan todas las recompensas.
+    :param stats: Acumulador opcional de media, varianza y cuantiles por paso, actualizado en el sitio.
+    :param backend: 'numpy' o 'numba'. Con 'numba' el bucle de cada algoritmo se ejecuta compilado
+                    y las recompensas se leen siempre de una cinta (completa o por bloques).
+    :param chunk_steps: Número de pasos que avanza cada llamada a un núcleo compilado y de cada bloque
+                        de recompensas con `common_random_numbers`.
+    :param profiler: Perfilador opcional (Profiler) en el que se acumula el tiempo de cada fase por algoritmo.
+    :param common_random_numbers: Si es True todos los algoritmos (y todas las configuraciones de un
+                                  barrido) reciben la misma recompensa al elegir el mismo brazo en el
+                                  mismo paso de la misma ejecución. Si no hay cinta, las recompensas se
+                                  generan por bloques de `chunk_steps` pasos en una cinta de
+                                  runs x chunk_steps x k que sustituye a la del bloque anterior; con el
+                                  chunk_steps por defecto son las mismas que con `reward_tape=True`.
+    :param pseudo_regret: Si es True el regret se calcula con la recompensa esperada de los brazos
+                          elegidos (sum_i gap_i * selecciones_i) en lugar de con la obtenida.
+    :param final_regret: Acumulador opcional (StreamingStats de forma (filas,)) al que se añade el regret
+                         acumulado final de cada ejecución, actualizado en el sitio.
+    :return: Sumas sobre las ejecuciones de recompensas, selecciones óptimas, regret acumulado,
+             selecciones por brazo y recompensas por brazo.
+    :rtype: Tuple of (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray)
+    """
+    assert backend in ('numpy', 'numba'), "El backend debe ser 'numpy' o 'numba'."
+
+    kernels = None
+    if backend == 'numba':
+        # Los núcleos leen las recompensas de una cinta, que basta con generar por bloques; sin Numba,
+        # la versión de NumPy con las mismas recompensas da exactamente el mismo resultado
+        common_random_numbers = True
+        from simulation import kernels
+        if not kernels.NUMBA_AVAILABLE:
+            warnings.warn("Numba no está instalado; se usa el backend de NumPy.", RuntimeWarning)
+            kernels = None
+
+    n_algos = len(algorithms)
+    # Las recompensas guardadas por Arm.pull no deben arrastrarse de un experimento a otro
+    bandit.reset()
+
+    # Las recompensas y cada algoritmo consumen su propio flujo de números aleatorios
+    reward_seed, *policy_seeds = seed_seq.spawn(n_algos + 1)
+    reward_rng = np.random.default_rng(reward_seed)
+    with section(profiler, 'setup'):
+        policies = [make_batched(algo, runs, np.random.default_rng(child))
+                    for algo, child in zip(algorithms, policy_seeds)]
+    labels = algorithm_labels(algorithms) if profiler is not None else [None] * n_algos
+
+    own_tape = reward_tape and bandit.tape is None
+    if own_tape:
+        with section(profiler, 'tape'):
+            bandit.use_tape(runs, steps, reward_rng)
+    # Sin cinta completa, los números aleatorios comunes se generan bloque a bloque
+    stream = common_random_numbers and bandit.tape is None
+    first_run = 0 if stream else bandit.tape_run
+    if bandit.tape is not None:
+        assert first_run + runs <= bandit.tape.runs and steps <= bandit.tape.steps, \
+            "La cinta de recompensas es más pequeña que el experimento."
+
+    # Filas de resultados de cada algoritmo: una por configuración del barrido
+    offsets = np.cumsum([0] + [policy.configurations for policy in policies])
+    rows = [slice(start, stop) for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    recorder = _Recorder(int(offsets[-1]), steps, runs, bandit, stats, pseudo_regret)
+    try:
+        windows = _reward_windows(bandit, runs, steps, chunk_steps, reward_rng, stream, profiler)
+        if kernels is not None:
+            _run_kernels(kernels, bandit, policies, rows, windows, reward_rng, first_run, recorder, labels, profiler)
+        elif stream:
+            for first_step, last_step in windows:
+                _run_steps(bandit, policies, rows, first_step, last_step, reward_rng, first_run, recorder, labels,
+                           profiler)
+        else:
+            _run_steps(bandit, policies, rows, 0, steps, reward_rng, first_run, recorder, labels, profiler)
+    finally:
+        if own_tape or stream:
+            bandit.detach_tape()
+        else:
+            bandit.seek(first_run, 0)
+
+    if final_regret is not None:
+        for row, regrets in enumerate(recorder.final_regrets()):
+            final_regret.update(row, regrets)
+
+    return recorder.sums()
+
+
+def _reward_windows(bandit: Bandit, runs: int, steps: int, chunk_steps: int, reward_rng: np.random.Generator,
+                    stream: bool, profiler: Optional[Profiler] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Recorre los bloques (primer paso, último paso + 1) de `chunk_steps` pasos del experimento. Con
+    `stream`, antes de cada bloque se genera la cinta de sus recompensas, que sustituye a la anterior.
+    """
+    for first_step in range(0, steps, chunk_steps):
+        last_step = min(first_step + chunk_steps, steps)
+        if stream:
+            with section(profiler, 'tape'):
+                bandit.use_tape(runs, last_step - first_step, reward_rng, chunk_steps=chunk_steps,
+                                first_step=first_step)
+        yield first_step, last_step
+
+
+def _run_steps(bandit: Bandit, policies: List[BatchedAlgorithm], rows: List[slice], first_step: int,
+               last_step: int, reward_rng: np.random.Generator, first_run: int, recorder: _Recorder,
+               labels: List[Optional[str]], profiler: Optional[Profiler] = None):
+    """
+    Bucle principal: avanza todas las ejecuciones de todos los algoritmos de `first_step` a `last_step`.
+    `rows` indica las filas de resultados de cada algoritmo y `labels` su etiqueta en el perfilador.
+    """
+    # Funciones de cada fase, cronometradas sólo si hay perfilador
+    phases = [instrument(profiler, label, select=policy.select_arms, pull=bandit.pull_arms,
+                         update=policy.update, record=recorder.record)
+              for policy, label in zip(policies, labels)]
+
+    for step in range(first_step, last_step):
+        bandit.seek(first_run, step)
+        for policy_rows, policy, (select, pull, update, record) in zip(rows, policies, phases):
+            chosen_arms = select()
+            # Las configuraciones de un barrido comparten las ejecuciones de la cinta
+            grid = chosen_arms.reshape(policy.configurations, policy.runs_per_configuration)
+            step_rewards = pull(grid, reward_rng)
+            update(chosen_arms, step_rewards.ravel())
+            record(policy_rows, step, grid, step_rewards)
+
+
+def _run_kernels(kernels, bandit: Bandit, policies: List[BatchedAlgorithm], rows: List[slice],
+                 windows: Iterator[Tuple[int, int]], reward_rng: np.random.Generator, first_run: int,
+                 recorder: _Recorder, labels: List[Optional[str]], profiler: Optional[Profiler] = None):
+    """
+    Bucle compilado: cada algoritmo avanza cada bloque de pasos de `windows` dentro de su núcleo.
+    Los algoritmos sin núcleo avanzan paso a paso con su versión de NumPy.
+    """
+    phases = [instrument(profiler, label, kernel=kernels.advance, record=recorder.record_chunk) for label in labels]
+    for first_step, last_step in windows:
+        # La cinta puede ser la del experimento completo o sólo la del bloque
+        tape = np.asarray(bandit.tape.data)
+        tape_step = first_step - bandit.tape.first_step
+        for policy_rows, policy, label, (advance, record) in zip(rows, policies, labels, phases):
+            if kernels.has_kernel(policy):
+                chosen, rewards = advance(policy, tape, first_run, tape_step, last_step - first_step)
+                shape = (last_step - first_step, policy.configurations, policy.runs_per_configuration)
+                record(policy_rows, first_step, chosen.reshape(shape), rewards.reshape(shape))
+            else:
+                _run_steps(bandit, [policy], [policy_rows], first_step, last_step, reward_rng, first_run, recorder,
+                           [label], profiler)
+
+
+def finalize(sums: Tuple[np.ndarray, ...], runs: int) -> Tuple[np.ndarray, ...]:
+    """
+    Convierte las sumas devueltas por `simulate` en las métricas promedio del experimento.
+
+    :param sums: Sumas de recompensas, selecciones óptimas, regret, selecciones y recompensas por brazo.
+    :param runs: Número total de ejecuciones sumadas.
+    :return: Recompensas promedio, porcentaje de selecciones óptimas, regret acumulado promedio,
+             selecciones por brazo y recompensa promedio por brazo.
+    """
+    rewards, optimal_selections, regrets, arm_counts, arm_rewards = sums
+
+    rewards = rewards / runs
+    regrets = regrets / runs
+    optimal_selections = (optimal_selections / runs) * 100  # Convertir a porcentaje
+    arm_avg_rewards = np.divide(arm_rewards, arm_counts, out=np.zeros_like(arm_rewards), where=arm_counts != 0)
+
+    return rewards, optimal_selections, regrets, arm_counts, arm_avg_rewards
+
+
+def cache_options(reward_tape: bool = False, backend: str = 'numpy', common_random_numbers: bool = False,
+                  pseudo_regret: bool = False) -> Dict[str, bool]:
+    """
+    Devuelve las opciones de run_experiment que forman parte de la clave de la caché (experiment_key).
+
+    Numba y los números aleatorios comunes dan el mismo resultado que `reward_tape=True`, por lo que
+    comparten su clave. `pseudo_regret` sólo se añade si está activo, para conservar las claves anteriores.
+    """
+    options = {'reward_tape': reward_tape or backend == 'numba' or common_random_numbers}
+    if pseudo_regret:
+        options['pseudo_regret'] = True
+    return options
+
+
+def run_experiment(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+                   seed: Optional[Union[int, Sequence[int]]] = None, reward_tape: bool = False,
+                   stats: Optional[ExperimentStatistics] = None, backend: str = 'numpy',
+                   cache: Optional['ResultsCache'] = None, profiler: Optional[Profiler] = None,
+                   common_random_numbers: bool = False, pseudo_regret: bool = False,
+                   final_regret: Optional[StreamingStats] = None):
+    """
+    Ejecuta experimentos comparativos entre diferentes algoritmos avanzando todas las ejecuciones a la vez.
+
+    :param bandit: Instancia de Bandit configurada para el experimento.
+    :param algorithms: Lista de instancias de algoritmos a comparar. Un hiperparámetro puede ser un
+                       vector (por ejemplo, EpsilonGreedy(k, epsilon=np.linspace(0, 0.3, 64))): todas sus
+                       configuraciones se simulan a la vez y cada una aporta una fila a los resultados,
+                       en el orden de expand_sweep(algorithms).
+    :param steps: Número de pasos de tiempo por ejecución.
+    :param runs: Número de ejecuciones independientes.
+    :param seed: Semilla para la reproducibilidad de los resultados: un entero o una secuencia de enteros,
+                 que se usa como entropía de np.random.SeedSequence (por ejemplo, [semilla, ronda] para
+                 derivar experimentos independientes de una misma semilla, como hace race).
+    :param reward_tape: Si es True se pre-generan las recompensas en una cinta (runs, steps, k).
+    :param stats: Acumulador opcional (ExperimentStatistics) donde se añaden la media, la varianza y
+                  los cuantiles por paso de cada métrica, por ejemplo para dibujar intervalos de confianza.
+    :param backend: 'numpy' (por defecto) o 'numba' para ejecutar el bucle de cada algoritmo compilado.
+                    Con 'numba' las recompensas se pre-generan en una cinta y el resultado coincide con
+                    el de `backend='numpy', reward_tape=True` para la misma semilla. Si Numba no está
+                    instalado se usa NumPy.
+    :param cache: Caché opcional de resultados (ResultsCache). Si el mismo experimento (bandit,
+                  algoritmos, steps, runs, semilla y opciones de cache_options) ya está guardado, se devuelven sus
+                  resultados mapeados en memoria de solo lectura sin simular. No se usa si no hay
+                  semilla, si se piden `stats` o `final_regret` o si el bandit ya tiene una cinta propia.
+    :param profiler: Perfilador opcional (Profiler) en el que se acumulan el tiempo y las llamadas de
+                     cada fase (select, pull, update y record, o kernel y record con Numba) por
+                     algoritmo, además de la preparación, la cinta, la caché y el promediado. Sin
+                     perfilador el bucle no tiene ningún coste adicional.
+    :param common_random_numbers: Si es True todos los algoritmos de una ejecución reciben las mismas
+                                  recompensas de cada brazo en cada paso, de modo que sus diferencias no
+                                  dependen del ruido de las recompensas. Equivale a `reward_tape=True`
+                                  (mismo resultado) pero las recompensas se generan por bloques de pasos
+                                  sin guardar la cinta completa.
+    :param pseudo_regret: Si es True el regret acumulado es el pseudo-regret sum_i gap_i * selecciones_i,
+                          calculado con las recompensas esperadas de los brazos elegidos (frente al
+                          brazo óptimo de cada paso si el bandit no es estacionario) en lugar de con
+                          las obtenidas. Su varianza entre ejecuciones es mucho menor, por lo que se
+                          necesitan menos ejecuciones para el mismo intervalo de confianza.
+    :param final_regret: Acumulador opcional (StreamingStats de forma (filas,)) donde se añaden la media y
+                         la varianza del regret acumulado final de cada fila de resultados. A diferencia
+                         de `stats`, no guarda nada por paso ni desactiva el registro por bloques.
+    :return: Recompensas promedio, porcentaje de selecciones óptimas, regret acumulado promedio,
+             selecciones por brazo y recompensa promedio por brazo.
+    :rtype: Tuple of (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray)
+    """
+    assert steps > 0, "El número de pasos debe ser mayor que 0."
+    assert runs > 0, "El número de ejecuciones debe ser mayor que 0."
+
+    key = None
+    if cache is not None and seed is not None and stats is None and final_regret is None and bandit.tape is None:
+        # La caché (y su hash e introspección de parámetros) sólo se carga si se usa
+        from simulation.cache import experiment_key
+        # El backend no forma parte de la clave: con Numba el resultado es el de NumPy con cinta
+        with section(profiler, 'cache'):
+            key = experiment_key(bandit, algorithms, steps, runs, seed,
+                                 **cache_options(reward_tape, backend, common_random_numbers, pseudo_regret))
+            results = cache.get(key)
+        if results is not None:
+            return results
+
+    sums = simulate(bandit, algorithms, steps, runs, np.random.SeedSequence(seed), reward_tape, stats, backend,
+                    profiler=profiler, common_random_numbers=common_random_numbers, pseudo_regret=pseudo_regret,
+                    final_regret=final_regret)
+    with section(profiler, 'finalize'):
+        results = finalize(sums, runs)
+
+    if key is not None:
+        with section(profiler, 'cache'):
+            cache.put(key, results)
+    return results
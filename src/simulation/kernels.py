@@ -0,0 +1,253 @@
+"""
+Module: simulation/kernels.py
+Description: Núcleos compilados con Numba del bucle selección/recompensa/actualización de cada algoritmo.
+
+Cada núcleo avanza un bloque de pasos de todas las ejecuciones de un algoritmo vectorizado
+(ver algorithms/batched.py), modificando en el sitio sus matrices de estado. Consume los mismos
+uniformes que la versión de NumPy y lee las recompensas de la cinta del bandit, por lo que, para una
+misma semilla, ambas versiones eligen los mismos brazos. Si Numba no está instalado los núcleos no
+están disponibles y el motor usa la versión de NumPy.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from algorithms.batched import (BatchedAlgorithm, BatchedEpsilonGreedy, BatchedGradientePreferencias,
+                                BatchedSoftmax, BatchedUCB1, BatchedUCB2)
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+    jit = numba.njit(cache=True, nogil=True)
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def jit(function):
+        return function
+
+
+@jit
+def _argmax(row):
+    best = 0
+    for j in range(1, row.shape[0]):
+        if row[j] > row[best]:
+            best = j
+    return best
+
+
+@jit
+def _update_mean(counts, values, r, arm, reward):
+    counts[r, arm] += 1
+    value = values[r, arm]
+    values[r, arm] = value + (reward - value) / counts[r, arm]
+
+
+@jit
+def _epsilon_greedy_kernel(counts, values, epsilon, u, tape, tape_rows, first_step, chosen, rewards):
+    runs, k = values.shape
+    for r in range(runs):
+        for s in range(u.shape[0]):
+            if u[s, 0, r] < epsilon[r]:
+                arm = int(u[s, 1, r] * k)
+            else:
+                arm = _argmax(values[r])
+            reward = tape[tape_rows[r], first_step + s, arm]
+            _update_mean(counts, values, r, arm, reward)
+            chosen[s, r] = arm
+            rewards[s, r] = reward
+
+
+@jit
+def _softmax_kernel(counts, values, tau, u, tape, tape_rows, first_step, chosen, rewards):
+    runs, k = values.shape
+    z = np.empty(k)
+    cdf = np.empty(k)
+    for r in range(runs):
+        for s in range(u.shape[0]):
+            for j in range(k):
+                z[j] = values[r, j] / tau[r]
+            z_max = z.max()
+            total = 0.0
+            for j in range(k):
+                total += math.exp(z[j] - z_max)
+                cdf[j] = total
+            target = u[s, 0, r] * total
+            arm = 0
+            while arm < k - 1 and cdf[arm] <= target:
+                arm += 1
+            reward = tape[tape_rows[r], first_step + s, arm]
+            _update_mean(counts, values, r, arm, reward)
+            chosen[s, r] = arm
+            rewards[s, r] = reward
+
+
+@jit
+def _ucb1_kernel(counts, values, total_counts, tape, tape_rows, first_step, n_steps, chosen, rewards):
+    runs, k = values.shape
+    for r in range(runs):
+        for s in range(n_steps):
+            t = total_counts + s + 1
+            arm = -1
+            for j in range(k):
+                if counts[r, j] == 0:
+                    arm = j
+                    break
+            if arm < 0:
+                bonus = 2 * math.log(t)
+                arm = 0
+                best = values[r, 0] + math.sqrt(bonus / counts[r, 0])
+                for j in range(1, k):
+                    ucb = values[r, j] + math.sqrt(bonus / counts[r, j])
+                    if ucb > best:
+                        best = ucb
+                        arm = j
+            reward = tape[tape_rows[r], first_step + s, arm]
+            _update_mean(counts, values, r, arm, reward)
+            chosen[s, r] = arm
+            rewards[s, r] = reward
+
+
+@jit
+def _ucb2_kernel(counts, values, epoch_counts, remaining_pulls, current_arm, alpha, total_counts,
+                 tape, tape_rows, first_step, n_steps, chosen, rewards):
+    runs, k = values.shape
+    for r in range(runs):
+        for s in range(n_steps):
+            t = total_counts + s + 1
+            arm = -1
+            for j in range(k):
+                if counts[r, j] == 0:
+                    arm = j
+                    break
+            if arm < 0:
+                if remaining_pulls[r] > 0:
+                    remaining_pulls[r] -= 1
+                    arm = current_arm[r]
+                else:
+                    arm = 0
+                    best = -np.inf
+                    for j in range(k):
+                        c = counts[r, j]
+                        ucb = values[r, j] + math.sqrt(((1 + alpha[r]) * math.log(t / c)) / (2 * c))
+                        if ucb > best:
+                            best = ucb
+                            arm = j
+                    tau = epoch_counts[r, arm]
+                    if tau == 0:
+                        tau = 1
+                    for j in range(k):
+                        epoch_counts[r, j] = counts[r, j]
+                    current_arm[r] = arm
+                    remaining_pulls[r] = tau - 1
+            reward = tape[tape_rows[r], first_step + s, arm]
+            _update_mean(counts, values, r, arm, reward)
+            chosen[s, r] = arm
+            rewards[s, r] = reward
+
+
+@jit
+def _gradient_kernel(counts, values, probabilities, total_reward, alpha, total_counts, u,
+                     tape, tape_rows, first_step, chosen, rewards):
+    runs, k = values.shape
+    exp_preferences = np.empty(k)
+    cdf = np.empty(k)
+    for r in range(runs):
+        for s in range(u.shape[0]):
+            v_max = values[r].max()
+            total = 0.0
+            for j in range(k):
+                exp_preferences[j] = math.exp(values[r, j] - v_max)
+                total += exp_preferences[j]
+                cdf[j] = total
+            for j in range(k):
+                probabilities[r, j] = exp_preferences[j] / total
+            target = u[s, 0, r] * total
+            arm = 0
+            while arm < k - 1 and cdf[arm] <= target:
+                arm += 1
+
+            reward = tape[tape_rows[r], first_step + s, arm]
+            counts[r, arm] += 1
+            total_reward[r] += reward
+            reward_error = reward - total_reward[r] / (total_counts + s + 1)
+            step = alpha[r] * reward_error
+            for j in range(k):
+                values[r, j] -= step * probabilities[r, j]
+            values[r, arm] += step
+            chosen[s, r] = arm
+            rewards[s, r] = reward
+
+
+def _per_run(value, runs: int) -> np.ndarray:
+    """
+    Devuelve un hiperparámetro como vector con un valor por ejecución.
+    """
+    return np.ascontiguousarray(np.broadcast_to(np.asarray(value, dtype=float), (runs,)))
+
+
+def has_kernel(policy: BatchedAlgorithm) -> bool:
+    """
+    Indica si hay un núcleo compilado para el algoritmo vectorizado.
+    """
+    return type(policy) in (BatchedEpsilonGreedy, BatchedSoftmax, BatchedUCB1, BatchedUCB2,
+                            BatchedGradientePreferencias)
+
+
+def advance(policy: BatchedAlgorithm, tape: np.ndarray, first_run: int, first_step: int,
+            n_steps: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Avanza `n_steps` pasos todas las ejecuciones de un algoritmo vectorizado con su núcleo compilado.
+
+    Los uniformes se piden al generador de la política con la misma forma y en el mismo orden que
+    `BatchedAlgorithm.select_arms`, por lo que el resultado coincide con el de la versión de NumPy.
+
+    :param policy: Algoritmo vectorizado cuyo estado se modifica en el sitio.
+    :param tape: Cinta de recompensas (runs, steps, k).
+    :param first_run: Fila de la cinta que corresponde a la primera ejecución. Las configuraciones de un
+                      barrido comparten las mismas filas de la cinta.
+    :param first_step: Primer paso de tiempo del bloque.
+    :param n_steps: Número de pasos del bloque.
+    :return: Brazos elegidos y recompensas obtenidas, ambos de forma (n_steps, runs).
+    """
+    runs = policy.runs
+    chosen = np.empty((n_steps, runs), dtype=np.int64)
+    rewards = np.empty((n_steps, runs))
+    u = policy.rng.random((n_steps, policy.n_uniforms, runs)) if policy.n_uniforms else None
+    tape_rows = first_run + policy.rows % policy.runs_per_configuration
+
+    if isinstance(policy, BatchedEpsilonGreedy):
+        _epsilon_greedy_kernel(policy.counts, policy.values, _per_run(policy.epsilon, runs), u,
+                               tape, tape_rows, first_step, chosen, rewards)
+    elif isinstance(policy, BatchedSoftmax):
+        _softmax_kernel(policy.counts, policy.values, _per_run(policy.tau, runs), u,
+                        tape, tape_rows, first_step, chosen, rewards)
+    elif isinstance(policy, BatchedUCB1):
+        _ucb1_kernel(policy.counts, policy.values, policy.total_counts,
+                     tape, tape_rows, first_step, n_steps, chosen, rewards)
+        policy.total_counts += n_steps
+    elif isinstance(policy, BatchedUCB2):
+        _ucb2_kernel(policy.counts, policy.values, policy.epoch_counts, policy.remaining_pulls,
+                     policy.current_arm, _per_run(policy.alpha, runs), policy.total_counts,
+                     tape, tape_rows, first_step, n_steps, chosen, rewards)
+        policy.total_counts += n_steps
+    elif isinstance(policy, BatchedGradientePreferencias):
+        _gradient_kernel(policy.counts, policy.values, policy.probabilities, policy.total_reward,
+                         _per_run(policy.alpha, runs), policy.total_counts, u,
+                         tape, tape_rows, first_step, chosen, rewards)
+        policy.total_counts += n_steps
+        policy.average_reward = policy.total_reward / policy.total_counts
+    else:
+        raise ValueError(f"No hay núcleo compilado para {type(policy).__name__}.")
+
+    return chosen, rewards
@@ -0,0 +1,150 @@
+"""
+Module: simulation/parallel.py
+Description: Versión paralela de run_experiment que reparte las ejecuciones entre varios procesos.
+
+Las ejecuciones se dividen en bloques de tamaño fijo y cada bloque recibe su propia semilla hija
+(np.random.SeedSequence.spawn). Como la división en bloques no depende del número de procesos y las
+sumas parciales se combinan siempre en el mismo orden, el resultado es idéntico bit a bit para
+cualquier número de procesos. Cada proceso escribe las sumas de su bloque en memoria compartida,
+de modo que las matrices por paso no se serializan de vuelta al proceso principal.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from algorithms import Algorithm, sweep_size
+from arms import Bandit
+from simulation.engine import finalize, simulate
+
+
+def _layout(n_blocks: int, n_algos: int, steps: int, k: int) -> List[Tuple[int, Tuple[int, ...]]]:
+    """
+    Calcula el desplazamiento (en bytes) y la forma de cada matriz de sumas dentro de la memoria compartida.
+    Orden: recompensas, selecciones óptimas, regret, selecciones por brazo y recompensas por brazo.
+    """
+    shapes = [(n_blocks, n_algos, steps)] * 3 + [(n_blocks, n_algos, k)] * 2
+    layout = []
+    offset = 0
+    for shape in shapes:
+        layout.append((offset, shape))
+        offset += int(np.prod(shape)) * np.dtype(np.float64).itemsize
+    return layout
+
+
+def _views(buffer, layout) -> List[np.ndarray]:
+    """
+    Devuelve las matrices de sumas como vistas sobre el buffer compartido.
+    """
+    return [np.ndarray(shape, dtype=np.float64, buffer=buffer, offset=offset) for offset, shape in layout]
+
+
+# Estado de cada proceso trabajador, fijado una sola vez por _init_worker
+_worker = {}
+
+
+def _init_worker(bandit: Bandit, algorithms: List[Algorithm], steps: int, reward_tape: bool, shm_name: str, layout,
+                 common_random_numbers: bool = False, pseudo_regret: bool = False):
+    _worker['bandit'] = bandit
+    _worker['algorithms'] = algorithms
+    _worker['steps'] = steps
+    _worker['reward_tape'] = reward_tape
+    _worker['common_random_numbers'] = common_random_numbers
+    _worker['pseudo_regret'] = pseudo_regret
+    _worker['shm'] = shared_memory.SharedMemory(name=shm_name)
+    _worker['views'] = _views(_worker['shm'].buf, layout)
+
+
+def _run_block(block: int, runs: int, seed_seq: np.random.SeedSequence) -> int:
+    """
+    Simula un bloque de ejecuciones y escribe sus sumas en la posición `block` de la memoria compartida.
+    """
+    sums = simulate(_worker['bandit'], _worker['algorithms'], _worker['steps'], runs, seed_seq,
+                    _worker['reward_tape'], common_random_numbers=_worker['common_random_numbers'],
+                    pseudo_regret=_worker['pseudo_regret'])
+    for view, values in zip(_worker['views'], sums):
+        view[block] = values
+    return block
+
+
+def run_experiment_parallel(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+                            seed: Optional[int] = None, workers: Optional[int] = None,
+                            block_runs: int = 128, reward_tape: bool = False, common_random_numbers: bool = False,
+                            pseudo_regret: bool = False):
+    """
+    Ejecuta el experimento repartiendo bloques de ejecuciones entre varios procesos.
+
+    El resultado sólo depende de `seed` y `block_runs`, nunca del número de procesos. Cada bloque usa
+    su propia semilla hija, por lo que al cambiar `block_runs` cambian las recompensas simuladas: el
+    resultado es estadísticamente equivalente, pero no idéntico, al de otro tamaño de bloque o al de
+    run_experiment con la misma semilla.
+
+    A diferencia de run_experiment, no admite `stats` (ExperimentStatistics), `final_regret`, `cache`
+    ni `backend`: sólo devuelve las medias. Para intervalos de confianza o cuantiles por paso hay que
+    usar run_experiment.
+
+    :param bandit: Instancia de Bandit configurada para el experimento.
+    :param algorithms: Lista de instancias de algoritmos a comparar.
+    :param steps: Número de pasos de tiempo por ejecución.
+    :param runs: Número de ejecuciones independientes.
+    :param seed: Semilla para la reproducibilidad de los resultados.
+    :param workers: Número de procesos. Si es None se usan todos los núcleos disponibles.
+    :param block_runs: Número de ejecuciones de cada bloque. Forma parte de la semilla efectiva del experimento.
+    :param reward_tape: Si es True cada bloque pre-genera sus recompensas en una cinta.
+    :param common_random_numbers: Si es True los algoritmos de cada ejecución reciben las mismas
+                                  recompensas, como en run_experiment.
+    :param pseudo_regret: Si es True se devuelve el pseudo-regret, como en run_experiment.
+    :return: Recompensas promedio, porcentaje de selecciones óptimas, regret acumulado promedio,
+             selecciones por brazo y recompensa promedio por brazo.
+    :rtype: Tuple of (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray)
+    """
+    assert steps > 0, "El número de pasos debe ser mayor que 0."
+    assert runs > 0, "El número de ejecuciones debe ser mayor que 0."
+    assert block_runs > 0, "El tamaño de bloque debe ser mayor que 0."
+    assert bandit.tape is None, "La versión paralela genera sus propias recompensas; quite la cinta del bandit."
+
+    n_blocks = -(-runs // block_runs)
+    block_sizes = [min(block_runs, runs - block * block_runs) for block in range(n_blocks)]
+    block_seeds = np.random.SeedSequence(seed).spawn(n_blocks)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, n_blocks))
+
+    n_rows = sum(sweep_size(algo) for algo in algorithms)
+    layout = _layout(n_blocks, n_rows, steps, bandit.k)
+    size = layout[-1][0] + int(np.prod(layout[-1][1])) * np.dtype(np.float64).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        initargs = (bandit, algorithms, steps, reward_tape, shm.name, layout, common_random_numbers, pseudo_regret)
+        if workers == 1:
+            _init_worker(*initargs)
+            try:
+                for block, (block_size, block_seed) in enumerate(zip(block_sizes, block_seeds)):
+                    _run_block(block, block_size, block_seed)
+            finally:
+                _worker.pop('views', None)
+                _worker.pop('shm').close()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+                list(executor.map(_run_block, range(n_blocks), block_sizes, block_seeds))
+
+        # Las sumas parciales se combinan siempre en el orden de los bloques
+        sums = tuple(np.sum(view, axis=0) for view in _views(shm.buf, layout))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return finalize(sums, runs)
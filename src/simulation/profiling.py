@@ -0,0 +1,182 @@
+"""
+Module: simulation/profiling.py
+Description: Perfilado opcional por fases del bucle de simulación.
+
+El motor acepta un Profiler (`run_experiment(..., profiler=Profiler())`) y, sólo en ese caso,
+sustituye las llamadas de cada fase (selección, recompensas, actualización, registro de métricas o
+núcleo compilado) por versiones cronometradas antes de entrar en el bucle. Sin profiler el bucle
+llama directamente a los métodos originales, por lo que no hay coste adicional.
+
+El resultado es un informe con el tiempo total y el número de llamadas por algoritmo y fase, y
+opcionalmente una traza en formato Chrome (chrome://tracing o https://ui.perfetto.dev) con una
+fila por algoritmo.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Etiqueta de las fases que no pertenecen a ningún algoritmo (preparación, cinta, caché...)
+EXPERIMENT = 'experiment'
+
+
+def algorithm_label(algo) -> str:
+    """
+    Devuelve una etiqueta legible de un algoritmo con sus hiperparámetros escalares; de los
+    vectoriales (barridos) sólo se indica la longitud.
+    """
+    from simulation.cache import get_params
+
+    params = []
+    for name, value in get_params(algo).items():
+        if name == 'rng' or value is None:
+            continue
+        if np.ndim(value) > 0:
+            params.append(f"{name}=[{np.size(value)}]")
+        else:
+            params.append(f"{name}={value}")
+    return f"{type(algo).__name__}({', '.join(params)})"
+
+
+def algorithm_labels(algorithms: list) -> List[str]:
+    """
+    Devuelve la etiqueta de cada algoritmo, añadiendo su posición a las que se repiten.
+    """
+    labels = [algorithm_label(algo) for algo in algorithms]
+    return [f"{label} #{i}" if labels.count(label) > 1 else label for i, label in enumerate(labels)]
+
+
+class Profiler:
+
+    def __init__(self, trace: bool = False, max_events: int = 1_000_000):
+        """
+        Inicializa un perfilador vacío.
+
+        :param trace: Si es True se guarda cada llamada como evento para exportar una traza de Chrome.
+        :param max_events: Número máximo de eventos guardados; a partir de ahí sólo se acumulan totales.
+        """
+        self.trace = trace
+        self.max_events = max_events
+        self.time_ns: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.calls: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # Eventos (etiqueta, fase, inicio, fin) en ns de perf_counter
+        self.events: List[tuple] = []
+        self.origin = time.perf_counter_ns()
+
+    def add(self, label: str, phase: str, start: int, end: int):
+        """
+        Añade una llamada de una fase de un algoritmo, con sus instantes de inicio y fin en ns (perf_counter_ns).
+        """
+        self.time_ns[label][phase] += end - start
+        self.calls[label][phase] += 1
+        if self.trace and len(self.events) < self.max_events:
+            self.events.append((label, phase, start, end))
+
+    def wrap(self, label: str, phase: str, function: Callable) -> Callable:
+        """
+        Devuelve una versión de `function` que cronometra cada llamada como la fase `phase` de `label`.
+        """
+        clock = time.perf_counter_ns
+        add = self.add
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                add(label, phase, start, clock())
+        return timed
+
+    @contextmanager
+    def section(self, phase: str, label: str = EXPERIMENT):
+        """
+        Cronometra un bloque de código como la fase `phase` de `label`.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(label, phase, start, time.perf_counter_ns())
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Devuelve, por etiqueta y fase, el número de llamadas, el tiempo total (s), el tiempo medio por
+        llamada (µs) y la fracción del tiempo total medido.
+        """
+        total = sum(sum(phases.values()) for phases in self.time_ns.values())
+        report = {}
+        for label, phases in self.time_ns.items():
+            report[label] = {
+                phase: {
+                    'calls': self.calls[label][phase],
+                    'total_s': elapsed / 1e9,
+                    'mean_us': elapsed / 1e3 / self.calls[label][phase],
+                    'fraction': elapsed / total if total else 0.0,
+                }
+                for phase, elapsed in phases.items()
+            }
+        return report
+
+    def format_report(self) -> str:
+        """
+        Da formato de tabla al informe, ordenado por tiempo total descendente.
+        """
+        rows = [(label, phase, values) for label, phases in self.report().items() for phase, values in phases.items()]
+        rows.sort(key=lambda row: row[2]['total_s'], reverse=True)
+        width = max([len('algoritmo')] + [len(label) for label, _, _ in rows])
+        lines = [f"{'algoritmo':{width}s} {'fase':>8s} {'llamadas':>10s} {'total (s)':>10s} {'media (µs)':>11s} {'%':>6s}"]
+        for label, phase, values in rows:
+            lines.append(f"{label:{width}s} {phase:>8s} {values['calls']:10d} {values['total_s']:10.4f} "
+                         f"{values['mean_us']:11.2f} {values['fraction']:6.1%}")
+        return '\n'.join(lines)
+
+    def write_chrome_trace(self, path: str):
+        """
+        Escribe los eventos guardados (requiere `trace=True`) en formato Chrome Trace Event, con una
+        fila (tid) por etiqueta.
+        """
+        assert self.trace, "La traza requiere crear el Profiler con trace=True."
+
+        lanes = {}
+        events = []
+        for label, phase, start, end in self.events:
+            tid = lanes.setdefault(label, len(lanes))
+            events.append({'name': phase, 'cat': label, 'ph': 'X', 'pid': os.getpid(), 'tid': tid,
+                           'ts': (start - self.origin) / 1e3, 'dur': (end - start) / 1e3})
+        # Metadatos para que cada fila muestre el nombre del algoritmo
+        for label, tid in lanes.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': label}})
+
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+
+def section(profiler: Optional[Profiler], phase: str, label: str = EXPERIMENT):
+    """
+    Devuelve `profiler.section(phase, label)` o, si no hay profiler, un contexto vacío.
+    """
+    return nullcontext() if profiler is None else profiler.section(phase, label)
+
+
+def instrument(profiler: Optional[Profiler], label: str, **functions: Callable) -> List[Callable]:
+    """
+    Devuelve las funciones de cada fase (en el orden de los argumentos) tal cual o, si hay profiler,
+    cronometradas como la fase de su nombre de `label`.
+    """
+    if profiler is None:
+        return list(functions.values())
+    return [profiler.wrap(label, phase, function) for phase, function in functions.items()]
@@ -0,0 +1,133 @@
+"""
+Module: simulation/racing.py
+Description: Carrera por rondas (successive halving) para buscar hiperparámetros sin simular por completo las configuraciones malas.
+
+Todas las configuraciones empiezan con pocas ejecuciones y el presupuesto de ejecuciones se
+multiplica por `eta` en cada ronda. Tras cada ronda se calcula el intervalo de confianza del regret
+acumulado final de cada configuración superviviente y se descartan las dominadas: aquellas cuyo
+límite inferior supera el límite superior de alguna otra. Las supervivientes de una misma clase se
+simulan juntas como un barrido, por lo que comparten la cinta de recompensas de cada ronda.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from algorithms import Algorithm, expand_sweep, sweep_size
+from algorithms.batched import select_configurations
+from arms import Bandit
+from simulation.engine import run_experiment
+from simulation.statistics import StreamingStats
+
+
+def _survivor_algorithms(algorithms: List[Algorithm], offsets: np.ndarray, alive: np.ndarray) -> List[Algorithm]:
+    """
+    Construye la lista de algoritmos que simula sólo las configuraciones vivas, en el orden de expand_sweep.
+    """
+    survivors = []
+    for i, algo in enumerate(algorithms):
+        selected = np.flatnonzero(alive[offsets[i]:offsets[i + 1]])
+        if selected.size:
+            survivors.append(select_configurations(algo, selected))
+    return survivors
+
+
+def race(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int, seed: Optional[int] = None,
+         min_runs: int = 16, eta: int = 2, z: float = 1.96, reward_tape: bool = False,
+         backend: str = 'numpy', common_random_numbers: bool = False, pseudo_regret: bool = False) -> Dict:
+    """
+    Compara configuraciones de algoritmos por rondas, descartando las que tienen un regret acumulado
+    final claramente peor que el de alguna otra.
+
+    En la ronda r cada configuración viva acumula min(runs, min_runs * eta^r) ejecuciones. La carrera
+    termina cuando las supervivientes alcanzan `runs` ejecuciones o sólo queda una.
+
+    :param bandit: Instancia de Bandit configurada para el experimento.
+    :param algorithms: Algoritmos a comparar, con o sin barridos (por ejemplo, UCB2(k, alpha=np.linspace(0.1, 1, 10))).
+    :param steps: Número de pasos de tiempo por ejecución.
+    :param runs: Número máximo de ejecuciones por configuración.
+    :param seed: Semilla para la reproducibilidad de los resultados.
+    :param min_runs: Ejecuciones por configuración en la primera ronda.
+    :param eta: Factor por el que crece el presupuesto de ejecuciones en cada ronda.
+    :param z: Cuantil de la normal estándar del intervalo de confianza (1.96 para un 95%).
+    :param reward_tape: Si es True se pre-generan las recompensas de cada ronda en una cinta.
+    :param backend: 'numpy' o 'numba', como en run_experiment.
+    :param common_random_numbers: Si es True las configuraciones de cada ronda reciben las mismas
+                                  recompensas, como en run_experiment.
+    :param pseudo_regret: Si es True se compara el pseudo-regret, cuyos intervalos de confianza son más
+                          estrechos, por lo que las configuraciones peores se descartan antes.
+    :return: Diccionario con las configuraciones supervivientes ('survivors' y su índice en
+             expand_sweep(algorithms), 'indices'), la media y el intervalo de confianza del regret
+             acumulado final de todas las configuraciones ('mean', 'lower', 'upper'), las ejecuciones
+             simuladas de cada una ('runs'), el número de configuraciones vivas en cada ronda
+             ('rounds'), los pasos simulados frente a los de simular todo ('pulls', 'full_pulls') y
+             la fracción de cómputo ahorrada ('saved').
+    """
+    assert steps > 0, "El número de pasos debe ser mayor que 0."
+    assert 0 < min_runs <= runs, "El número inicial de ejecuciones debe estar entre 1 y runs."
+    assert eta > 1, "El factor de crecimiento eta debe ser mayor que 1."
+
+    candidates = expand_sweep(algorithms)
+    offsets = np.concatenate(([0], np.cumsum([sweep_size(algo) for algo in algorithms])))
+    n = len(candidates)
+
+    # Cada ronda usa ejecuciones nuevas, con una semilla derivada de la semilla de la carrera
+    entropy = np.random.SeedSequence(seed).entropy
+
+    final_regret = StreamingStats((n,))
+    alive = np.ones(n, dtype=bool)
+    completed = 0
+    rounds = []
+    budget = min_runs
+    while True:
+        new_runs = budget - completed
+        indices = np.flatnonzero(alive)
+        # Sólo se acumula el regret del último paso de cada ejecución, no el de todos los pasos
+        survivor_regret = StreamingStats((indices.size,))
+        run_experiment(bandit, _survivor_algorithms(algorithms, offsets, alive), steps, new_runs,
+                       seed=[entropy, len(rounds)], reward_tape=reward_tape, backend=backend,
+                       common_random_numbers=common_random_numbers, pseudo_regret=pseudo_regret,
+                       final_regret=survivor_regret)
+
+        # Se acumulan las ejecuciones de la ronda con las anteriores (fórmula de Chan)
+        round_regret = StreamingStats((n,))
+        round_regret.count[indices] = survivor_regret.count
+        round_regret.mean[indices] = survivor_regret.mean
+        round_regret.m2[indices] = survivor_regret.m2
+        final_regret.merge(round_regret)
+
+        completed = budget
+        rounds.append({'runs': completed, 'candidates': int(indices.size)})
+
+        # Una configuración está dominada si su límite inferior supera el mejor límite superior
+        lower, upper = final_regret.confidence_interval(z)
+        alive &= lower <= upper[alive].min()
+        if completed >= runs or alive.sum() == 1:
+            break
+        budget = min(runs, budget * eta)
+
+    lower, upper = final_regret.confidence_interval(z)
+    pulls = int(final_regret.count.sum()) * steps
+    full_pulls = n * runs * steps
+    indices = np.flatnonzero(alive)
+    return {
+        'survivors': [candidates[i] for i in indices],
+        'indices': indices,
+        'mean': final_regret.mean,
+        'lower': lower,
+        'upper': upper,
+        'runs': final_regret.count,
+        'rounds': rounds,
+        'pulls': pulls,
+        'full_pulls': full_pulls,
+        'saved': 1 - pulls / full_pulls,
+    }
@@ -0,0 +1,285 @@
+"""
+Module: simulation/scheduler.py
+Description: Plan declarativo de experimentos (JSON o TOML) y planificador que lo ejecuta en varios procesos.
+
+Un plan describe una o varias familias de experimentos. Las claves del nivel superior son valores
+por defecto y cada entrada de `experiments` los sobrescribe. Las claves k, arms, steps, runs y seed
+admiten una lista, en cuyo caso se genera un trabajo por cada combinación. Un hiperparámetro de un
+algoritmo dado como lista es un barrido (se simulan todas sus configuraciones a la vez). Por ejemplo:
+
+    seed = 42
+    steps = 1000
+    runs = 500
+
+    [[experiments]]
+    name = "epsilon"
+    k = [10, 20, 30]
+    arms = ["normal", {type = "binomial", n = 10}, "bernoulli"]
+    algorithms = [{type = "EpsilonGreedy", epsilon = [0.0, 0.01, 0.1]}, {type = "UCB1"}]
+
+Los trabajos idénticos (misma clave de experimento que la caché de resultados) se simulan una sola
+vez. El resto se reparten entre los procesos de mayor a menor coste estimado (LPT), de modo que el
+plan termina aproximadamente en el tiempo de su trabajo más largo, y los resultados se devuelven a
+medida que termina cada trabajo.
+
+    python -m simulation.scheduler plan.toml --output resultados/
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import algorithms as algorithms_module
+import arms as arms_module
+from algorithms import Algorithm, sweep_size
+from arms import Bandit
+from simulation.engine import cache_options, run_experiment
+
+# Claves que, dadas como lista, generan un trabajo por valor
+AXES = ('k', 'arms', 'steps', 'runs', 'seed')
+# Valores por defecto de las claves que no indica el plan
+DEFAULTS = {'arms': 'normal', 'seed': None, 'reward_tape': False, 'backend': 'numpy', 'common_random_numbers': False,
+            'pseudo_regret': False}
+# Nombres cortos de los tipos de brazo
+ARM_TYPES = {'normal': 'ArmNormal', 'binomial': 'ArmBinomial', 'bernoulli': 'ArmBernoulli'}
+# Nombres de las métricas devueltas por run_experiment, en orden
+RESULT_NAMES = ('rewards', 'optimal_selections', 'regrets', 'arm_counts', 'arm_avg_rewards')
+
+
+def load_plan(path: str) -> Dict[str, Any]:
+    """
+    Lee un plan de experimentos de un fichero JSON o TOML (según su extensión).
+
+    :param path: Ruta del fichero (.json o .toml).
+    :return: Plan como diccionario.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    assert extension in ('.json', '.toml'), "El plan debe ser un fichero .json o .toml."
+
+    if extension == '.json':
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    import tomllib
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
+
+def _as_list(value) -> list:
+    return list(value) if isinstance(value, list) else [value]
+
+
+def _arms_label(arms) -> str:
+    return arms if isinstance(arms, str) else arms['type']
+
+
+def expand_plan(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Expande un plan en la lista de trabajos que describe, uno por cada combinación de los valores de
+    las claves de AXES dadas como lista.
+
+    :param plan: Plan de experimentos (ver la descripción del módulo).
+    :return: Trabajos con las claves name, k, arms, algorithms, steps, runs, seed, reward_tape, backend,
+             common_random_numbers y pseudo_regret.
+    """
+    defaults = {**DEFAULTS, **{key: value for key, value in plan.items() if key != 'experiments'}}
+    experiments = plan.get('experiments', [{}])
+
+    jobs = []
+    for i, experiment in enumerate(experiments):
+        spec = {**defaults, **experiment}
+        for key in ('k', 'algorithms', 'steps', 'runs'):
+            if key not in spec:
+                raise ValueError(f"El experimento {spec.get('name', i)} no indica '{key}'.")
+
+        varying = [key for key in AXES if isinstance(spec[key], list) and len(spec[key]) > 1]
+        for values in itertools.product(*(_as_list(spec[key]) for key in AXES)):
+            job = {**spec, **dict(zip(AXES, values))}
+            job['name'] = spec.get('name', f"experiment{i}")
+            if varying:
+                labels = [f"{key}={_arms_label(job[key]) if key == 'arms' else job[key]}" for key in varying]
+                job['name'] += f"[{','.join(labels)}]"
+            jobs.append(job)
+    return jobs
+
+
+def build_bandit(job: Dict[str, Any]) -> Bandit:
+    """
+    Construye el bandit de un trabajo. Las medias de los brazos se generan con la semilla del trabajo.
+    """
+    spec = {'type': job['arms']} if isinstance(job['arms'], str) else dict(job['arms'])
+    name = spec.pop('type')
+    arm_class = getattr(arms_module, ARM_TYPES.get(name.lower(), name))
+    rng = None if job['seed'] is None else np.random.default_rng(job['seed'])
+    return Bandit(arms=arm_class.generate_arms(job['k'], **spec, rng=rng))
+
+
+def build_algorithms(job: Dict[str, Any]) -> List[Algorithm]:
+    """
+    Construye los algoritmos de un trabajo. Los hiperparámetros dados como lista se convierten en vectores (barridos).
+    """
+    built = []
+    for spec in job['algorithms']:
+        params = {key: np.asarray(value) if isinstance(value, list) else value
+                  for key, value in spec.items() if key != 'type'}
+        built.append(getattr(algorithms_module, spec['type'])(k=job['k'], **params))
+    return built
+
+
+def job_key(job: Dict[str, Any], bandit: Bandit, algorithms: List[Algorithm]) -> Optional[str]:
+    """
+    Devuelve la clave de experimento de un trabajo (la de ResultsCache), o None si no tiene semilla y
+    por tanto no es reproducible.
+
+    :param job: Trabajo de expand_plan.
+    :param bandit: Bandit del trabajo (build_bandit).
+    :param algorithms: Algoritmos del trabajo (build_algorithms).
+    """
+    if job['seed'] is None:
+        return None
+    from simulation.cache import experiment_key
+    return experiment_key(bandit, algorithms, job['steps'], job['runs'], job['seed'],
+                          **cache_options(job['reward_tape'], job['backend'], job['common_random_numbers'],
+                                          job['pseudo_regret']))
+
+
+def estimate_cost(job: Dict[str, Any], algorithms: List[Algorithm]) -> float:
+    """
+    Coste relativo estimado de un trabajo: pasos x ejecuciones x configuraciones x brazos.
+
+    :param job: Trabajo de expand_plan.
+    :param algorithms: Algoritmos del trabajo (build_algorithms).
+    """
+    configurations = sum(sweep_size(algo) for algo in algorithms)
+    return float(job['steps']) * job['runs'] * configurations * job['k']
+
+
+def schedule(jobs: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], List[str]]]:
+    """
+    Elimina los trabajos repetidos y ordena el resto de mayor a menor coste estimado.
+
+    :param jobs: Trabajos de expand_plan.
+    :return: Pares (trabajo, nombres de todos los trabajos idénticos a él), en el orden de ejecución.
+    """
+    unique = {}
+    for i, job in enumerate(jobs):
+        # Los algoritmos (y el bandit, si hay semilla) se construyen una vez para la clave y el coste
+        algorithms = build_algorithms(job)
+        key = None if job['seed'] is None else job_key(job, build_bandit(job), algorithms)
+        key = i if key is None else key
+        if key in unique:
+            unique[key][1].append(job['name'])
+        else:
+            unique[key] = (job, [job['name']], estimate_cost(job, algorithms))
+    ordered = sorted(unique.values(), key=lambda item: item[2], reverse=True)
+    return [(job, names) for job, names, _ in ordered]
+
+
+def run_job(job: Dict[str, Any], cache_dir: Optional[str] = None) -> Tuple[Tuple[np.ndarray, ...], float]:
+    """
+    Ejecuta un trabajo con run_experiment.
+
+    :param job: Trabajo de expand_plan.
+    :param cache_dir: Directorio opcional de una ResultsCache compartida entre procesos y ejecuciones.
+    :return: Resultados de run_experiment y segundos empleados.
+    """
+    start = time.perf_counter()
+    cache = None
+    if cache_dir is not None:
+        from simulation.cache import ResultsCache
+        cache = ResultsCache(cache_dir)
+    results = run_experiment(build_bandit(job), build_algorithms(job), job['steps'], job['runs'], job['seed'],
+                             reward_tape=job['reward_tape'], backend=job['backend'], cache=cache,
+                             common_random_numbers=job['common_random_numbers'], pseudo_regret=job['pseudo_regret'])
+    # Los resultados de la caché están mapeados en memoria: se copian para enviarlos de vuelta
+    return tuple(np.array(result) for result in results), time.perf_counter() - start
+
+
+def run_plan(plan: Dict[str, Any], processes: Optional[int] = None,
+             cache_dir: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Ejecuta todos los trabajos de un plan y devuelve sus resultados a medida que terminan.
+
+    Por ejemplo:
+
+        for result in run_plan(load_plan('plan.toml')):
+            rewards, optimal_selections, regrets, arm_counts, arm_avg_rewards = result['results']
+
+    :param plan: Plan de experimentos (ver la descripción del módulo).
+    :param processes: Número de procesos (por defecto, el número de CPUs). Con 1 se ejecuta en el proceso actual.
+    :param cache_dir: Directorio opcional de una ResultsCache en la que se guardan y buscan los resultados.
+    :return: Iterador de diccionarios con el trabajo ('job'), los nombres de todos los trabajos
+             idénticos que cubre ('names'), los resultados de run_experiment ('results') y los
+             segundos que ha tardado ('elapsed').
+    """
+    scheduled = schedule(expand_plan(plan))
+    processes = max(1, min(processes or os.cpu_count() or 1, len(scheduled) or 1))
+
+    if processes == 1:
+        for job, names in scheduled:
+            results, elapsed = run_job(job, cache_dir)
+            yield {'job': job, 'names': names, 'results': results, 'elapsed': elapsed}
+        return
+
+    executor = ProcessPoolExecutor(max_workers=processes)
+    try:
+        # Se envían en orden de coste, así que cada proceso que queda libre toma el trabajo pendiente más largo
+        pending = {executor.submit(run_job, job, cache_dir): (job, names) for job, names in scheduled}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                job, names = pending.pop(future)
+                results, elapsed = future.result()
+                yield {'job': job, 'names': names, 'results': results, 'elapsed': elapsed}
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _file_name(name: str) -> str:
+    return re.sub(r'[^\w.=-]+', '_', name).strip('_') + '.npz'
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ejecuta un plan desde la línea de comandos y guarda los resultados de cada trabajo en un .npz.
+    """
+    parser = argparse.ArgumentParser(description="Ejecuta un plan de experimentos (JSON o TOML) en varios procesos.")
+    parser.add_argument('plan', help="Fichero del plan (.json o .toml).")
+    parser.add_argument('--processes', type=int, help="Número de procesos (por defecto, el número de CPUs).")
+    parser.add_argument('--output', help="Directorio donde guardar un .npz por trabajo.")
+    parser.add_argument('--cache', help="Directorio de la caché de resultados.")
+    args = parser.parse_args(argv)
+
+    plan = load_plan(args.plan)
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    start = time.perf_counter()
+    for result in run_plan(plan, args.processes, args.cache):
+        print(f"{', '.join(result['names'])}: {result['elapsed']:.2f} s", flush=True)
+        if args.output:
+            for name in result['names']:
+                np.savez(os.path.join(args.output, _file_name(name)), **dict(zip(RESULT_NAMES, result['results'])))
+    print(f"Total: {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+Module: simulation/statistics.py
+Description: Acumuladores en streaming de las métricas por paso de un experimento.
+
+Para cada algoritmo y paso de tiempo se mantiene la media y la varianza entre ejecuciones con el
+algoritmo de Welford (combinando lotes con la fórmula de Chan) y, opcionalmente, cuantiles estimados
+con el algoritmo P² de Jain y Chlamtac. No se guarda ninguna traza por ejecución.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/18
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+
+class P2Quantile:
+
+    def __init__(self, shape: Tuple[int, ...], q: float):
+        """
+        Inicializa un estimador P² del cuantil q para cada celda de una matriz.
+
+        :param shape: Forma de la matriz de celdas (por ejemplo, (algoritmos, pasos)).
+        :param q: Cuantil a estimar, en (0, 1).
+        """
+        assert 0 < q < 1, "El cuantil q debe estar en (0, 1)."
+
+        self.q = q
+        self.count = np.zeros(shape, dtype=int)
+        # Alturas y posiciones (empezando en 1) de los cinco marcadores de cada celda
+        self.heights = np.zeros(shape + (5,))
+        self.positions = np.zeros(shape + (5,))
+        self.desired = np.zeros(shape + (5,))
+        self.increments = np.array([0, q / 2, q, (1 + q) / 2, 1])
+
+    def update(self, index, values: np.ndarray):
+        """
+        Añade un lote de observaciones a una celda.
+
+        Si la celda está vacía y el lote tiene al menos cinco valores, los marcadores se colocan
+        directamente en los estadísticos de orden del lote, que es el estado al que converge P².
+
+        :param index: Índice de la celda.
+        :param values: Observaciones de la celda.
+        """
+        values = np.ravel(values)
+        if self.count[index] == 0 and values.size >= 5:
+            self._init_from_batch(index, np.sort(values))
+            return
+
+        for value in values:
+            self._insert(index, value)
+
+    def _init_from_batch(self, index, values: np.ndarray):
+        n = values.size
+        desired = 1 + (n - 1) * self.increments
+        # Las posiciones de los marcadores deben ser estrictamente crecientes y estar entre 1 y n:
+        # el marcador i queda en [1 + i, n - 4 + i] y después se separa del anterior si coinciden
+        markers = np.arange(5)
+        positions = np.clip(np.rint(desired), 1 + markers, n - 4 + markers)
+        for i in range(1, 5):
+            positions[i] = max(positions[i], positions[i - 1] + 1)
+
+        self.count[index] = n
+        self.positions[index] = positions
+        self.desired[index] = desired
+        self.heights[index] = values[positions.astype(int) - 1]
+
+    def _insert(self, index, value: float):
+        count = self.count[index]
+        heights = self.heights[index]
+
+        if count < 5:
+            # Los cinco primeros valores se guardan ordenados tal cual
+            heights[:count + 1] = np.sort(np.append(heights[:count], value))
+            self.count[index] = count + 1
+            if count + 1 == 5:
+                self.positions[index] = np.arange(1, 6)
+                self.desired[index] = 1 + 4 * self.increments
+            return
+
+        positions = self.positions[index]
+        desired = self.desired[index]
+
+        # Celda en la que cae el valor y ajuste de los extremos
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = int(np.searchsorted(heights, value, side='right')) - 1
+
+        positions[cell + 1:] += 1
+        desired += self.increments
+        self.count[index] = count + 1
+
+        # Ajuste de los marcadores intermedios con interpolación parabólica (o lineal si se sale de rango)
+        for i in range(1, 4):
+            d = desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                s = 1 if d > 0 else -1
+                parabolic = heights[i] + s / (positions[i + 1] - positions[i - 1]) * (
+                    (positions[i] - positions[i - 1] + s) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i])
+                    + (positions[i + 1] - positions[i] - s) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1]))
+                if heights[i - 1] < parabolic < heights[i + 1]:
+                    heights[i] = parabolic
+                else:
+                    heights[i] = heights[i] + s * (heights[i + s] - heights[i]) / (positions[i + s] - positions[i])
+                positions[i] += s
+
+    def value(self) -> np.ndarray:
+        """
+        Devuelve la estimación del cuantil de cada celda.
+        """
+        estimate = self.heights[..., 2].copy()
+        # Con menos de cinco observaciones se usa el cuantil exacto de las guardadas
+        for index in zip(*np.nonzero((self.count > 0) & (self.count < 5))):
+            estimate[index] = np.quantile(self.heights[index][:self.count[index]], self.q)
+        return estimate
+
+
+class StreamingStats:
+
+    def __init__(self, shape: Tuple[int, ...], quantiles: Sequence[float] = ()):
+        """
+        Inicializa un acumulador de media y varianza por celda.
+
+        :param shape: Forma de la matriz de celdas (por ejemplo, (algoritmos, pasos)).
+        :param quantiles: Cuantiles a estimar con P² en cada celda.
+        """
+        self.shape = tuple(shape)
+        self.count = np.zeros(self.shape, dtype=int)
+        self.mean = np.zeros(self.shape)
+        # Suma de cuadrados de las diferencias respecto a la media (M2 de Welford)
+        self.m2 = np.zeros(self.shape)
+        self.quantiles: Dict[float, P2Quantile] = {q: P2Quantile(self.shape, q) for q in quantiles}
+
+    def update(self, index, values: np.ndarray):
+        """
+        Añade un lote de observaciones a una celda.
+
+        :param index: Índice de la celda.
+        :param values: Observaciones de la celda.
+        """
+        values = np.asarray(values, dtype=float)
+        n_b = values.size
+        if n_b == 0:
+            return
+
+        mean_b = values.mean()
+        m2_b = np.sum((values - mean_b) ** 2)
+
+        n_a = self.count[index]
+        n = n_a + n_b
+        delta = mean_b - self.mean[index]
+
+        self.mean[index] += delta * n_b / n
+        self.m2[index] += m2_b + delta ** 2 * n_a * n_b / n
+        self.count[index] = n
+
+        for sketch in self.quantiles.values():
+            sketch.update(index, values)
+
+    def merge(self, other: 'StreamingStats'):
+        """
+        Combina en este acumulador las observaciones de otro con la misma forma.
+
+        :param other: Acumulador a combinar.
+        :raises ValueError: Si alguno de los dos estima cuantiles, ya que P² no admite combinación.
+        """
+        assert self.shape == other.shape, "Los acumuladores deben tener la misma forma."
+        if self.quantiles or other.quantiles:
+            raise ValueError("Los cuantiles P² no se pueden combinar.")
+
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.mean = np.where(n > 0, self.mean + delta * other.count / n, 0.0)
+            self.m2 = np.where(n > 0, self.m2 + other.m2 + delta ** 2 * self.count * other.count / n, 0.0)
+        self.count = n
+
+    def variance(self) -> np.ndarray:
+        """
+        Devuelve la varianza muestral de cada celda.
+        """
+        return np.divide(self.m2, self.count - 1, out=np.zeros(self.shape), where=self.count > 1)
+
+    def std(self) -> np.ndarray:
+        """
+        Devuelve la desviación típica muestral de cada celda.
+        """
+        return np.sqrt(self.variance())
+
+    def confidence_interval(self, z: float = 1.96) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Devuelve el intervalo de confianza normal de la media de cada celda.
+
+        :param z: Cuantil de la normal estándar (1.96 para un 95%).
+        :return: Tupla (inferior, superior) con la forma de las celdas.
+        """
+        half_width = z * np.sqrt(np.divide(self.variance(), self.count, out=np.zeros(self.shape), where=self.count > 0))
+        return self.mean - half_width, self.mean + half_width
+
+    def quantile(self, q: float) -> np.ndarray:
+        """
+        Devuelve la estimación P² del cuantil q de cada celda.
+        """
+        return self.quantiles[q].value()
+
+
+class ExperimentStatistics:
+
+    def __init__(self, n_algorithms: int, steps: int, quantiles: Sequence[float] = ()):
+        """
+        Inicializa los acumuladores de recompensa, regret acumulado y selección óptima por algoritmo y paso.
+
+        :param n_algorithms: Número de algoritmos del experimento.
+        :param steps: Número de pasos de tiempo por ejecución.
+        :param quantiles: Cuantiles a estimar con P² para cada métrica.
+        """
+        shape = (n_algorithms, steps)
+        self.rewards = StreamingStats(shape, quantiles)
+        self.regrets = StreamingStats(shape, quantiles)
+        # La selección óptima se acumula como 0/100 para que la media sea un porcentaje
+        self.optimal_selections = StreamingStats(shape, quantiles)
+
+    def update(self, algorithm: int, step: int, rewards: np.ndarray, regrets: np.ndarray, optimal: np.ndarray):
+        """
+        Añade las observaciones de todas las ejecuciones de un algoritmo en un paso.
+
+        :param algorithm: Índice del algoritmo.
+        :param step: Paso de tiempo.
+        :param rewards: Recompensa de cada ejecución.
+        :param regrets: Regret acumulado de cada ejecución.
+        :param optimal: Si cada ejecución eligió el brazo óptimo.
+        """
+        self.rewards.update((algorithm, step), rewards)
+        self.regrets.update((algorithm, step), regrets)
+        self.optimal_selections.update((algorithm, step), np.asarray(optimal, dtype=float) * 100)
+
+    def merge(self, other: 'ExperimentStatistics'):
+        """
+        Combina las observaciones de otro acumulador del mismo experimento.
+        """
+        self.rewards.merge(other.rewards)
+        self.regrets.merge(other.regrets)
+        self.optimal_selections.merge(other.optimal_selections)
@@ -0,0 +1,8 @@
+"""
+Configuración de pytest: los paquetes del proyecto se importan desde src/, como en main.py.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
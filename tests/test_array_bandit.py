@@ -0,0 +1,26 @@
+"""
+ArrayBandit comparte con Bandit el estado común (brazo óptimo, estacionariedad y cinta).
+"""
+
+import numpy as np
+
+from arms import ArmBernoulli, ArmNormal, ArrayBandit, Bandit
+
+
+def test_array_bandit_matches_bandit_state():
+    for arms in (ArmNormal.generate_arms(6, rng=np.random.default_rng(0)),
+                 ArmBernoulli.generate_arms(6, rng=np.random.default_rng(0))):
+        bandit, array_bandit = Bandit(arms), ArrayBandit.from_arms(arms)
+        for name in ('k', 'optimal_arm', 'stationary', 'tape', 'tape_run', 'tape_step'):
+            assert getattr(array_bandit, name) == getattr(bandit, name), name
+        np.testing.assert_allclose(array_bandit.expected_rewards, bandit.expected_rewards)
+
+
+def test_pull_arm_walks_through_the_tape():
+    arms = ArmNormal.generate_arms(4, rng=np.random.default_rng(0))
+    for bandit in (Bandit(arms), ArrayBandit.from_arms(arms)):
+        tape = bandit.use_tape(runs=2, steps=5, rng=np.random.default_rng(1))
+        bandit.seek(1, 0)
+        rewards = [bandit.pull_arm(step % 4) for step in range(5)]
+        np.testing.assert_array_equal(rewards, tape.data[1, np.arange(5), np.arange(5) % 4])
+        assert bandit.tape_run == 1 and bandit.tape_step == 5
@@ -0,0 +1,43 @@
+"""
+Smoke tests de la matriz de benchmarks (todas las entradas se ejecutan con sus bandits) y del
+historial de resultados con su detección de regresiones.
+"""
+
+from benchmarks.scaling import scaling_report
+from benchmarks.suite import (ALGORITHMS, QUICK_EXPERIMENT_SHAPES, append_history, find_regressions, load_history,
+                              missing_benchmarks, run_suite)
+
+
+def test_quick_suite_runs():
+    results = run_suite((10,), QUICK_EXPERIMENT_SHAPES, min_time=0.01, repeat=1)
+    for name in ALGORITHMS:
+        assert results[f'{name}.select_arm[k=10]']['ops_per_sec'] > 0
+    steps, runs = QUICK_EXPERIMENT_SHAPES[0]
+    assert results[f'run_experiment[k=10,steps={steps},runs={runs}]']['ops_per_sec'] > 0
+
+
+def test_scaling_report_runs():
+    report = scaling_report((10,))
+    assert 'ThompsonSampling[bernoulli]' in report
+    assert all(values[10] > 0 for values in report.values())
+
+
+def test_every_algorithm_and_arm_has_a_benchmark():
+    assert missing_benchmarks() == []
+
+
+def test_history_and_regressions(tmp_path):
+    path = str(tmp_path / 'history' / 'bench.json')
+    assert load_history(path) == []
+    # La referencia es la mediana: una medida anómala (1000) no la desplaza
+    for ops in (100.0, 1000.0, 100.0):
+        append_history(path, {'op': {'ops_per_sec': ops, 'peak_bytes': 1_000_000}}, label='base')
+    history = load_history(path)
+    assert len(history) == 3 and history[-1]['label'] == 'base'
+
+    assert find_regressions({'op': {'ops_per_sec': 90.0, 'peak_bytes': 1_000_000}}, history) == []
+    assert find_regressions({'new': {'ops_per_sec': 1.0, 'peak_bytes': 1}}, history) == []
+    slower = find_regressions({'op': {'ops_per_sec': 70.0, 'peak_bytes': 1_000_000}}, history)
+    assert len(slower) == 1 and slower[0].startswith('op: 70 ops/s')
+    bigger = find_regressions({'op': {'ops_per_sec': 100.0, 'peak_bytes': 2_000_000}}, history)
+    assert len(bigger) == 1 and 'MiB' in bigger[0]
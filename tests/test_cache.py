@@ -0,0 +1,73 @@
+"""
+ResultsCache devuelve los resultados guardados, su clave cambia con cada parámetro del experimento y
+expulsa las entradas usadas hace más tiempo.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, UCB2
+from arms import ArmNormal, Bandit
+from simulation import ResultsCache, experiment_key, run_experiment
+
+
+def make_bandit(mu=1.0):
+    return Bandit(arms=[ArmNormal(mu, 1.0), ArmNormal(2.0, 1.0), ArmNormal(3.0, 1.0)])
+
+
+def make_key(bandit=None, algorithms=None, steps=50, runs=4, seed=0, **options):
+    return experiment_key(bandit or make_bandit(), algorithms or [EpsilonGreedy(3, epsilon=0.1), UCB2(3, alpha=0.5)],
+                          steps, runs, seed, **options)
+
+
+def test_cache_hit_returns_stored_results(tmp_path):
+    cache = ResultsCache(str(tmp_path))
+    args = (make_bandit(), [EpsilonGreedy(3, epsilon=0.1)], 50, 4)
+    first = run_experiment(*args, seed=0, cache=cache)
+    assert len(os.listdir(tmp_path)) == 1
+
+    second = run_experiment(*args, seed=0, cache=cache)
+    assert all(isinstance(result, np.memmap) for result in second)
+    for stored, computed in zip(second, first):
+        np.testing.assert_array_equal(stored, computed)
+    assert len(os.listdir(tmp_path)) == 1
+
+
+@pytest.mark.parametrize('changed', [
+    dict(bandit=make_bandit(mu=1.5)),
+    dict(algorithms=[EpsilonGreedy(3, epsilon=0.2), UCB2(3, alpha=0.5)]),
+    dict(algorithms=[EpsilonGreedy(3, epsilon=0.1), UCB2(3, alpha=0.6)]),
+    dict(algorithms=[EpsilonGreedy(3, epsilon=0.1)]),
+    dict(steps=51),
+    dict(runs=5),
+    dict(seed=1),
+    dict(reward_tape=True),
+])
+def test_key_changes_with_each_parameter(changed):
+    assert make_key(**changed) != make_key()
+
+
+def test_key_ignores_numeric_type():
+    base = make_key(algorithms=[EpsilonGreedy(3, epsilon=0.1), UCB2(3, alpha=1.0)])
+    assert make_key(algorithms=[EpsilonGreedy(3, epsilon=0.1), UCB2(3, alpha=1)]) == base
+    assert make_key(algorithms=[EpsilonGreedy(3, epsilon=0.1), UCB2(3, alpha=np.float64(1))]) == base
+    assert make_key(bandit=make_bandit(mu=1)) == make_key()
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResultsCache(str(tmp_path))
+    results = tuple(np.zeros(100) for _ in range(5))
+    cache.put('a', results)
+    entry_bytes = sum(file.stat().st_size for file in os.scandir(tmp_path / 'a'))
+    cache.put('b', results)
+    # 'a' se guardó antes, pero se usa después que 'b'
+    os.utime(tmp_path / 'a', (100, 100))
+    os.utime(tmp_path / 'b', (200, 200))
+    assert cache.get('a') is not None
+
+    cache.max_bytes = 2 * entry_bytes
+    cache.put('c', results)
+    assert sorted(os.listdir(tmp_path)) == ['a', 'c']
+    assert cache.get('b') is None
@@ -0,0 +1,41 @@
+"""
+run_experiment promedia sobre todas las ejecuciones: el regret acumulado medio es el óptimo
+acumulado menos la recompensa media acumulada, y cada ejecución hace exactamente `steps` tiradas.
+"""
+
+import numpy as np
+
+from algorithms import EpsilonGreedy, GradientePreferencias, Softmax, UCB1, UCB2
+from arms import ArmNormal, Bandit
+from simulation import run_experiment
+
+
+def make_experiment(k=5):
+    np.random.seed(0)
+    bandit = Bandit(arms=ArmNormal.generate_arms(k))
+    algorithms = [EpsilonGreedy(k, epsilon=0.1), Softmax(k, tau=0.5), UCB1(k), UCB2(k, alpha=0.5),
+                  GradientePreferencias(k, alpha=0.1)]
+    return bandit, algorithms
+
+
+def test_regret_is_averaged_over_runs():
+    steps, runs = 200, 16
+    bandit, algorithms = make_experiment()
+    rewards, optimal_selections, regrets, arm_counts, arm_avg_rewards = run_experiment(bandit, algorithms, steps,
+                                                                                       runs, seed=1)
+
+    optimal_reward = bandit.get_expected_value(bandit.optimal_arm)
+    expected_regrets = optimal_reward * np.arange(1, steps + 1) - np.cumsum(rewards, axis=1)
+    np.testing.assert_allclose(regrets, expected_regrets)
+
+    np.testing.assert_array_equal(arm_counts.sum(axis=1), steps * runs)
+    assert np.all((optimal_selections >= 0) & (optimal_selections <= 100))
+    assert rewards.shape == regrets.shape == optimal_selections.shape == (len(algorithms), steps)
+    assert arm_avg_rewards.shape == (len(algorithms), bandit.k)
+
+
+def test_same_seed_gives_same_results():
+    first = run_experiment(*make_experiment(), 100, 8, seed=3)
+    second = run_experiment(*make_experiment(), 100, 8, seed=3)
+    for a, b in zip(first, second):
+        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,18 @@
+"""
+Importar la simulación, los brazos y los algoritmos no carga matplotlib ni seaborn.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+
+def test_core_packages_do_not_import_plotting_libraries():
+    code = ("import sys; import simulation, arms, algorithms; "
+            "from simulation import run_experiment; from arms import Bandit; from algorithms import UCB1; "
+            "print(sorted(name for name in ('matplotlib', 'seaborn') if name in sys.modules))")
+    # En un proceso nuevo, para que no influyan los módulos que hayan cargado otros tests
+    result = subprocess.run([sys.executable, '-c', code], cwd=SRC, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
@@ -0,0 +1,160 @@
+"""
+Invariantes entre caminos de cálculo que deben dar el mismo resultado: Numba y NumPy, modos
+indexados y densos, números aleatorios comunes y cinta de recompensas, medias incrementales de
+SW-UCB y D-UCB frente a su recálculo directo, y la versión paralela con cualquier número de procesos.
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import (DiscountedUCB, EpsilonGreedy, GradientePreferencias, SlidingWindowUCB, Softmax,
+                        ThompsonSampling, UCB1, UCB2)
+from arms import ArmBernoulli, ArmNormal, ArmNormalDrifting, ArmSwitching, ArrayBandit, Bandit
+from simulation import run_experiment, run_experiment_parallel
+
+K = 6
+
+BANDITS = {
+    'normal': lambda: Bandit(ArmNormal.generate_arms(K, rng=np.random.default_rng(1))),
+    'array': lambda: ArrayBandit.generate('normal', K, np.random.default_rng(1)),
+    'drifting': lambda: Bandit(ArmNormalDrifting.generate_arms(K, 2.0, 300, rng=np.random.default_rng(1))),
+    'switching': lambda: Bandit(ArmSwitching.generate_arms(K, [100, 250], ArmBernoulli, rng=np.random.default_rng(1))),
+}
+
+
+def make_algorithms():
+    return [EpsilonGreedy(K, epsilon=np.array([0.0, 0.1])), Softmax(K, tau=0.5), UCB1(K), UCB2(K, alpha=0.5),
+            GradientePreferencias(K, alpha=0.1), DiscountedUCB(K, gamma=0.98), SlidingWindowUCB(K, window=50),
+            ThompsonSampling(K, family='normal')]
+
+
+def assert_same_results(expected, actual):
+    for expected_metric, actual_metric in zip(expected, actual):
+        np.testing.assert_array_equal(actual_metric, expected_metric)
+
+
+@pytest.mark.parametrize('bandit', BANDITS)
+@pytest.mark.parametrize('pseudo_regret', [False, True])
+def test_common_random_numbers_match_reward_tape(bandit, pseudo_regret):
+    tape = run_experiment(BANDITS[bandit](), make_algorithms(), 400, 12, seed=3, reward_tape=True,
+                          pseudo_regret=pseudo_regret)
+    crn = run_experiment(BANDITS[bandit](), make_algorithms(), 400, 12, seed=3, common_random_numbers=True,
+                         pseudo_regret=pseudo_regret)
+    assert_same_results(tape, crn)
+
+
+@pytest.mark.parametrize('bandit', BANDITS)
+def test_numba_matches_numpy(bandit):
+    from simulation import kernels
+    if not kernels.NUMBA_AVAILABLE:
+        pytest.skip("Numba no está instalado.")
+
+    numpy_results = run_experiment(BANDITS[bandit](), make_algorithms(), 400, 12, seed=3, reward_tape=True)
+    numba_results = run_experiment(BANDITS[bandit](), make_algorithms(), 400, 12, seed=3, backend='numba')
+    assert_same_results(numpy_results, numba_results)
+
+
+@pytest.mark.parametrize('make_algorithm', [
+    lambda indexed, rng: EpsilonGreedy(50, epsilon=0.1, rng=rng, indexed=indexed),
+    lambda indexed, rng: Softmax(50, tau=0.2, rng=rng, indexed=indexed),
+    lambda indexed, rng: UCB1(50, rng=rng, indexed=indexed),
+])
+def test_indexed_selections_match_dense(make_algorithm):
+    dense = make_algorithm(False, np.random.default_rng(4))
+    indexed = make_algorithm(True, np.random.default_rng(4))
+    means = np.random.default_rng(0).random(50)
+    rewards = np.random.default_rng(5)
+
+    for step in range(2000):
+        arm = dense.select_arm()
+        assert indexed.select_arm() == arm, f"Selección distinta en el paso {step}."
+        reward = means[arm] + rewards.standard_normal()
+        dense.update(arm, reward)
+        indexed.update(arm, reward)
+
+        if step % 125 == 124:
+            # Lotes grandes (se reconstruye el índice) y pequeños (se actualiza brazo a brazo)
+            size = 64 if step % 250 == 249 else 3
+            arms = rewards.integers(50, size=size)
+            batch = means[arms] + rewards.standard_normal(size)
+            dense.update_batch(arms, batch)
+            indexed.update_batch(arms, batch)
+
+    np.testing.assert_allclose(indexed.values, dense.values)
+
+
+def _pull_sequence(algorithm, steps, seed):
+    """
+    Hace `steps` tiradas con recompensas normales y devuelve la historia de brazos y recompensas.
+    """
+    means = np.linspace(0, 1, algorithm.k)
+    rng = np.random.default_rng(seed)
+    arms, rewards = [], []
+    for step in range(steps):
+        arm = algorithm.select_arm()
+        reward = means[arm] + rng.standard_normal()
+        if step % 97 == 96:
+            # De vez en cuando, un lote de tiradas del mismo paso
+            batch_arms = rng.integers(algorithm.k, size=8)
+            batch_rewards = means[batch_arms] + rng.standard_normal(8)
+            algorithm.update_batch(batch_arms, batch_rewards)
+            arms.extend(batch_arms)
+            rewards.extend(batch_rewards)
+        else:
+            algorithm.update(arm, reward)
+            arms.append(arm)
+            rewards.append(reward)
+    return np.array(arms), np.array(rewards)
+
+
+def test_sliding_window_ucb_matches_naive_window():
+    window = 40
+    algorithm = SlidingWindowUCB(5, window=window, rng=np.random.default_rng(0))
+    arms, rewards = _pull_sequence(algorithm, 1000, seed=1)
+
+    recent_arms, recent_rewards = arms[-window:], rewards[-window:]
+    counts = np.bincount(recent_arms, minlength=5)
+    sums = np.bincount(recent_arms, weights=recent_rewards, minlength=5)
+    np.testing.assert_array_equal(algorithm.counts, counts)
+    np.testing.assert_allclose(algorithm.values, np.divide(sums, counts, out=np.zeros(5), where=counts > 0))
+
+    horizon = min(algorithm.total_counts, window)
+    with np.errstate(divide='ignore'):
+        naive_ucb = sums / counts + np.sqrt(2 * np.log(horizon) / counts)
+    pulled = counts > 0
+    np.testing.assert_allclose(algorithm._ucb_values()[pulled], naive_ucb[pulled])
+
+
+def test_discounted_ucb_matches_naive_discount():
+    gamma = 0.97
+    algorithm = DiscountedUCB(5, gamma=gamma, rng=np.random.default_rng(0))
+    means = np.linspace(0, 1, 5)
+    rng = np.random.default_rng(1)
+
+    # Paso (número de selecciones hechas) en el que se registró cada tirada
+    history = []
+    for _ in range(3000):
+        arm = algorithm.select_arm()
+        reward = means[arm] + rng.standard_normal()
+        algorithm.update(arm, reward)
+        history.append((algorithm.total_counts, arm, reward))
+
+    t = algorithm.total_counts
+    steps, arms, rewards = (np.array(column) for column in zip(*history))
+    weights = gamma ** (t - steps)
+    counts = np.bincount(arms, weights=weights, minlength=5)
+    sums = np.bincount(arms, weights=weights * rewards, minlength=5)
+
+    np.testing.assert_allclose(algorithm.discounted_counts / algorithm.weight, counts, rtol=1e-9)
+    np.testing.assert_allclose(algorithm.values, sums / counts, rtol=1e-9)
+    naive_ucb = sums / counts + np.sqrt(2 * np.log(max(counts.sum(), 1.0)) / counts)
+    np.testing.assert_allclose(algorithm._ucb_values(), naive_ucb, rtol=1e-9)
+
+
+@pytest.mark.parametrize('options', [{}, {'common_random_numbers': True, 'pseudo_regret': True}])
+def test_parallel_results_do_not_depend_on_workers(options):
+    runs = [run_experiment_parallel(BANDITS['normal'](), make_algorithms(), 200, 48, seed=2, workers=workers,
+                                    block_runs=16, **options)
+            for workers in (1, 2, 3)]
+    assert_same_results(runs[0], runs[1])
+    assert_same_results(runs[0], runs[2])
@@ -0,0 +1,59 @@
+"""
+El perfilador cuenta las llamadas de cada fase por algoritmo y exporta una traza de Chrome.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, UCB1
+from arms import ArmNormal, Bandit
+from simulation import run_experiment
+from simulation.profiling import EXPERIMENT, Profiler
+
+STEPS = 40
+LABELS = ['EpsilonGreedy(k=2, epsilon=0.1, indexed=False)', 'UCB1(k=2, indexed=False)']
+
+
+def profile(trace: bool = False) -> Profiler:
+    profiler = Profiler(trace=trace)
+    bandit = Bandit(arms=[ArmNormal(1.0, 1.0), ArmNormal(2.0, 1.0)])
+    run_experiment(bandit, [EpsilonGreedy(2, epsilon=0.1), UCB1(2)], STEPS, 5, seed=0, profiler=profiler)
+    return profiler
+
+
+def test_report_counts_calls_per_phase():
+    report = profile().report()
+    assert sorted(report) == sorted(LABELS + [EXPERIMENT])
+    assert {phase: values['calls'] for phase, values in report[EXPERIMENT].items()} == {'setup': 1, 'finalize': 1}
+    for label in LABELS:
+        assert {phase: values['calls'] for phase, values in report[label].items()} == \
+            {'select': STEPS, 'pull': STEPS, 'update': STEPS, 'record': STEPS}
+    assert sum(values['fraction'] for phases in report.values() for values in phases.values()) == pytest.approx(1.0)
+
+
+def test_chrome_trace_file(tmp_path):
+    profiler = profile(trace=True)
+    path = tmp_path / 'trace.json'
+    profiler.write_chrome_trace(str(path))
+
+    with open(path) as file:
+        trace = json.load(file)
+    events = trace['traceEvents']
+    complete = [event for event in events if event['ph'] == 'X']
+    metadata = [event for event in events if event['ph'] == 'M']
+    assert len(complete) == 2 + 2 * 4 * STEPS
+    assert all(event['dur'] >= 0 and event['ts'] >= 0 for event in complete)
+    assert all(set(event) == {'name', 'cat', 'ph', 'pid', 'tid', 'ts', 'dur'} for event in complete)
+
+    # Una fila (tid) por etiqueta, con su nombre en los metadatos
+    lanes = {event['args']['name']: event['tid'] for event in metadata}
+    assert sorted(lanes) == sorted(LABELS + [EXPERIMENT])
+    assert all(event['tid'] == lanes[event['cat']] for event in complete)
+    np.testing.assert_array_equal(sorted(lanes.values()), np.arange(len(lanes)))
+
+
+def test_trace_requires_trace_mode(tmp_path):
+    with pytest.raises(AssertionError):
+        Profiler().write_chrome_trace(str(tmp_path / 'trace.json'))
@@ -0,0 +1,37 @@
+"""
+race sólo acumula el regret final de cada ejecución, que coincide con el último paso de ExperimentStatistics.
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, UCB1
+from arms import ArmNormal, ArmNormalDrifting, Bandit
+from simulation import ExperimentStatistics, StreamingStats, race, run_experiment
+
+
+@pytest.mark.parametrize('make_arms', [
+    lambda rng: ArmNormal.generate_arms(5, rng=rng),
+    lambda rng: ArmNormalDrifting.generate_arms(5, 2.0, 100, rng=rng),
+])
+@pytest.mark.parametrize('pseudo_regret', [False, True])
+def test_final_regret_matches_last_step_statistics(make_arms, pseudo_regret):
+    algorithms = lambda: [EpsilonGreedy(5, epsilon=np.array([0.0, 0.1])), UCB1(5)]
+    stats = ExperimentStatistics(3, 200)
+    run_experiment(Bandit(make_arms(np.random.default_rng(1))), algorithms(), 200, 20, seed=[7, 0], stats=stats,
+                   pseudo_regret=pseudo_regret)
+    final_regret = StreamingStats((3,))
+    run_experiment(Bandit(make_arms(np.random.default_rng(1))), algorithms(), 200, 20, seed=[7, 0],
+                   final_regret=final_regret, pseudo_regret=pseudo_regret)
+
+    np.testing.assert_array_equal(final_regret.count, stats.regrets.count[:, -1])
+    np.testing.assert_allclose(final_regret.mean, stats.regrets.mean[:, -1])
+    np.testing.assert_allclose(final_regret.m2, stats.regrets.m2[:, -1])
+
+
+def test_race_keeps_the_best_configuration():
+    bandit = Bandit(ArmNormal.generate_arms(5, rng=np.random.default_rng(1)))
+    result = race(bandit, [EpsilonGreedy(5, epsilon=np.array([0.0, 0.05, 0.9]))], 300, 64, seed=3,
+                  pseudo_regret=True)
+    assert 2 not in result['indices']
+    assert result['saved'] > 0
@@ -0,0 +1,47 @@
+"""
+render_figures guarda en fichero las figuras de todas las funciones de plotting.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('matplotlib')
+pytest.importorskip('seaborn')
+
+from algorithms import EpsilonGreedy, UCB1
+from plotting import plot_arm_statistics, plot_average_rewards, plot_optimal_selections, plot_regret
+from plotting.render import render_figures
+
+
+def test_render_all_figures(tmp_path):
+    algorithms = [EpsilonGreedy(3), UCB1(3)]
+    series = np.random.default_rng(0).random((2, 50))
+    common = dict(steps=50, algorithms=algorithms)
+    jobs = [
+        (plot_average_rewards, dict(common, rewards=series, path=str(tmp_path / 'rewards.png'))),
+        (plot_optimal_selections, dict(common, optimal_selections=series, path=str(tmp_path / 'optimal.png'))),
+        (plot_regret, dict(common, regret_accumulated=series, path=str(tmp_path / 'regret.png'))),
+        (plot_arm_statistics, dict(arms=3, arm_counts=np.array([[1, 2, 3], [3, 2, 1]]), arm_avg_rewards=series[:, :3],
+                                   optimal_arm=1, algorithms=algorithms, path=str(tmp_path / 'arms.png'))),
+    ]
+
+    paths = render_figures(jobs, processes=2)
+    assert paths == [kwargs['path'] for _, kwargs in jobs]
+    assert all((tmp_path / name).stat().st_size > 0 for name in ('rewards.png', 'optimal.png', 'regret.png', 'arms.png'))
+
+
+def test_arm_statistics_shows_one_figure_per_algorithm(monkeypatch):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    shown = []
+
+    def show():
+        shown.append(len(plt.gcf().axes))
+        plt.close()
+
+    monkeypatch.setattr(plt, 'show', show)
+    algorithms = [EpsilonGreedy(3), UCB1(3)]
+    plot_arm_statistics(3, np.array([[1, 2, 3], [3, 2, 1]]), np.random.default_rng(0).random((2, 3)), 1, algorithms)
+    assert shown == [1, 1]
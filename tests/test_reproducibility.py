@@ -0,0 +1,54 @@
+"""
+Tras np.random.seed y reset, un algoritmo y un bandit que usan el generador global repiten la misma trayectoria.
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, GradientePreferencias, Softmax, UCB1, UCB2
+from arms import ArmBernoulli, ArmNormal, ArmNormalDrifting, Bandit
+
+
+def _trajectory(algorithm, bandit, steps=50):
+    chosen, rewards = [], []
+    for _ in range(steps):
+        arm = algorithm.select_arm()
+        reward = bandit.pull_arm(arm)
+        algorithm.update(arm, reward)
+        chosen.append(arm)
+        rewards.append(reward)
+    return np.array(chosen), np.array(rewards)
+
+
+def _rerun(algorithm, bandit, seed=7):
+    np.random.seed(seed)
+    algorithm.reset()
+    bandit.reset()
+    return _trajectory(algorithm, bandit)
+
+
+@pytest.mark.parametrize('make_algorithm', [
+    lambda k: EpsilonGreedy(k, epsilon=0.1),
+    lambda k: Softmax(k, tau=0.5),
+    lambda k: UCB1(k),
+    lambda k: UCB2(k, alpha=0.5),
+    lambda k: GradientePreferencias(k, alpha=0.1),
+])
+@pytest.mark.parametrize('make_arms', [
+    lambda k: ArmNormal.generate_arms(k),
+    lambda k: ArmBernoulli.generate_arms(k),
+    lambda k: ArmNormalDrifting.generate_arms(k, amplitude=1.0, period=20),
+])
+def test_reseed_reset_rerun(make_algorithm, make_arms):
+    np.random.seed(0)
+    k = 5
+    algorithm = make_algorithm(k)
+    bandit = Bandit(arms=make_arms(k))
+
+    first = _rerun(algorithm, bandit)
+    # Un trozo de otra ejecución deja uniformes y recompensas pendientes en los buffers
+    _trajectory(algorithm, bandit, steps=13)
+    second = _rerun(algorithm, bandit)
+
+    np.testing.assert_array_equal(first[0], second[0])
+    np.testing.assert_array_equal(first[1], second[1])
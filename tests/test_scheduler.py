@@ -0,0 +1,46 @@
+"""
+El planificador expande un plan, agrupa los trabajos repetidos y devuelve los mismos resultados que run_experiment.
+"""
+
+import numpy as np
+import pytest
+
+from simulation import run_experiment
+from simulation.scheduler import build_algorithms, build_bandit, expand_plan, run_plan, schedule
+
+PLAN = {
+    'seed': 1,
+    'steps': 30,
+    'runs': 4,
+    'experiments': [
+        {'name': 'eps', 'k': [3, 4], 'algorithms': [{'type': 'EpsilonGreedy', 'epsilon': 0.1}, {'type': 'UCB1'}]},
+        # Mismo experimento que eps[k=3]: se simula una sola vez
+        {'name': 'dup', 'k': 3, 'algorithms': [{'type': 'EpsilonGreedy', 'epsilon': 0.1}, {'type': 'UCB1'}]},
+        {'name': 'sweep', 'k': 3, 'runs': 2, 'algorithms': [{'type': 'Softmax', 'tau': [0.1, 1.0]}]},
+    ],
+}
+
+
+def test_expand_plan():
+    jobs = expand_plan(PLAN)
+    assert [job['name'] for job in jobs] == ['eps[k=3]', 'eps[k=4]', 'dup', 'sweep']
+    assert [job['k'] for job in jobs] == [3, 4, 3, 3]
+    assert all(job['seed'] == 1 and job['steps'] == 30 and job['arms'] == 'normal' for job in jobs)
+    assert jobs[3]['runs'] == 2
+
+
+def test_schedule_merges_duplicates_longest_first():
+    scheduled = schedule(expand_plan(PLAN))
+    assert [names for _, names in scheduled] == [['eps[k=4]'], ['eps[k=3]', 'dup'], ['sweep']]
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_run_plan_matches_run_experiment(processes):
+    streamed = list(run_plan(PLAN, processes=processes))
+    assert sorted(name for result in streamed for name in result['names']) == ['dup', 'eps[k=3]', 'eps[k=4]', 'sweep']
+
+    for result in streamed:
+        job = result['job']
+        expected = run_experiment(build_bandit(job), build_algorithms(job), job['steps'], job['runs'], job['seed'])
+        for got, want in zip(result['results'], expected):
+            np.testing.assert_array_equal(got, want)
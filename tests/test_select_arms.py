@@ -0,0 +1,50 @@
+"""
+select_arms reparte los brazos sin probar como UCB1 y, sin recompensas intermedias, coincide con select_arm.
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import DiscountedUCB, SlidingWindowUCB, UCB1, UCB2
+
+
+@pytest.mark.parametrize('make_algorithm', [
+    lambda k: UCB1(k),
+    lambda k: UCB2(k, alpha=0.5),
+    lambda k: DiscountedUCB(k, gamma=0.99),
+    lambda k: SlidingWindowUCB(k, window=100),
+])
+def test_unpulled_arms_are_spread(make_algorithm):
+    algorithm = make_algorithm(5)
+    np.testing.assert_array_equal(algorithm.select_arms(6), [0, 1, 2, 3, 4, 0])
+    assert algorithm.total_counts == 6
+
+
+def test_ucb2_select_arms_matches_select_arm():
+    rng = np.random.default_rng(0)
+    batched, scalar = UCB2(5, alpha=0.5), UCB2(5, alpha=0.5)
+    for algorithm in (batched, scalar):
+        algorithm.update_batch(np.arange(5), np.linspace(0, 1, 5))
+        algorithm.total_counts = 5
+
+    for _ in range(20):
+        chosen = batched.select_arms(7)
+        np.testing.assert_array_equal(chosen, [scalar.select_arm() for _ in range(7)])
+        assert batched.total_counts == scalar.total_counts
+        rewards = rng.random(7)
+        batched.update_batch(chosen, rewards)
+        scalar.update_batch(chosen, rewards)
+
+
+def test_discounted_ucb_long_advance_does_not_underflow():
+    # gamma^2000 se anula en coma flotante: el avance se hace por tramos
+    long, stepwise = DiscountedUCB(3, gamma=0.5), DiscountedUCB(3, gamma=0.5)
+    for algorithm in (long, stepwise):
+        algorithm.update_batch(np.arange(3), np.array([0.2, 0.8, 0.5]))
+
+    long.select_arms(2000)
+    for _ in range(2000):
+        stepwise.select_arm()
+    assert np.isfinite(long.weight) and long.total_counts == stepwise.total_counts == 2000
+    np.testing.assert_allclose(long.discounted_counts / long.weight, stepwise.discounted_counts / stepwise.weight)
+    np.testing.assert_array_equal(long.select_arms(4), stepwise.select_arms(4))
@@ -0,0 +1,102 @@
+"""
+El servidor de decisiones responde 400 a las peticiones mal formadas en lugar de cortar la conexión sin
+respuesta, y las peticiones concurrentes agrupadas en lotes llegan todas al algoritmo.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, UCB1
+from arms import ArmNormal, Bandit
+from service import DecisionClient, DecisionServer
+from service.loadgen import run_load
+
+
+async def _raw_request(address, data: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(data)
+    await writer.drain()
+    response = await asyncio.wait_for(reader.read(), timeout=5)
+    writer.close()
+    return response
+
+
+@pytest.mark.parametrize('data', [
+    b"GARBAGE\r\n\r\n",
+    b"POST /select/ucb HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+    b"POST /select/ucb HTTP/1.1\r\nContent-Length: -3\r\n\r\n",
+])
+def test_malformed_request_gets_400(data):
+    async def scenario():
+        server = DecisionServer({'ucb': UCB1(3)})
+        address = await server.start()
+        try:
+            response = await _raw_request(address, data)
+            # El servidor sigue atendiendo otras conexiones
+            client = DecisionClient(address)
+            await client.connect()
+            arm = await client.select('ucb')
+            await client.close()
+        finally:
+            await server.close()
+        return response, arm
+
+    response, arm = asyncio.run(scenario())
+    assert response.startswith(b"HTTP/1.1 400 Bad Request")
+    assert 0 <= arm < 3
+
+
+def test_concurrent_requests_are_batched_and_applied():
+    k, connections, cycles = 4, 16, 10
+
+    async def scenario():
+        algorithm = EpsilonGreedy(k, epsilon=0.1, rng=np.random.default_rng(0))
+        server = DecisionServer({'eps': algorithm}, max_batch=8, max_delay=0.001)
+        address = await server.start()
+        sent = []
+
+        async def worker(index):
+            client = DecisionClient(address)
+            await client.connect()
+            try:
+                for cycle in range(cycles):
+                    arm = await client.select('eps')
+                    reward = float(index + cycle)
+                    await client.reward('eps', arm, reward)
+                    sent.append((arm, reward))
+            finally:
+                await client.close()
+
+        try:
+            await asyncio.gather(*(worker(index) for index in range(connections)))
+            counts, values = algorithm.counts.copy(), algorithm.values.copy()
+            stats = server.stats()['eps']
+
+            # Una carga corta del generador sobre el mismo algoritmo
+            bandit = Bandit(arms=ArmNormal.generate_arms(k, rng=np.random.default_rng(1)))
+            load = await run_load(address, 'eps', bandit, requests=200, connections=8)
+            final = server.stats()['eps']
+        finally:
+            await server.close()
+        return algorithm, sent, counts, values, stats, load, final
+
+    algorithm, sent, counts, values, stats, load, final = asyncio.run(scenario())
+    arms = np.array([arm for arm, _ in sent])
+    rewards = np.array([reward for _, reward in sent])
+    pulls = connections * cycles
+
+    np.testing.assert_array_equal(counts, np.bincount(arms, minlength=k))
+    pulled = counts > 0
+    means = np.bincount(arms, weights=rewards, minlength=k)[pulled] / counts[pulled]
+    np.testing.assert_allclose(values[pulled], means)
+    assert stats['requests'] == 2 * pulls
+    # Con 16 conexiones concurrentes el servidor agrupa las peticiones en lotes
+    assert stats['batches'] < stats['requests']
+    assert stats['mean_batch'] > 1
+
+    assert algorithm.counts.sum() == pulls + 200
+    assert final['requests'] == 2 * (pulls + 200)
+    assert load['requests_per_second'] > 0
+    assert np.isfinite(load['average_reward'])
@@ -0,0 +1,102 @@
+"""
+ShardedLearner combina en el algoritmo compartido todas las tiradas de todos los hilos.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from algorithms import DiscountedUCB, EpsilonGreedy, ShardedLearner, UCB1, UCB2
+
+
+@pytest.mark.parametrize('make_algorithm', [
+    lambda k: EpsilonGreedy(k, epsilon=0.1, rng=np.random.default_rng(0)),
+    lambda k: EpsilonGreedy(k, epsilon=0.1, indexed=True, rng=np.random.default_rng(0)),
+    lambda k: UCB1(k, rng=np.random.default_rng(0)),
+    lambda k: UCB2(k, alpha=0.5, rng=np.random.default_rng(0)),
+])
+def test_all_thread_updates_are_merged(make_algorithm):
+    k, threads, pulls = 4, 4, 1000
+    learner = ShardedLearner(make_algorithm(k), merge_every=64)
+    expected_counts = np.zeros(k, dtype=int)
+    expected_sums = np.zeros(k)
+    lock = threading.Lock()
+
+    def worker(index):
+        rewards = np.random.default_rng(index)
+        counts, sums = np.zeros(k, dtype=int), np.zeros(k)
+        for _ in range(pulls):
+            arm = learner.select_arm()
+            reward = rewards.random() + arm
+            learner.update(arm, reward)
+            counts[arm] += 1
+            sums[arm] += reward
+        learner.flush()
+        with lock:
+            expected_counts[:] += counts
+            expected_sums[:] += sums
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    shared = learner.algorithm
+    assert expected_counts.sum() == threads * pulls
+    np.testing.assert_array_equal(shared.counts, expected_counts)
+    pulled = expected_counts > 0
+    np.testing.assert_allclose(shared.values[pulled], expected_sums[pulled] / expected_counts[pulled])
+
+
+def test_merge_keeps_other_threads_copies():
+    learner = ShardedLearner(EpsilonGreedy(3, epsilon=0.0, rng=np.random.default_rng(0)), merge_every=2)
+    learner.update(0, 1.0)
+    local = learner._shard().policy
+
+    # Un volcado de otro hilo no toca la copia local ni descarta sus actualizaciones pendientes
+    other = threading.Thread(target=lambda: (learner.update(1, 5.0), learner.update(1, 5.0)))
+    other.start()
+    other.join()
+    assert learner._shard().policy is local
+    assert local.counts[0] == 1 and local.counts[1] == 0
+
+    # Al volcar su propio fragmento el hilo recibe las estimaciones combinadas
+    learner.update(2, 0.5)
+    np.testing.assert_array_equal(local.counts, [1, 2, 1])
+    np.testing.assert_array_equal(learner.algorithm.counts, [1, 2, 1])
+
+
+def test_merge_keeps_local_schedule():
+    learner = ShardedLearner(UCB2(3, alpha=0.5, rng=np.random.default_rng(0)), merge_every=1)
+    rewards = np.random.default_rng(1)
+    local = learner._shard().policy
+
+    # Se juega hasta estar en mitad de una época de UCB2 con tiradas pendientes
+    for _ in range(200):
+        arm = learner.select_arm()
+        if local.remaining_pulls > 0:
+            break
+        learner.update(arm, rewards.random())
+    assert local.remaining_pulls > 0, "Ninguna época tuvo más de una tirada."
+
+    epoch = (local.current_arm, local.remaining_pulls, local.epoch_counts.copy())
+    learner.update(arm, rewards.random())
+    assert (local.current_arm, local.remaining_pulls) == epoch[:2]
+    np.testing.assert_array_equal(local.epoch_counts, epoch[2])
+    np.testing.assert_array_equal(local.counts, learner.algorithm.counts)
+    # El resto de la época continúa con el mismo brazo
+    assert learner.select_arm() == epoch[0]
+
+
+def test_merge_keeps_local_discount():
+    learner = ShardedLearner(DiscountedUCB(3, gamma=0.9, rng=np.random.default_rng(0)), merge_every=4)
+    for _ in range(8):
+        learner.update(learner.select_arm(), 1.0)
+    local = learner._shard().policy
+
+    # El peso del hilo refleja sus 8 pasos aunque el algoritmo compartido no avance t
+    assert learner.algorithm.weight == 1.0
+    assert local.weight == pytest.approx(0.9 ** -8)
+    np.testing.assert_array_equal(local.counts, learner.algorithm.counts)
@@ -0,0 +1,46 @@
+"""
+save_state sustituye la instantánea de forma atómica y load_state la restaura.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, UCB2
+
+
+def test_save_state_round_trip(tmp_path):
+    path = str(tmp_path / 'state.npy')
+    algorithm = UCB2(4, alpha=0.5)
+    algorithm.save_state(path)
+    algorithm.update_batch(np.array([0, 1, 1, 3]), np.array([1.0, 0.5, 0.0, 2.0]))
+    # Sobrescribe una instantánea que ya existe
+    algorithm.save_state(path)
+
+    restored = UCB2(4, alpha=0.5)
+    restored.load_state(path)
+    np.testing.assert_array_equal(restored.counts, algorithm.counts)
+    np.testing.assert_array_equal(restored.values, algorithm.values)
+    assert restored.current_arm is None
+    assert os.listdir(tmp_path) == ['state.npy']
+
+
+def test_failed_save_keeps_previous_snapshot(tmp_path, monkeypatch):
+    path = str(tmp_path / 'state.npy')
+    algorithm = EpsilonGreedy(3)
+    algorithm.update(1, 1.0)
+    algorithm.save_state(path)
+
+    def failing_replace(source, target):
+        raise OSError("Disco lleno.")
+
+    algorithm.update(2, 1.0)
+    monkeypatch.setattr(os, 'replace', failing_replace)
+    with pytest.raises(OSError):
+        algorithm.save_state(path)
+
+    restored = EpsilonGreedy(3)
+    restored.load_state(path)
+    np.testing.assert_array_equal(restored.counts, [0, 1, 0])
+    assert os.listdir(tmp_path) == ['state.npy']
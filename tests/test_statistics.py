@@ -0,0 +1,50 @@
+"""
+StreamingStats combina acumuladores con la fórmula de Chan y estima cuantiles incrementalmente con P².
+"""
+
+import numpy as np
+import pytest
+
+from simulation.statistics import P2Quantile, StreamingStats
+
+
+def test_merge_matches_numpy():
+    rng = np.random.default_rng(0)
+    a, b = StreamingStats((3,)), StreamingStats((3,))
+    samples = [[], [], []]
+    # Celda 0 en los dos acumuladores, celda 1 sólo en b y celda 2 vacía
+    for stats, cell, size, loc in ((a, 0, 40, 5.0), (a, 0, 7, -2.0), (b, 0, 25, 100.0), (b, 1, 13, 1.0), (b, 1, 1, 3.0)):
+        values = rng.normal(loc, 2.0, size)
+        stats.update(cell, values)
+        samples[cell].extend(values)
+
+    a.merge(b)
+    for cell in (0, 1):
+        assert a.count[cell] == len(samples[cell])
+        assert a.mean[cell] == pytest.approx(np.mean(samples[cell]))
+        assert a.variance()[cell] == pytest.approx(np.var(samples[cell], ddof=1))
+    assert a.count[2] == 0 and a.mean[2] == 0 and a.variance()[2] == 0
+
+
+def test_merge_rejects_quantiles():
+    with pytest.raises(ValueError):
+        StreamingStats((1,), quantiles=(0.5,)).merge(StreamingStats((1,)))
+
+
+@pytest.mark.parametrize('q', [0.1, 0.5, 0.9])
+@pytest.mark.parametrize('batch', [1, 3])
+def test_p2_tracks_numpy_quantile(q, batch):
+    values = np.random.default_rng(1).normal(0.0, 1.0, 5000)
+    sketch = P2Quantile((1,), q)
+    # Lotes pequeños: todas las observaciones pasan por la inserción incremental
+    for start in range(0, values.size, batch):
+        sketch.update(0, values[start:start + batch])
+    assert sketch.value()[0] == pytest.approx(np.quantile(values, q), abs=0.05)
+
+
+def test_p2_exact_with_few_values():
+    sketch = P2Quantile((2,), 0.5)
+    sketch.update(0, np.array([3.0, 1.0]))
+    sketch.update(1, np.array([4.0]))
+    sketch.update(1, np.array([2.0, 9.0]))
+    np.testing.assert_allclose(sketch.value(), [2.0, 4.0])
@@ -0,0 +1,36 @@
+"""
+Los hiperparámetros vectoriales (barridos) sólo se aceptan en las versiones vectorizadas.
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import (DiscountedUCB, EpsilonGreedy, GradientePreferencias, SlidingWindowUCB, Softmax,
+                        ThompsonSampling, UCB2, make_batched)
+
+SWEEPS = [
+    lambda: EpsilonGreedy(5, epsilon=np.array([0.0, 0.1])),
+    lambda: Softmax(5, tau=np.array([0.1, 1.0])),
+    lambda: DiscountedUCB(5, gamma=np.array([0.9, 0.99])),
+    lambda: SlidingWindowUCB(5, window=np.array([10, 100])),
+    lambda: UCB2(5, alpha=np.array([0.1, 0.5])),
+    lambda: GradientePreferencias(5, alpha=np.array([0.1, 0.5])),
+    lambda: ThompsonSampling(5, prior_alpha=np.array([1.0, 2.0])),
+]
+
+
+@pytest.mark.parametrize('make_algorithm', SWEEPS)
+def test_scalar_calls_reject_sweeps(make_algorithm):
+    algorithm = make_algorithm()
+    with pytest.raises(AssertionError, match='barrido'):
+        # Los brazos sin probar no dependen del hiperparámetro: se prueban todos antes de elegir
+        for arm in range(algorithm.k):
+            algorithm.update(arm, 1.0)
+        algorithm.select_arm()
+        algorithm.update(algorithm.select_arm(), 1.0)
+
+
+@pytest.mark.parametrize('make_algorithm', SWEEPS)
+def test_sweeps_run_batched(make_algorithm):
+    batched = make_batched(make_algorithm(), 3, np.random.default_rng(0))
+    assert batched.select_arms().shape == (6,)
@@ -0,0 +1,32 @@
+"""
+Las posteriores Beta de Thompson Sampling rechazan recompensas fuera de [0, trials].
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import ThompsonSampling
+from arms import ArmBinomial, ArmNormal, Bandit
+from simulation import run_experiment
+
+
+def test_beta_family_rejects_rewards_out_of_range():
+    algorithm = ThompsonSampling(3)
+    with pytest.raises(AssertionError, match="family='normal'"):
+        algorithm.update(0, 2.5)
+    with pytest.raises(AssertionError, match="family='normal'"):
+        algorithm.update_batch(np.array([0, 1]), np.array([1.0, -0.5]))
+    # Una actualización rechazada no deja el estado a medias
+    np.testing.assert_array_equal(algorithm.counts, [0, 0, 0])
+
+
+def test_default_family_on_normal_arms_fails_clearly():
+    bandit = Bandit(ArmNormal.generate_arms(4, rng=np.random.default_rng(0)))
+    with pytest.raises(AssertionError, match="family='normal'"):
+        run_experiment(bandit, [ThompsonSampling(4)], 50, 4, seed=1)
+    run_experiment(bandit, [ThompsonSampling(4, family='normal')], 50, 4, seed=1)
+
+
+def test_binomial_rewards_up_to_trials_are_accepted():
+    bandit = Bandit(ArmBinomial.generate_arms(4, n=5, rng=np.random.default_rng(0)))
+    run_experiment(bandit, [ThompsonSampling(4, family='binomial', trials=5)], 50, 4, seed=1)